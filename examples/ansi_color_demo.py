@@ -5,72 +5,90 @@
 Sample using ANSI escape sequences directly to display WARNING level with black text on yellow background
 """
 
+import atexit
+import functools
+import io
 import logging
 import os
 import sys
 
 # Definition of ANSI escape sequences
-class Colors:
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    
-    # Foreground colors (text colors)
-    BLACK = "\033[30m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
-    
-    # Background colors
-    BG_BLACK = "\033[40m"
-    BG_RED = "\033[41m"
-    BG_GREEN = "\033[42m"
-    BG_YELLOW = "\033[43m"
-    BG_BLUE = "\033[44m"
-    BG_MAGENTA = "\033[45m"
-    BG_CYAN = "\033[46m"
-    BG_WHITE = "\033[47m"
-    
-    # Bright colors (foreground)
-    BRIGHT_BLACK = "\033[90m"
-    BRIGHT_RED = "\033[91m"
-    BRIGHT_GREEN = "\033[92m"
-    BRIGHT_YELLOW = "\033[93m"
-    BRIGHT_BLUE = "\033[94m"
-    BRIGHT_MAGENTA = "\033[95m"
-    BRIGHT_CYAN = "\033[96m"
-    BRIGHT_WHITE = "\033[97m"
-    
-    # Bright colors (background)
-    BG_BRIGHT_BLACK = "\033[100m"
-    BG_BRIGHT_RED = "\033[101m"
-    BG_BRIGHT_GREEN = "\033[102m"
-    BG_BRIGHT_YELLOW = "\033[103m"
-    BG_BRIGHT_BLUE = "\033[104m"
-    BG_BRIGHT_MAGENTA = "\033[105m"
-    BG_BRIGHT_CYAN = "\033[106m"
-    BG_BRIGHT_WHITE = "\033[107m"
+# レベルごとのフォーマット文字列はリテラル1つで書き、コンパイル時に1つの文字列定数にする
+_LEVEL_FMT = {
+    # blue
+    logging.DEBUG: "\033[34m%(asctime)s DEBUG | %(filename)s: %(lineno)d | %(message)s\033[0m",
+    # white
+    logging.INFO: "\033[37m%(asctime)s INFO  | %(filename)s: %(lineno)d | %(message)s\033[0m",
+    # black text on yellow background
+    logging.WARNING: "\033[30m\033[43m%(asctime)s WARN  | %(filename)s: %(lineno)d | %(message)s\033[0m",
+    # black text on red background
+    logging.ERROR: "\033[30m\033[41m%(asctime)s ERROR | %(filename)s: %(lineno)d | %(message)s\033[0m",
+    # black text on bright red background, bold
+    logging.CRITICAL: "\033[30m\033[101m\033[1m%(asctime)s CRITI | %(filename)s: %(lineno)d | %(message)s\033[0m",
+}
+# 色なし（ファイルへのリダイレクト時やNO_COLOR設定時）
+_PLAIN_FMT = {
+    logging.DEBUG: "%(asctime)s DEBUG | %(filename)s: %(lineno)d | %(message)s",
+    logging.INFO: "%(asctime)s INFO  | %(filename)s: %(lineno)d | %(message)s",
+    logging.WARNING: "%(asctime)s WARN  | %(filename)s: %(lineno)d | %(message)s",
+    logging.ERROR: "%(asctime)s ERROR | %(filename)s: %(lineno)d | %(message)s",
+    logging.CRITICAL: "%(asctime)s CRITI | %(filename)s: %(lineno)d | %(message)s",
+}
+
+@functools.lru_cache(maxsize=16)
+def _get_level_formatter(levelno, use_color, datefmt=None):
+    """Return a Formatter for the level, shared by all CustomColorFormatter instances"""
+    level_formats = _LEVEL_FMT if use_color else _PLAIN_FMT
+    return logging.Formatter(level_formats[levelno], datefmt)
+
 
 # カスタムフォーマッター
 class CustomColorFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None):
         super().__init__(fmt, datefmt)
-        self.formats = {
-            logging.DEBUG: Colors.BLUE + "%(asctime)s DEBUG | %(filename)s: %(lineno)d | %(message)s" + Colors.RESET,
-            logging.INFO: Colors.WHITE + "%(asctime)s INFO  | %(filename)s: %(lineno)d | %(message)s" + Colors.RESET,
-            logging.WARNING: Colors.BLACK + Colors.BG_YELLOW + "%(asctime)s WARN  | %(filename)s: %(lineno)d | %(message)s" + Colors.RESET,
-            logging.ERROR: Colors.BLACK + Colors.BG_RED + "%(asctime)s ERROR | %(filename)s: %(lineno)d | %(message)s" + Colors.RESET,
-            logging.CRITICAL: Colors.BLACK + Colors.BG_BRIGHT_RED + Colors.BOLD + "%(asctime)s CRITI | %(filename)s: %(lineno)d | %(message)s" + Colors.RESET,
-        }
-    
+        # stderrが端末でない場合、またはNO_COLOR (https://no-color.org/) が設定されている場合は色を付けない
+        self._color = sys.stderr.isatty() and "NO_COLOR" not in os.environ
+        # レベルごとのFormatterはインスタンス間で共有する
+        # datefmtを指定しないことで "%Y-%m-%d %H:%M:%S,mmm" 形式（default_msec_format）になる
+        self._formatters = {level: _get_level_formatter(level, self._color, datefmt) for level in _LEVEL_FMT}
+        # 表にないレベル（カスタムレベルなど）用
+        self._default_formatter = logging.Formatter(fmt or "%(asctime)s %(levelname)s | %(message)s", datefmt)
+
     def format(self, record):
-        log_format = self.formats.get(record.levelno)
-        formatter = logging.Formatter(log_format, "%Y-%m-%d %H:%M:%S,%f"[:-3])
+        try:
+            formatter = self._formatters[record.levelno]
+        except KeyError:
+            formatter = self._default_formatter
         return formatter.format(record)
 
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that does not flush the stream after every record
+
+    The buffered stream is flushed when it fills up and once more at exit.
+    Note that if the process crashes, the last buffered records (up to the buffer size) are lost.
+    """
+
+    def flush(self):
+        pass
+
+
+def open_buffered_stderr(buffer_size=65536):
+    """Wrap sys.stderr in an explicitly buffered text stream"""
+    if not hasattr(sys.stderr, "buffer"):
+        # sys.stderr has been replaced (e.g. by an IDE); use it as is
+        return sys.stderr
+    stream = io.TextIOWrapper(
+        io.BufferedWriter(sys.stderr.buffer, buffer_size=buffer_size),
+        encoding=sys.stderr.encoding,
+        errors="backslashreplace",
+        line_buffering=False,
+        write_through=False,
+    )
+    atexit.register(stream.flush)
+    return stream
+
+
 def main():
     """Main function to display colors for each log level"""
     # Initialize logger
@@ -81,7 +99,8 @@ def main():
     logger.handlers = []
     
     # Add handler with custom formatter
-    handler = logging.StreamHandler(sys.stderr)
+    # stderrをバッファリングし、レコードごとのwrite()システムコールをまとめる
+    handler = BufferedStreamHandler(open_buffered_stderr())
     handler.setFormatter(CustomColorFormatter())
     logger.addHandler(handler)
     
@@ -10,37 +10,38 @@ import logging
 import logkiss
 import os
 
+# Configuration dictionary for dictConfig
+CONFIG = {
+    "version": 1,
+    "formatters": {
+        "colored": {
+            "class": "logkiss.ColoredFormatter",
+            "format": "%(asctime)s [%(levelname)s] %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logkiss.KissConsoleHandler",
+            "level": "DEBUG",
+            "formatter": "colored"
+        }
+    },
+    "loggers": {
+        "": {
+            "handlers": ["console"],
+            "level": "DEBUG"
+        }
+    }
+}
+
+
 def main():
     """Main function to display colors for each log level"""
     # ロガーの初期化をリセット
     logging.root.handlers = []
     
     # Setup logkiss
-    # Create configuration dictionary for dictConfig
-    config = {
-        "version": 1,
-        "formatters": {
-            "colored": {
-                "class": "logkiss.ColoredFormatter",
-                "format": "%(asctime)s [%(levelname)s] %(message)s"
-            }
-        },
-        "handlers": {
-            "console": {
-                "class": "logkiss.KissConsoleHandler",
-                "level": "DEBUG",
-                "formatter": "colored"
-            }
-        },
-        "loggers": {
-            "": {
-                "handlers": ["console"],
-                "level": "DEBUG"
-            }
-        }
-    }
-    
-    logkiss.dictConfig(config)
+    logkiss.dictConfig(CONFIG)
     logger = logging.getLogger()
     
     # Set to DEBUG level to display all log levels
@@ -60,44 +61,17 @@ def main():
     print("Demo to disable colors by setting the NO_COLOR environment variable:")
     os.environ["NO_COLOR"] = "1"
     
-    # ロガーの初期化をリセット
-    logging.root.handlers = []
-    
-    # Create a new logger (NO_COLOR environment variable will be reflected)
-    # Create configuration dictionary for dictConfig
-    config = {
-        "version": 1,
-        "formatters": {
-            "colored": {
-                "class": "logkiss.ColoredFormatter",
-                "format": "%(asctime)s [%(levelname)s] %(message)s"
-            }
-        },
-        "handlers": {
-            "console": {
-                "class": "logkiss.KissConsoleHandler",
-                "level": "DEBUG",
-                "formatter": "colored"
-            }
-        },
-        "loggers": {
-            "": {
-                "handlers": ["console"],
-                "level": "DEBUG"
-            }
-        }
-    }
-    
-    logkiss.dictConfig(config)
-    no_color_logger = logging.getLogger()
-    no_color_logger.setLevel(logging.DEBUG)
+    # 既存のフォーマッターの色を無効化する（dictConfigで全体を再構築しない）
+    for handler in logger.handlers:
+        if isinstance(handler.formatter, logkiss.ColoredFormatter):
+            handler.formatter.use_color = False
     
     # Output messages at each log level (without colors)
-    no_color_logger.debug("This is a DEBUG level message (no color)")
-    no_color_logger.info("This is an INFO level message (no color)")
-    no_color_logger.warning("This is a WARNING level message (no color)")
-    no_color_logger.error("This is an ERROR level message (no color)")
-    no_color_logger.critical("This is a CRITICAL level message (no color)")
+    logger.debug("This is a DEBUG level message (no color)")
+    logger.info("This is an INFO level message (no color)")
+    logger.warning("This is a WARNING level message (no color)")
+    logger.error("This is an ERROR level message (no color)")
+    logger.critical("This is a CRITICAL level message (no color)")
 
 if __name__ == "__main__":
     main()
@@ -2,9 +2,11 @@ import sys
 from pathlib import Path
 import logkiss
 
+_HERE = Path(__file__).resolve().parent
+
 if __name__ == "__main__":
     # 設定ファイルのパスを取得
-    config_path = Path(__file__).parent / "config_color_test2.yaml"
+    config_path = _HERE / "config_color_test2.yaml"
     # 設定ファイルを適用
     logkiss.setup_from_yaml(config_path)
     logger = logkiss.getLogger("test2")
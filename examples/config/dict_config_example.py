@@ -8,11 +8,17 @@ LOGKISSのconfigモジュールとdictConfig機能を使用するサンプル
 形式でLOGKISSの設定を行う方法を示します。
 """
 
+import os
+import pprint
 import sys
 from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
+_REPO_ROOT = _HERE.parent.parent
+
 # ルートディレクトリをパスに追加して、logkissをインポートできるようにする
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
 
 # dictConfig機能はまだ実装されていない未来の機能なので、
 # 現時点では以下のコードは実際には動作しません
@@ -86,9 +92,9 @@ def main():
 
     print("将来的なdictConfigの使用例:")
     print("=" * 60)
-    print("設定内容:")
-    print_nested_dict(config)
-    print()
+    # 設定内容の表示はLOGKISS_DEMO_VERBOSEが設定されている場合のみ
+    if os.environ.get("LOGKISS_DEMO_VERBOSE"):
+        sys.stdout.write("設定内容:\n" + pprint.pformat(config, width=100) + "\n\n")
 
     # 将来的にはこのようなコードで設定を適用する
     # logkiss.config.dictConfig(config)
@@ -112,17 +118,9 @@ def main():
     try:
         1 / 0
     except ZeroDivisionError:
-        logger.exception("ゼロ除算エラーが発生しました")
-
-
-def print_nested_dict(d, indent=0):
-    """ネストされた辞書を整形して出力する補助関数"""
-    for key, value in d.items():
-        if isinstance(value, dict):
-            print(" " * indent + str(key) + ":")
-            print_nested_dict(value, indent + 2)
-        else:
-            print(" " * indent + str(key) + ": " + str(value))
+        # ERRORが無効な場合はスタックトレースの整形を行わない
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception("ゼロ除算エラーが発生しました")
 
 
 if __name__ == "__main__":
@@ -11,16 +11,19 @@
 import sys
 from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
+_REPO_ROOT = _HERE.parent.parent
+
 # ルートディレクトリをパスに追加して、logkissをインポートできるようにする
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
 
 import logkiss
 
 
 def main():
     # 現在のディレクトリの設定ファイルへのパスを取得
-    current_dir = Path(__file__).parent
-    config_path = current_dir / "reversed_levels.yaml"
+    config_path = _HERE / "reversed_levels.yaml"
 
     print(f"使用する設定ファイル: {config_path}")
     print("=" * 60)
@@ -70,7 +73,9 @@ def main():
         # エラーを意図的に発生させる
         _ = 10 / 0
     except ZeroDivisionError:
-        reversed_logger.exception("ゼロ除算エラーが発生しました")
+        # ERRORが無効な場合はスタックトレースの整形を行わない
+        if reversed_logger.isEnabledFor(logkiss.ERROR):
+            reversed_logger.exception("ゼロ除算エラーが発生しました")
 
 
 if __name__ == "__main__":
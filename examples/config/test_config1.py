@@ -11,8 +11,12 @@ LOGKISSロガーをカスタマイズする方法を示します。
 import sys
 from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
+_REPO_ROOT = _HERE.parent.parent
+
 # ルートディレクトリをパスに追加して、logkissをインポートできるようにする
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
 
 import logkiss
 import logging
@@ -20,8 +24,7 @@ import logging
 
 def main():
     # 現在のディレクトリの設定ファイルへのパスを取得
-    current_dir = Path(__file__).parent
-    config_path = current_dir / "funky_colors.yaml"
+    config_path = _HERE / "funky_colors.yaml"
 
     print(f"使用する設定ファイル: {config_path}")
     print("=" * 60)
@@ -57,7 +60,9 @@ def main():
         # エラーを意図的に発生させる
         _ = 10 / 0
     except ZeroDivisionError:
-        custom_logger.exception("ゼロ除算エラーが発生しました")
+        # ERRORが無効な場合はスタックトレースの整形を行わない
+        if custom_logger.isEnabledFor(logging.ERROR):
+            custom_logger.exception("ゼロ除算エラーが発生しました")
 
     print("\n" + "=" * 60)
     print("異なるフォーマットのテスト:")
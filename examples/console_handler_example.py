@@ -4,9 +4,16 @@ Sample of using logkiss's KissConsoleHandler additionally in a situation where e
 
 This sample demonstrates how to output logs to the console
 by combining the standard logging module and logkiss.
+
+The "console_example" logger only puts records on a queue (QueueHandler);
+a QueueListener thread formats them and writes them with KissConsoleHandler.
+This is the recommended pattern when logging throughput matters, because
+coloring and writing no longer happen on the calling thread.
 """
 
 import logging
+import logging.handlers
+import queue
 import logkiss
 from logkiss.logkiss import KissConsoleHandler
 
@@ -15,12 +22,14 @@ logger = logging.getLogger("console_example")
 logger.setLevel(logging.DEBUG)
 
 # Clear existing handlers (to avoid duplicate output)
-for handler in logger.handlers[:]:
-    logger.removeHandler(handler)
+logger.handlers.clear()
 
-# logkiss の KissConsoleHandler を使用
+# logkiss の KissConsoleHandler をバックグラウンドスレッドで使用
+log_queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
 kiss_handler = KissConsoleHandler()
-logger.addHandler(kiss_handler)
+listener = logging.handlers.QueueListener(log_queue, kiss_handler)
+listener.start()
 
 # ログ出力
 logger.debug("This is a debug message")
@@ -30,16 +39,23 @@ logger.error("This is an error message")
 logger.critical("This is a critical error message")
 
 # Output structured log
-logger.info("Example of structured log", extra={"user_id": 12345, "action": "login", "status": "success", "ip_address": "192.168.1.1"})
+# extraの辞書はレベルが無効な場合でも作られてしまうため、isEnabledFor()で囲んでおく
+# (Python Logging HOWTO "Optimization" を参照)
+if logger.isEnabledFor(logging.INFO):
+    logger.info("Example of structured log", extra={"user_id": 12345, "action": "login", "status": "success", "ip_address": "192.168.1.1"})
 
 # Output nested structured log
-logger.warning(
-    "Example of complex structured log",
-    extra={
-        "request": {"method": "POST", "path": "/api/users", "headers": {"content-type": "application/json", "user-agent": "Mozilla/5.0"}},
-        "response": {"status_code": 400, "body": {"error": "Invalid input", "details": ["Username is required", "Email is invalid"]}},
-    },
-)
+if logger.isEnabledFor(logging.WARNING):
+    logger.warning(
+        "Example of complex structured log",
+        extra={
+            "request": {"method": "POST", "path": "/api/users", "headers": {"content-type": "application/json", "user-agent": "Mozilla/5.0"}},
+            "response": {"status_code": 400, "body": {"error": "Invalid input", "details": ["Username is required", "Email is invalid"]}},
+        },
+    )
+
+# キューに残っているログを出力してから次の例へ進む
+listener.stop()
 
 print("\n--- Example of using root logger ---")
 
@@ -48,12 +64,10 @@ root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
 
 # すべてのハンドラーをクリア
-for handler in root_logger.handlers[:]:
-    root_logger.removeHandler(handler)
+root_logger.handlers.clear()
 
 # Clear all handlers (to avoid duplicate output)
-for handler in logger.handlers[:]:
-    logger.removeHandler(handler)
+logger.handlers.clear()
 
 # logkiss の KissConsoleHandler を使用
 root_kiss_handler = KissConsoleHandler()
@@ -16,8 +16,7 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)  # Set log level to INFO to see all messages
 
 # Clear existing handlers to avoid duplicates
-for handler in logger.handlers[:]:
-    logger.removeHandler(handler)
+logging.clear_handlers(logger)
 
 # Create a formatter with color disabled
 formatter = logging.ColoredFormatter(use_color=False)
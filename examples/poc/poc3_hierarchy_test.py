@@ -59,8 +59,7 @@ logkiss_logger.warning("Logkiss: [2] This is from logkiss logger")
 print("\n3. ルートロガーの設定を変更する場合(階層は自動的に保持):")
 # ルートロガーのハンドラーをカスタマイズ
 root_logger = logging.getLogger()
-for handler in root_logger.handlers[:]:  # 既存のハンドラーを削除
-    root_logger.removeHandler(handler)
+logkiss.clear_handlers(root_logger)  # 既存のハンドラーを削除
 # 新しいハンドラーを追加
 handler = logging.StreamHandler()
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -79,8 +78,7 @@ logkiss_logger.warning("Logkiss: [3] After replacing root logger")
 print("\n4. ロガーの設定をリセットした後:")
 # ルートロガーのハンドラーをリセット
 root_logger = logging.getLogger()
-for handler in root_logger.handlers[:]:  # 既存のハンドラーを削除
-    root_logger.removeHandler(handler)
+logkiss.clear_handlers(root_logger)  # 既存のハンドラーを削除
 # 新しいデフォルトハンドラーを設定
 logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
 if HAS_LOGGING_TREE:
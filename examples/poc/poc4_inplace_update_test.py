@@ -58,8 +58,7 @@ kiss_logger.warning("KISS: logkissロガーからのメッセージ")
 print("\n3. ルートロガーの設定を変更した後:")
 # ルートロガーのハンドラーをカスタマイズ
 root_logger = logging.getLogger()
-for handler in root_logger.handlers[:]:  # 既存のハンドラーを削除
-    root_logger.removeHandler(handler)
+logkiss.clear_handlers(root_logger)  # 既存のハンドラーを削除
 # 新しいハンドラーを追加
 handler = logging.StreamHandler()
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -83,8 +82,7 @@ except Exception:
 print("\n4. ロガーの設定をリセットした後:")
 # ルートロガーのハンドラーをリセット
 root_logger = logging.getLogger()
-for handler in root_logger.handlers[:]:  # 既存のハンドラーを削除
-    root_logger.removeHandler(handler)
+logkiss.clear_handlers(root_logger)  # 既存のハンドラーを削除
 # 新しいデフォルトハンドラーを設定
 logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
 if HAS_LOGGING_TREE:
@@ -11,13 +11,11 @@ SPDX-License-Identifier: MIT
 import json
 import os
 import socket
-import uuid
-import hashlib
+import secrets
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import boto3
-
 # Get AWS settings from environment variables
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-1")
 
@@ -25,12 +23,49 @@ AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-1")
 import logkiss
 from logkiss.handlers import AWSCloudWatchHandler
 
+# A single CloudWatch Logs client shared by the handler and the cleanup
+# (creating a client loads the service model, which is slow)
+_LOGS_CLIENT = None
+
+
+def _get_logs_client():
+    """Return the shared CloudWatch Logs client"""
+    global _LOGS_CLIENT
+    if _LOGS_CLIENT is None:
+        # boto3 (and botocore's service models) are loaded only when a client is needed
+        import boto3
+
+        _LOGS_CLIENT = boto3.client("logs", region_name=AWS_REGION)
+    return _LOGS_CLIENT
+
+
+# Console formatter, created once at import time
+# (FastFormatter reuses the formatted timestamp for records in the same second)
+_CONSOLE_FORMATTER = logkiss.FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+# Structured fields for the login failure record, built once
+# (logging copies extra into the LogRecord and does not modify the dict, so it can be shared)
+_LOGIN_FAILURE_EXTRA = {"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3}
+
+
+class _ContextAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that adds a fixed context to every record
+
+    The context dict is built once and shared. A per-call extra is merged with it
+    (logging.LoggerAdapter replaces it before Python 3.13).
+    """
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 
 # Generate unique log group name (for testing)
-def generate_test_log_group_name():
-    """Generate a unique log group name for testing (using short hash value)"""
-    timestamp = datetime.now().strftime("%Y%m%d")
-    unique_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()[:12]
+def generate_test_log_group_name(now=None):
+    """Generate a unique log group name for testing (using a short random hex string)"""
+    timestamp = (now or datetime.now()).strftime("%Y%m%d")
+    unique_id = secrets.token_hex(6)
     return f"logkiss-test-{timestamp}-{unique_id}"
 
 
@@ -40,31 +75,24 @@ CLEAN_UP = True
 
 def main():
     """Main function"""
-    # Import necessary modules
-    import time
-    import logging
-    from logkiss import getLogger
-    from logkiss.handlers import AWSCloudWatchHandler
-
-    # Set log group and stream names
-    log_group_name = generate_test_log_group_name()
-    log_stream_name = f"sample-{datetime.now().strftime('%H%M%S')}"
+    # Set log group and stream names (built from the same instant)
+    now = datetime.now()
+    log_group_name = generate_test_log_group_name(now)
+    log_stream_name = f"sample-{now.strftime('%H%M%S')}"
     print(f"Log group name: {log_group_name}")
     print(f"Log stream name: {log_stream_name}")
 
     # Configure logger
-    logger = getLogger("aws_sample")
+    logger = logkiss.getLogger("aws_sample")
     logger.setLevel(logging.DEBUG)
 
     # Clear existing handlers (to avoid duplicate output)
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logkiss.clear_handlers(logger, close=False)
 
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # Add AWSCloudWatchHandler
@@ -73,6 +101,7 @@ def main():
             log_group_name=log_group_name,
             log_stream_name=log_stream_name,
             region_name=AWS_REGION,
+            client=_get_logs_client(),
             batch_size=10,  # Set small batch size (for sample)
             flush_interval=2.0,  # Set short flush interval (for sample)
         )
@@ -83,28 +112,26 @@ def main():
         print("Please install the boto3 package: pip install 'logkiss[cloud]'")
         return
 
+    # Static context (application name and host) is attached by the adapter
+    app_logger = _ContextAdapter(logger, {"app": "aws_sample", "host": socket.gethostname()})
+
     # Output logs
     print("\n=== Starting log output ===")
-    logger.info("Starting AWS CloudWatch Logs sample")
-    logger.debug("This is a debug message")
+    app_logger.info("Starting AWS CloudWatch Logs sample")
+    app_logger.debug("This is a debug message")
 
     # Output structured log
-    logger.warning(
-        "User failed to login", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": time.time()}
-    )
+    app_logger.warning("User failed to login", extra=_LOGIN_FAILURE_EXTRA)
 
     # Output error log
     try:
         result = 10 / 0
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}", extra={"error_type": type(e).__name__, "timestamp": time.time()})
-
-    # Wait for the batch to be flushed
-    print("Sending logs to CloudWatch Logs...")
-    time.sleep(3)
+        app_logger.error("An error occurred: %s", e, extra={"error_type": type(e).__name__})
 
     # Explicitly close the handler
-    print("Closing handler...")
+    # (records queued by the handler are sent in a single PutLogEvents batch)
+    print("Sending logs to CloudWatch Logs and closing handler...")
     aws_handler.close()
 
     # Display how to check logs
@@ -121,9 +148,7 @@ def main():
         print("\n=== Cleanup ===")
         print(f"Deleting log group '{log_group_name}'...")
         try:
-            import boto3
-
-            logs_client = boto3.client("logs", region_name=AWS_REGION)
+            logs_client = _get_logs_client()
 
             # Open CloudWatch Logs console
             import webbrowser
@@ -132,15 +157,13 @@ def main():
             # URL to directly access the specific log group
             console_url = f"https://{region}.console.aws.amazon.com/cloudwatch/home?region={region}#logsV2:log-groups/log-group/{log_group_name}"
             print(f"Opening CloudWatch Logs console: {console_url}")
-            webbrowser.open(console_url)
-
-            # Wait a bit before deleting the log group (wait for browser to open)
-            import time
-
-            time.sleep(2)
 
-            # Delete log group
-            logs_client.delete_log_group(logGroupName=log_group_name)
+            # Open the browser and delete the log group at the same time
+            # (the deletion does not depend on the browser, so there is no need to wait for it)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(webbrowser.open, console_url)
+                delete_future = executor.submit(logs_client.delete_log_group, logGroupName=log_group_name)
+            delete_future.result()
             print("Log group deleted")
         except Exception as e:
             print(f"Error occurred during cleanup: {e}")
@@ -11,9 +11,8 @@ SPDX-License-Identifier: MIT
 import json
 import os
 import socket
-import uuid
-import hashlib
-import time
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # 環境変数から AWS の設定を取得
@@ -23,12 +22,48 @@ AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-1")
 import logkiss
 from logkiss.handlers import AWSCloudWatchHandler
 
+# CloudWatch Logsクライアントは1つだけ作成し、ハンドラーとクリーンアップで共有する
+# （クライアントの作成はサービスモデルの読み込みを伴い時間がかかるため）
+_LOGS_CLIENT = None
+
+
+def _get_logs_client():
+    """共有のCloudWatch Logsクライアントを返す"""
+    global _LOGS_CLIENT
+    if _LOGS_CLIENT is None:
+        import boto3
+
+        _LOGS_CLIENT = boto3.client("logs", region_name=AWS_REGION)
+    return _LOGS_CLIENT
+
+
+# コンソール用フォーマッターはモジュール読み込み時に1回だけ作成する
+# （FastFormatterは同じ秒のレコードでは整形済みの時刻文字列を再利用する）
+_CONSOLE_FORMATTER = logkiss.FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+# 認証エラーの構造化データはモジュール読み込み時に1回だけ作る
+# （loggingはextraをLogRecordにコピーするだけで辞書を変更しないため、共有できる）
+_LOGIN_FAILURE_EXTRA = {"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3}
+
+
+class _ContextAdapter(logkiss.LoggerAdapter):
+    """すべてのレコードに固定のコンテキストを追加するLoggerAdapter
+
+    コンテキストの辞書は1回だけ作成して共有する。呼び出しごとのextraはコンテキストとマージする
+    （Python 3.13より前のlogging.LoggerAdapterでは置き換えられてしまうため）。
+    """
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 
 # ユニークなロググループ名を生成（テスト用）
-def generate_test_log_group_name():
-    """テスト用の一意のロググループ名を生成（短いハッシュ値を使用）"""
-    timestamp = datetime.now().strftime("%Y%m%d")
-    unique_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()[:12]
+def generate_test_log_group_name(now=None):
+    """テスト用の一意のロググループ名を生成（短いランダムな16進文字列を使用）"""
+    timestamp = (now or datetime.now()).strftime("%Y%m%d")
+    unique_id = secrets.token_hex(6)
     return f"logkiss-test-{timestamp}-{unique_id}"
 
 
@@ -38,9 +73,10 @@ CLEAN_UP = True
 
 def main():
     """メイン関数"""
-    # ロググループとストリームの名前を設定
-    log_group_name = generate_test_log_group_name()
-    log_stream_name = f"sample-{datetime.now().strftime('%H%M%S')}"
+    # ロググループとストリームの名前を設定（同じ時刻から作る）
+    now = datetime.now()
+    log_group_name = generate_test_log_group_name(now)
+    log_stream_name = f"sample-{now.strftime('%H%M%S')}"
     print(f"ロググループ名: {log_group_name}")
     print(f"ログストリーム名: {log_stream_name}")
 
@@ -49,14 +85,12 @@ def main():
     logger.setLevel(logkiss.logging.DEBUG)
 
     # 既存のハンドラーをクリア（重複出力を避けるため）
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logkiss.clear_handlers(logger, close=False)
 
     # コンソールハンドラーを追加
     console_handler = logkiss.logging.StreamHandler()
     console_handler.setLevel(logkiss.logging.INFO)
-    formatter = logkiss.logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # クラウドハンドラーを追加 - 遅延インポートにより必要になるまでSDKはロードされない
@@ -65,6 +99,7 @@ def main():
             log_group_name=log_group_name,
             log_stream_name=log_stream_name,
             region_name=AWS_REGION,
+            client=_get_logs_client(),
             batch_size=10,  # サンプル用に小さいバッチサイズ
             flush_interval=2.0,  # サンプル用に短いフラッシュ間隔
         )
@@ -76,26 +111,26 @@ def main():
         print("    pip install 'logkiss[cloud]'")
         return
 
+    # アプリケーション名とホスト名は固定のコンテキストとしてアダプターで付加する
+    app_logger = _ContextAdapter(logger, {"app": "aws_sample", "host": socket.gethostname()})
+
     # 基本的なログ出力テスト
     print("\n=== ログ出力テスト開始 ===")
-    logger.info("CloudWatchLogsサンプルを開始します")
-    logger.debug("これはデバッグメッセージです")
+    app_logger.info("CloudWatchLogsサンプルを開始します")
+    app_logger.debug("これはデバッグメッセージです")
 
     # 構造化ログ出力テスト
-    logger.warning("ユーザー認証エラー", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": time.time()})
+    app_logger.warning("ユーザー認証エラー", extra=_LOGIN_FAILURE_EXTRA)
 
     # エラーログ出力テスト
     try:
         result = 10 / 0  # わざと例外を発生させる
     except Exception as e:
-        logger.error("計算エラーが発生しました: %s", str(e), extra={"error_type": type(e).__name__, "timestamp": time.time()})
-
-    # バッチがフラッシュされるのを待つ
-    print("ログをCloudWatchLogsに送信中...")
-    time.sleep(3)
+        app_logger.error("計算エラーが発生しました: %s", e, extra={"error_type": type(e).__name__})
 
     # ハンドラーを明示的にクローズ
-    print("ハンドラーをクローズします...")
+    # （キューにたまっているログは1回のPutLogEventsでまとめて送信される）
+    print("ログをCloudWatchLogsに送信し、ハンドラーをクローズします...")
     aws_handler.close()
 
     # ログの確認方法を表示
@@ -112,9 +147,7 @@ def main():
         print("\n=== クリーンアップ ===")
         print(f"ロググループ「{log_group_name}」を削除します...")
         try:
-            import boto3
-
-            logs_client = boto3.client("logs", region_name=AWS_REGION)
+            logs_client = _get_logs_client()
 
             # CloudWatch Logsコンソールを開く
             import webbrowser
@@ -122,13 +155,13 @@ def main():
             region = logs_client.meta.region_name
             console_url = f"https://{region}.console.aws.amazon.com/cloudwatch/home?region={region}#logsV2:log-groups/log-group/{log_group_name}"
             print(f"CloudWatch Logsコンソールを開きます: {console_url}")
-            webbrowser.open(console_url)
-
-            # ブラウザが開くのを待ってからリソースを削除
-            time.sleep(2)
 
-            # ロググループを削除
-            logs_client.delete_log_group(logGroupName=log_group_name)
+            # ブラウザを開く処理とロググループの削除を並行して行う
+            # （削除はブラウザに依存しないため、ブラウザが開くのを待たない）
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(webbrowser.open, console_url)
+                delete_future = executor.submit(logs_client.delete_log_group, logGroupName=log_group_name)
+            delete_future.result()
             print("ロググループを削除しました")
         except Exception as e:
             print(f"クリーンアップ中にエラーが発生しました: {e}")
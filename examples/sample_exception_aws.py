@@ -31,8 +31,9 @@ def configure_logging():
         sys.exit(1)
 
     # ロググループとログストリームの設定
-    log_group_name = f"/logkiss/exception_test_{datetime.now().strftime('%Y%m%d')}"
-    log_stream_name = f"exception_test_{datetime.now().strftime('%H%M%S')}"
+    now = datetime.now()  # 日付と時刻は同じ時点から作る
+    log_group_name = f"/logkiss/exception_test_{now.strftime('%Y%m%d')}"
+    log_stream_name = f"exception_test_{now.strftime('%H%M%S')}"
 
     # AWS CloudWatchハンドラーを追加
     aws_handler = AWSCloudWatchHandler(region_name=region, log_group_name=log_group_name, log_stream_name=log_stream_name)
@@ -42,62 +43,79 @@ def configure_logging():
     return logger, region, log_group_name, log_stream_name
 
 
-def simulate_error():
-    """エラーをシミュレート"""
+# いくつかのネストされた関数呼び出し（スタックトレースを深くするため）
+# 呼び出しのたびに関数オブジェクトを作らないよう、モジュールレベルで定義する
+def _level3():
+    # 0除算エラーを発生させる
+    return 1 / 0
 
-    # いくつかのネストされた関数呼び出し
-    def level1():
-        def level2():
-            def level3():
-                # 0除算エラーを発生させる
-                return 1 / 0
 
-            return level3()
+def _level2():
+    return _level3()
 
-        return level2()
 
-    return level1()
+def _level1():
+    return _level2()
 
 
-def demonstrate_exception_logging(logger):
-    """例外のログ出力方法をデモンストレーション"""
-    print("\n=== 例外のログ出力方法 ===")
+def simulate_error():
+    """エラーをシミュレート"""
+    return _level1()
+
 
+# 例外のログ出力方法（いずれもexceptブロックの中で、捕捉した例外を渡して呼び出す）
+def _log_with_exc_info_true(logger, e):
     # 方法1: exc_info=True を使用
-    try:
-        print("\n方法1: exc_info=True を使用")
-        result = simulate_error()
-    except Exception as e:
-        logger.error("エラーが発生しました: %s", str(e), exc_info=True)
+    logger.error("エラーが発生しました: %s", e, exc_info=True)
 
+
+def _log_with_exception_object(logger, e):
     # 方法2: 例外オブジェクトを直接渡す
-    try:
-        print("\n方法2: 例外オブジェクトを直接渡す")
-        result = simulate_error()
-    except Exception as e:
-        logger.error("エラーが発生しました: %s", str(e), exc_info=e)
+    logger.error("エラーが発生しました: %s", e, exc_info=e)
+
 
+def _log_with_logger_exception(logger, e):
     # 方法3: logger.exception() を使用（常にexc_info=Trueと同じ）
-    try:
-        print("\n方法3: logger.exception() を使用")
-        result = simulate_error()
-    except Exception as e:
-        logger.exception("エラーが発生しました: %s", str(e))
+    logger.exception("エラーが発生しました: %s", e)
+
 
+def _log_with_formatted_traceback(logger, e):
     # 方法4: スタックトレースを手動で取得して出力
-    try:
-        print("\n方法4: スタックトレースを手動で取得")
-        result = simulate_error()
-    except Exception as e:
-        stack_trace = traceback.format_exc()
-        logger.error("エラーが発生しました: %s\n%s", str(e), stack_trace)
+    stack_trace = traceback.format_exc()
+    logger.error("エラーが発生しました: %s\n%s", e, stack_trace)
+
+
+def _log_as_structured_data(logger, e):
+    # 方法5: 構造化ログとして出力（スタックトレースを含む構造化データ）
+    error_fields = {"error_type": type(e).__name__, "error_message": str(e), "stack_trace": traceback.format_exc()}
+    logger.error("エラーが発生しました", extra=error_fields)
+
+
+# (見出し, ログ出力関数)
+EXCEPTION_LOGGING_METHODS = [
+    ("方法1: exc_info=True を使用", _log_with_exc_info_true),
+    ("方法2: 例外オブジェクトを直接渡す", _log_with_exception_object),
+    ("方法3: logger.exception() を使用", _log_with_logger_exception),
+    ("方法4: スタックトレースを手動で取得", _log_with_formatted_traceback),
+    ("方法5: 構造化ログとして出力", _log_as_structured_data),
+]
 
-    # 方法5: 構造化ログとして出力
+
+def demonstrate_exception_logging(logger):
+    """例外のログ出力方法をデモンストレーション"""
+    print("\n=== 例外のログ出力方法 ===")
+
+    # ERRORが無効な場合は、例外の発生やスタックトレースの整形（フレームの走査）も行わない
+    if not logger.isEnabledFor(logkiss.ERROR):
+        return
+
+    # 例外は1回だけ発生させ、同じ例外を各方法で出力する
     try:
-        print("\n方法5: 構造化ログとして出力")
-        result = simulate_error()
+        simulate_error()
     except Exception as e:
-        logger.error("エラーが発生しました", extra={"error_type": type(e).__name__, "error_message": str(e), "stack_trace": traceback.format_exc()})
+        for title, log_exception in EXCEPTION_LOGGING_METHODS:
+            print(f"\n{title}")
+            log_exception(logger, e)
 
 
 def open_aws_console(region, log_group_name, log_stream_name):
@@ -122,11 +140,10 @@ def main():
     # 例外のログ出力方法をデモンストレーション
     demonstrate_exception_logging(logger)
 
-    # ログを確実に送信するために少し待機
-    import time
-
+    # キューにたまっているログをまとめて送信（待機は不要）
     print("\nログを送信中...")
-    time.sleep(3)
+    for handler in logger.handlers:
+        handler.flush()
 
     # AWS CloudWatchコンソールを開く
     open_aws_console(region, log_group_name, log_stream_name)
@@ -6,6 +6,7 @@
 """
 
 import os
+import secrets
 import sys
 import traceback
 import webbrowser
@@ -31,12 +32,13 @@ def configure_logging():
         sys.exit(1)
 
     # ログ名の設定
-    log_name = f"exception_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    now = datetime.now()
+    log_name = f"exception_test_{now.strftime('%Y%m%d_%H%M%S')}"
 
     # GCP Cloud Loggingハンドラーを追加
     try:
         # 一意のログ名を生成
-        log_name = f"logkiss_test_{datetime.now().strftime('%Y%m%d')}_{os.urandom(4).hex()}"
+        log_name = f"logkiss_test_{now.strftime('%Y%m%d')}_{secrets.token_hex(6)}"
 
         # GCP Cloud Loggingハンドラーを作成
         gcp_handler = GCloudLoggingHandler(
@@ -51,68 +53,85 @@ def configure_logging():
         sys.exit(1)
 
 
+# いくつかのネストされた関数呼び出し（スタックトレースを深くするため）
+# 呼び出しのたびに関数オブジェクトを作らないよう、モジュールレベルで定義する
+def _level3():
+    # 0除算エラーを発生させる
+    return 1 / 0
+
+
+def _level2():
+    return _level3()
+
+
+def _level1():
+    return _level2()
+
+
 def simulate_error():
     """エラーをシミュレート"""
+    return _level1()
+
+
+# 例外のログ出力方法（いずれもexceptブロックの中で、捕捉した例外を渡して呼び出す）
+def _log_with_exc_info_true(logger, e):
+    # 方法1: exc_info=True を使用
+    logger.error("(1)エラーが発生しました: %s", e, exc_info=True)
+
 
-    # いくつかのネストされた関数呼び出し
-    def level1():
-        def level2():
-            def level3():
-                # 0除算エラーを発生させる
-                return 1 / 0
+def _log_with_exception_object(logger, e):
+    # 方法2: 例外オブジェクトを直接渡す
+    logger.error("(2)エラーが発生しました: %s", e, exc_info=e)
 
-            return level3()
 
-        return level2()
+def _log_with_logger_exception(logger, e):
+    # 方法3: logger.exception() を使用（常にexc_info=Trueと同じ）
+    logger.exception("(3)エラーが発生しました: %s", e)
 
-    return level1()
+
+def _log_with_formatted_traceback(logger, e):
+    # 方法4: スタックトレースを手動で取得して出力
+    stack_trace = traceback.format_exc()
+    logger.error("(4)エラーが発生しました: %s\n%s", e, stack_trace)
+
+
+def _log_as_structured_data(logger, e):
+    # 方法5: 構造化ログとして出力（スタックトレースを含む構造化データ）
+    error_fields = {"error_type": type(e).__name__, "error_message": str(e), "stack_trace": traceback.format_exc()}
+    logger.error("(5)エラーが発生しました", extra={"json_fields": error_fields})
+
+
+# (見出し, ログ出力関数)
+EXCEPTION_LOGGING_METHODS = [
+    ("方法1: exc_info=True を使用", _log_with_exc_info_true),
+    ("方法2: 例外オブジェクトを直接渡す", _log_with_exception_object),
+    ("方法3: logger.exception() を使用", _log_with_logger_exception),
+    ("方法4: スタックトレースを手動で取得", _log_with_formatted_traceback),
+    ("方法5: 構造化ログとして出力", _log_as_structured_data),
+]
 
 
 def demonstrate_exception_logging(logger):
     """例外のログ出力方法をデモンストレーション"""
     print("\n=== 例外のログ出力方法 ===")
 
-    if True:  # disabled
-
-        # 方法1: exc_info=True を使用
-        try:
-            print("\n方法1: exc_info=True を使用")
-            result = simulate_error()
-        except Exception as e:
-            logger.error("(1)エラーが発生しました: %s", str(e), exc_info=True)
-
-        # 方法2: 例外オブジェクトを直接渡す
-        try:
-            print("\n方法2: 例外オブジェクトを直接渡す")
-            result = simulate_error()
-        except Exception as e:
-            logger.error("(2)エラーが発生しました: %s", str(e), exc_info=e)
-
-        # 方法3: logger.exception() を使用（常にexc_info=Trueと同じ）
-        try:
-            print("\n方法3: logger.exception() を使用")
-            result = simulate_error()
-        except Exception as e:
-            logger.exception("(3)エラーが発生しました: %s", str(e))
-
-        # 方法4: スタックトレースを手動で取得して出力
-        try:
-            print("\n方法4: スタックトレースを手動で取得")
-            result = simulate_error()
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            logger.error("(4)エラーが発生しました: %s\n%s", str(e), stack_trace)
-
-    # 方法5: 構造化ログとして出力
+    # ERRORが無効な場合は、例外の発生やスタックトレースの整形（フレームの走査）も行わない
+    if not logger.isEnabledFor(logkiss.ERROR):
+        return
+
+    # 方法1〜4はLOGKISS_DEMO_ALL=1の場合のみ実行する
+    # （既定では方法5だけを実行し、GCPへのスタックトレース送信を1回に抑える）
+    methods = EXCEPTION_LOGGING_METHODS
+    if os.environ.get("LOGKISS_DEMO_ALL") != "1":
+        methods = methods[-1:]
+
+    # 例外は1回だけ発生させ、同じ例外を各方法で出力する
     try:
-        print("\n方法5: 構造化ログとして出力")
-        result = simulate_error()
+        simulate_error()
     except Exception as e:
-        # スタックトレースを文字列として取得
-        stack_trace = traceback.format_exc()
-        logger.error(
-            "(5)エラーが発生しました", extra={"json_fields": {"error_type": type(e).__name__, "error_message": str(e), "stack_trace": stack_trace}}
-        )
+        for title, log_exception in methods:
+            print(f"\n{title}")
+            log_exception(logger, e)
 
 
 def open_gcp_console(project_id, log_name):
@@ -135,11 +154,10 @@ def main():
     # 例外のログ出力方法をデモンストレーション
     demonstrate_exception_logging(logger)
 
-    # ログを確実に送信するために少し待機
-    import time
-
+    # ログが送信されるまで待つ（固定時間のsleepではなく、送信完了で戻る）
     print("\nログを送信中...")
-    time.sleep(3)
+    for handler in logger.handlers:
+        handler.flush()
 
     # GCP Loggingコンソールを開く
     open_gcp_console(project_id, log_name)
@@ -27,14 +27,13 @@ def main():
     logger.info("これはアプリケーションロガーからの情報メッセージです")
 
     # 既存のロガーのハンドラーを一時的に保存
-    root_handlers = logging.getLogger().handlers[:]
+    root_logger = logging.getLogger()
+    root_handlers = root_logger.handlers[:]
     app_handlers = logger.handlers[:]
 
-    # 既存のロガーからハンドラーを削除
-    for handler in logging.getLogger().handlers[:]:
-        logging.getLogger().removeHandler(handler)
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # 既存のロガーからハンドラーを削除（removeHandlerを1つずつ呼ばずに、リストをまとめてクリア）
+    root_logger.handlers.clear()
+    logger.handlers.clear()
 
     print("\n=== logkiss の KissConsoleHandler を使用 ===")
     # ここで logkiss をインポート
@@ -49,8 +48,9 @@ def main():
     logger.debug("これはKissConsoleHandlerを使ったデバッグメッセージです")
     logger.info("これはKissConsoleHandlerを使った情報メッセージです")
 
-    # 構造化ログを出力
-    logger.warning("構造化ログの例", extra={"user_id": 12345, "action": "login", "status": "failure", "attempts": 3})
+    # 構造化ログを出力（出力されないレベルの場合はextraの辞書も作らない）
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning("構造化ログの例", extra={"user_id": 12345, "action": "login", "status": "failure", "attempts": 3})
 
     print("\n=== ルートロガーにも logkiss の KissConsoleHandler を追加 ===")
     # ルートロガーに KissConsoleHandler を追加
@@ -64,17 +64,10 @@ def main():
 
     # 元のハンドラーを復元
     print("\n=== 元のロガー設定に戻す ===")
-    # 現在のハンドラーを削除
-    for handler in logging.getLogger().handlers[:]:
-        logging.getLogger().removeHandler(handler)
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-
-    # 元のハンドラーを復元
-    for handler in root_handlers:
-        logging.getLogger().addHandler(handler)
-    for handler in app_handlers:
-        logger.addHandler(handler)
+    # 現在のハンドラーを外して、元のハンドラーをまとめて復元
+    # （保存したリストには重複がないため、addHandlerの重複チェックは不要）
+    root_logger.handlers[:] = root_handlers
+    logger.handlers[:] = app_handlers
 
     # 元のロガー設定でログを出力
     logging.info("元の設定に戻したルートロガーからの情報メッセージです")
@@ -2,12 +2,21 @@
 
 """
 
+from logging.handlers import TimedRotatingFileHandler
+
 import logkiss as logging
 
 # Configure logging to file
-logging.basicConfig(filename="example.log", encoding="utf-8", level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# (basicConfig() does nothing here because logkiss already adds a console handler to the root logger,
+#  so the file handler is attached explicitly. delay=True opens example.log only when the first record
+#  is written, and the file is rotated at midnight keeping 7 old files so it does not grow without bound)
+file_handler = TimedRotatingFileHandler("example.log", when="midnight", backupCount=7, delay=True, encoding="utf-8")
+# (FastFormatter reuses the formatted timestamp for records in the same second)
+file_handler.setFormatter(logging.FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
 
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+logger.addHandler(file_handler)
 
 # Output messages at different log levels
 logger.debug("Debug info: Detailed diagnostic message")
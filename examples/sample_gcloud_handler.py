@@ -12,10 +12,12 @@ SPDX-License-Identifier: MIT
 
 import os
 import sys
+import secrets
 import time
+import queue
 import logging
-import traceback
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # logkissモジュールをインポート
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -33,15 +35,20 @@ def simple_example():
         sys.exit(1)
 
     # ログ名を設定（一意の名前を使用）
-    log_name = f"logkiss_test_{datetime.now().strftime('%Y%m%d')}_{os.urandom(4).hex()}"
+    log_name = f"logkiss_test_{datetime.now().strftime('%Y%m%d')}_{secrets.token_hex(6)}"
 
     print(f"Google Cloud Loggingにログを送信します (プロジェクトID: {project_id}, ログ名: {log_name})")
 
     # Google Cloud Loggingの設定
     handler = GCloudLoggingHandler(project_id=project_id, log_name=log_name, labels={"application": "logkiss_sample", "environment": "development"})
 
-    # ハンドラーをルートロガーに追加
-    logging.getLogger().addHandler(handler)
+    # ルートロガーにはQueueHandlerを追加し、GCPハンドラーへの受け渡しはQueueListenerのスレッドで行う
+    # （ログ出力の呼び出し元でGCPハンドラーのemitを実行しない）
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    logging.getLogger().addHandler(queue_handler)
     logging.getLogger().setLevel(logging.DEBUG)
 
     # 各レベルのログを出力
@@ -50,16 +57,22 @@ def simple_example():
     logging.warning("これはWARNINGレベルのログです")
     logging.error("これはERRORレベルのログです")
 
-    # 構造化ログの出力
-    logging.info("構造化ログの例", extra={"user_id": "12345", "action": "login", "timestamp": time.time()})
+    # 構造化ログの出力（出力されないレベルの場合はextraの辞書やtime.time()の呼び出しも行わない）
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("構造化ログの例", extra={"user_id": "12345", "action": "login", "timestamp": time.time()})
 
     # 例外ログの出力
     try:
         result = 10 / 0
     except Exception as e:
-        logging.error(
-            f"エラーが発生しました: {str(e)}", extra={"error_type": type(e).__name__, "error_message": str(e), "stack_trace": traceback.format_exc()}
-        )
+        if logging.getLogger().isEnabledFor(logging.ERROR):
+            # スタックトレースはexc_info=Trueで渡し、ハンドラーが実際に出力する時だけ整形させる
+            logging.error("エラーが発生しました: %s", e, exc_info=True, extra={"error_type": type(e).__name__, "error_message": str(e)})
+
+    # キューに残ったレコードをハンドラーに渡し切ってから、送信完了を待つ
+    logging.getLogger().removeHandler(queue_handler)
+    listener.stop()
+    handler.flush()
 
     print("ログをGoogle Cloud Loggingに送信しました")
     print(f"Google Cloud Loggingコンソールで確認できます: https://console.cloud.google.com/logs/query?project={project_id}")
@@ -75,12 +88,12 @@ def setup_logging_example():
         sys.exit(1)
 
     # ログ名を設定（一意の名前を使用）
-    log_name = f"logkiss_setup_{datetime.now().strftime('%Y%m%d')}_{os.urandom(4).hex()}"
+    log_name = f"logkiss_setup_{datetime.now().strftime('%Y%m%d')}_{secrets.token_hex(6)}"
 
     print(f"Google Cloud Loggingにログを送信します (プロジェクトID: {project_id}, ログ名: {log_name})")
 
     # setup_logging関数を使用してロギングを設定
-    setup_gcp_logging(
+    handler = setup_gcp_logging(
         project_id=project_id,
         log_name=log_name,
         labels={"application": "logkiss_setup_sample", "environment": "development"},
@@ -94,8 +107,14 @@ def setup_logging_example():
     logging.warning("これはWARNINGレベルのログです (setup_logging)")
     logging.error("これはERRORレベルのログです (setup_logging)")
 
-    # 構造化ログの出力
-    logging.info("構造化ログの例 (setup_logging)", extra={"user_id": "67890", "action": "logout", "timestamp": time.time()})
+    # 構造化ログの出力（出力されないレベルの場合はextraの辞書やtime.time()の呼び出しも行わない）
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("構造化ログの例 (setup_logging)", extra={"user_id": "67890", "action": "logout", "timestamp": time.time()})
+
+    # 送信完了を待ってからハンドラーを閉じる（固定時間のsleepは不要）
+    handler.flush()
+    logging.getLogger().removeHandler(handler)
+    handler.close()
 
     print("ログをGoogle Cloud Loggingに送信しました")
     print(f"Google Cloud Loggingコンソールで確認できます: https://console.cloud.google.com/logs/query?project={project_id}")
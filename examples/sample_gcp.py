@@ -8,12 +8,14 @@ Copyright (c) 2025 Taka Suzuki
 SPDX-License-Identifier: MIT
 """
 
+import argparse
 import os
-import uuid
+import queue
+import secrets
+import time
 from datetime import datetime
 import logging
-import hashlib
-from google.cloud import logging as google_logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Get GCP settings from environment variables
 GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
@@ -25,40 +27,36 @@ from logkiss.handler_gcp import GCloudLoggingHandler
 
 # Generate unique log name (for testing)
 def generate_test_log_name():
-    """Generate a unique log name for testing (using short hash value)"""
+    """Generate a unique log name for testing (using a short random hex string)"""
     timestamp = datetime.now().strftime("%Y%m%d")
-    unique_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()[:12]
+    unique_id = secrets.token_hex(6)
     return f"logkiss_test_{timestamp}_{unique_id}"
 
 
+# Console formatter, created once and shared by every run
+_CONSOLE_FORMATTER = logkiss.FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
 # Cleanup flag (whether to delete resources after testing)
 CLEAN_UP = False  # True
 
 
-def main():
+def main(open_console=False):
     """Main function"""
-    # Import necessary modules
-    import time
-    import logging
-    from logkiss import getLogger
-
     # Set log name
     log_name = generate_test_log_name()
     print(f"Log name: {log_name}")
 
     # Configure logger
-    logger = getLogger("gcp_sample")
+    logger = logkiss.getLogger("gcp_sample")
     logger.setLevel(logging.DEBUG)
 
     # Clear existing handlers (to avoid duplicate output)
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logkiss.clear_handlers(logger, close=False)
 
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # Add GCloudLoggingHandler
@@ -66,42 +64,56 @@ def main():
         gcp_handler = GCloudLoggingHandler(
             project_id=GCP_PROJECT_ID,
             log_name=log_name,
+            # Send up to 100 entries per write request, waiting at most 0.2 seconds to fill a batch
+            batch_size=100,
+            max_latency=0.2,
         )
-        logger.addHandler(gcp_handler)
+        # The logger only puts records on a queue; a QueueListener thread passes them to the GCP handler
+        # (the calling thread does not run the GCP handler's emit)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, gcp_handler, respect_handler_level=True)
+        listener.start()
         print("Added Google Cloud Logging handler")
     except ImportError as e:
         print(f"Error: {e}")
         print("Please install the google-cloud-logging package: pip install 'logkiss[cloud]'")
         return
 
-    # Output logs
+    # Output logs (sample the timestamp once and share it between the structured logs below)
+    now = time.time()
     print("\n=== Starting log output ===")
     logger.info("Starting Google Cloud Logging sample")
     logger.debug("This is a debug message")
 
-    # Output structured log
-    logger.warning(
-        "User failed to login", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": time.time()}
-    )
+    # Output structured log (skip building the extra dict when WARNING is disabled)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "User failed to login", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": now}
+        )
 
     # Output error log
     try:
         result = 10 / 0
     except Exception as e:
-        logger.error(
-            f"An error occurred: {str(e)}",
-            extra={
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "timestamp": time.time(),
-                "test_field": "This is a test field",
-                "numeric_value": 42,
-            },
-        )
-
-    # バッチがフラッシュされるのを待つ
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "An error occurred: %s",
+                e,
+                extra={
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                    "timestamp": now,
+                    "test_field": "This is a test field",
+                    "numeric_value": 42,
+                },
+            )
+
+    # キューのログが送信されるまで待つ（固定時間のsleepではなく、送信完了で戻る）
+    # （先にリスナーを停止して、キューに残ったレコードをハンドラーに渡し切る）
     print("ログをGoogle Cloud Loggingに送信中...")
-    time.sleep(3)
+    listener.stop()
+    gcp_handler.flush()
 
     # ハンドラーを明示的にクローズ
     print("ハンドラーをクローズしています...")
@@ -120,23 +132,22 @@ def main():
         print("\n=== クリーンアップ ===")
         print(f"ログ「{log_name}」を削除します...")
         try:
+            # Google Cloud SDKにアクセスするのはここでだけ
+            from google.cloud import logging as google_logging
+
             client = google_logging.Client(project=GCP_PROJECT_ID)
 
             # ログエントリを削除するためのフィルタを作成
             filter_str = f'logName="projects/{client.project}/logs/{log_name}"'
             print(f"削除フィルタ: {filter_str}")
 
-            # web consoleを開く
-            import webbrowser
-
-            console_url = f"https://console.cloud.google.com/logs/query;query=resource.type%3D%22global%22%20AND%20logName%3D%22projects%2F{client.project}%2Flogs%2F{log_name}%22?project={client.project}"
-            print(f"ログコンソールを開きます: {console_url}")
-            webbrowser.open(console_url)
-
-            # 少し待ってからログを削除（ブラウザが開くのを待つ）
-            import time
+            # --open-console が指定された場合だけweb consoleを開く（待ち時間は入れない）
+            if open_console:
+                import webbrowser
 
-            time.sleep(2)
+                console_url = f"https://console.cloud.google.com/logs/query;query=resource.type%3D%22global%22%20AND%20logName%3D%22projects%2F{client.project}%2Flogs%2F{log_name}%22?project={client.project}"
+                print(f"ログコンソールを開きます: {console_url}")
+                webbrowser.open(console_url)
 
             # 注意: Google Cloud Loggingには直接ログを削除するAPIがないため、
             # 実際のクリーンアップはGCPコンソールまたはgcloudコマンドで行う必要があります
@@ -151,4 +162,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--open-console", action="store_true", help="open the Cloud Logging console in a browser during cleanup")
+    main(open_console=parser.parse_args().open_console)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Google Cloud Logging Bulk Write Sample
+
+This sample builds a list of log entries and sends them with a single
+write_entries call instead of one request per log record.
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import secrets
+from datetime import datetime
+
+# Get GCP settings from environment variables
+GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
+
+# Number of entries to generate for the demo
+ENTRY_COUNT = 500
+
+# Maximum number of entries per write_entries request
+# （1リクエストあたりの上限は10MBなので、小さなエントリなら1000件程度まとめても問題ない）
+BULK_WRITE_SIZE = 1000
+
+
+def generate_test_log_name():
+    """Generate a unique log name for testing (using a short random hex string)"""
+    timestamp = datetime.now().strftime("%Y%m%d")
+    unique_id = secrets.token_hex(6)
+    return f"logkiss_bulk_{timestamp}_{unique_id}"
+
+
+def build_entries(count):
+    """Build log entries in the Cloud Logging API format"""
+    severities = ("DEBUG", "INFO", "WARNING", "ERROR")
+    return [
+        {
+            "severity": severities[i % len(severities)],
+            "jsonPayload": {"message": "Bulk log entry", "index": i, "source": "logkiss_bulk_sample"},
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    """Main function"""
+    try:
+        from google.cloud import logging as google_logging
+    except ImportError as e:
+        print(f"Error: {e}")
+        print("Please install the google-cloud-logging package: pip install 'logkiss[cloud]'")
+        return
+
+    log_name = generate_test_log_name()
+    print(f"Log name: {log_name}")
+
+    client = google_logging.Client(project=GCP_PROJECT_ID)
+    api = client.logging_api
+
+    # logName/resource/labelsはリクエスト単位で指定し、エントリごとには持たせない
+    logger_name = f"projects/{client.project}/logs/{log_name}"
+    resource = {"type": "global"}
+    labels = {"application": "logkiss_bulk_sample"}
+
+    entries = build_entries(ENTRY_COUNT)
+
+    # BULK_WRITE_SIZE件ごとに1回のwrite_entriesで送信する
+    # （partial_success=Trueなので、一部のエントリが不正でも残りは書き込まれる）
+    requests = 0
+    for start in range(0, len(entries), BULK_WRITE_SIZE):
+        api.write_entries(
+            entries[start : start + BULK_WRITE_SIZE],
+            logger_name=logger_name,
+            resource=resource,
+            labels=labels,
+            partial_success=True,
+        )
+        requests += 1
+
+    print(f"Sent {len(entries)} entries in {requests} write_entries request(s)")
+
+    print("\n=== ログの確認方法 ===")
+    print(f"gcloud logging read 'logName=\"{logger_name}\"'")
+
+
+if __name__ == "__main__":
+    main()
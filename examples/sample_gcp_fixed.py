@@ -8,10 +8,12 @@ Copyright (c) 2025 Taka Suzuki
 SPDX-License-Identifier: MIT
 """
 
+import argparse
 import os
-import uuid
+import queue
+import secrets
 import time
-import hashlib
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 # 環境変数から GCP の設定を取得
@@ -26,17 +28,20 @@ from logkiss.handler_gcp import GCloudLoggingHandler
 
 # ユニークなログ名を生成（テスト用）
 def generate_test_log_name():
-    """テスト用の一意のログ名を生成（短いハッシュ値を使用）"""
+    """テスト用の一意のログ名を生成（短いランダムな16進文字列を使用）"""
     timestamp = datetime.now().strftime("%Y%m%d")
-    unique_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()[:12]
+    unique_id = secrets.token_hex(6)
     return f"logkiss_test_{timestamp}_{unique_id}"
 
 
+# コンソール用フォーマッター（実行のたびに作り直さず、モジュールで一度だけ作成して共有する）
+_CONSOLE_FORMATTER = logkiss.FastFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
 # クリーンアップフラグ（テスト後にリソースを削除するかどうか）
 CLEAN_UP = False  # True
 
 
-def main():
+def main(open_console=False):
     """メイン関数"""
     # ログ名を設定
     log_name = generate_test_log_name()
@@ -47,20 +52,23 @@ def main():
     logger.setLevel(logkiss.logging.DEBUG)
 
     # 既存のハンドラーをクリア（重複出力を避けるため）
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logkiss.clear_handlers(logger, close=False)
 
     # コンソールハンドラーを追加
     console_handler = logkiss.logging.StreamHandler()
     console_handler.setLevel(logkiss.logging.INFO)
-    formatter = logkiss.logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # クラウドハンドラーを追加 - 遅延インポートにより必要になるまでSDKはロードされない
     try:
         gcp_handler = GCloudLoggingHandler(project_id=GCP_PROJECT_ID, log_name=log_name)
-        logger.addHandler(gcp_handler)
+        # ロガーはキューに入れるだけにし、GCPハンドラーへの受け渡しはQueueListenerのスレッドで行う
+        # （呼び出し元のスレッドでGCPハンドラーのemitを実行しない）
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, gcp_handler, respect_handler_level=True)
+        listener.start()
         print("Cloud Loggingハンドラーを追加しました")
     except ImportError as e:
         print(f"エラー: {e}")
@@ -70,31 +78,37 @@ def main():
 
     # 基本的なログ出力テスト
     print("\n=== ログ出力テスト開始 ===")
+    # 以下の構造化ログで共通に使うタイムスタンプ（呼び出しごとにtime.time()を呼ばない）
+    now = time.time()
     logger.info("Cloud Loggingサンプルを開始します")
     logger.debug("これはデバッグメッセージです")
 
-    # 構造化ログ出力テスト
-    logger.warning("ユーザー認証エラー", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": time.time()})
+    # 構造化ログ出力テスト（出力されないレベルの場合はextraの辞書も作らない）
+    if logger.isEnabledFor(logkiss.WARNING):
+        logger.warning("ユーザー認証エラー", extra={"user_id": 12345, "ip_address": "192.168.1.100", "attempts": 3, "timestamp": now})
 
     # エラーログ出力テスト
     try:
         calculation = 10 / 0  # わざと例外を発生させる
     except Exception as e:
-        logger.error(
-            "計算エラーが発生しました: %s",
-            str(e),
-            extra={
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "timestamp": time.time(),
-                "test_field": "これはテストフィールドです",
-                "numeric_value": 42,
-            },
-        )
-
-    # バッチがフラッシュされるのを待つ
+        if logger.isEnabledFor(logkiss.ERROR):
+            logger.error(
+                "計算エラーが発生しました: %s",
+                e,
+                extra={
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                    "timestamp": now,
+                    "test_field": "これはテストフィールドです",
+                    "numeric_value": 42,
+                },
+            )
+
+    # キューのログが送信されるまで待つ（固定時間のsleepではなく、送信完了で戻る）
+    # （先にリスナーを停止して、キューに残ったレコードをハンドラーに渡し切る）
     print("ログをCloud Loggingに送信中...")
-    time.sleep(3)
+    listener.stop()
+    gcp_handler.flush()
 
     # ハンドラーを明示的にクローズ
     print("ハンドラーをクローズします...")
@@ -122,15 +136,13 @@ def main():
             filter_str = f'logName="projects/{client.project}/logs/{log_name}"'
             print(f"削除フィルタ: {filter_str}")
 
-            # web consoleを開く
-            import webbrowser
-
-            console_url = f"https://console.cloud.google.com/logs/query;query=resource.type%3D%22global%22%20AND%20logName%3D%22projects%2F{client.project}%2Flogs%2F{log_name}%22?project={client.project}"
-            print(f"ログコンソールを開きます: {console_url}")
-            webbrowser.open(console_url)
+            # --open-console が指定された場合だけweb consoleを開く（待ち時間は入れない）
+            if open_console:
+                import webbrowser
 
-            # ブラウザが開くのを待つ
-            time.sleep(2)
+                console_url = f"https://console.cloud.google.com/logs/query;query=resource.type%3D%22global%22%20AND%20logName%3D%22projects%2F{client.project}%2Flogs%2F{log_name}%22?project={client.project}"
+                print(f"ログコンソールを開きます: {console_url}")
+                webbrowser.open(console_url)
 
             # 注意: Google Cloud Loggingには直接ログを削除するAPIがないため、
             # 実際のクリーンアップはGCPコンソールまたはgcloudコマンドで行う必要があります
@@ -145,4 +157,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--open-console", action="store_true", help="open the Cloud Logging console in a browser during cleanup")
+    main(open_console=parser.parse_args().open_console)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Google Cloud Logging High-Throughput Sample
+
+This sample shows GCloudLoggingHandler settings for services that log at a high rate.
+
+The background transport sends up to ``batch_size`` entries per write request and waits
+up to ``max_latency`` seconds to fill a batch. Larger values mean far fewer write requests,
+but entries stay in memory longer: if the process crashes before the batch is sent,
+up to ``max_latency`` seconds of logs are lost. Call flush() (or close()) on shutdown.
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import queue
+import secrets
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+import logkiss
+from logkiss.handler_gcp import GCloudLoggingHandler
+
+# Get GCP settings from environment variables
+GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
+
+# Up to 1000 entries per write request, sent at least every 5 seconds
+# （1リクエストの上限は10MBなので、1件あたり数KB程度のエントリを想定した値）
+BATCH_SIZE = 1000
+MAX_LATENCY = 5.0
+
+# Number of records to log for the demo
+RECORD_COUNT = 5000
+
+
+def generate_test_log_name():
+    """Generate a unique log name for testing (using a short random hex string)"""
+    timestamp = datetime.now().strftime("%Y%m%d")
+    unique_id = secrets.token_hex(6)
+    return f"logkiss_highthroughput_{timestamp}_{unique_id}"
+
+
+def main():
+    """Main function"""
+    log_name = generate_test_log_name()
+    print(f"Log name: {log_name}")
+
+    logger = logkiss.getLogger("gcp_highthroughput_sample")
+    logger.setLevel(logkiss.INFO)
+    # Records go only to Cloud Logging, not to the console handler of the root logger
+    logger.propagate = False
+
+    try:
+        gcp_handler = GCloudLoggingHandler(project_id=GCP_PROJECT_ID, log_name=log_name, batch_size=BATCH_SIZE, max_latency=MAX_LATENCY)
+    except ImportError as e:
+        print(f"Error: {e}")
+        print("Please install the google-cloud-logging package: pip install 'logkiss[cloud]'")
+        return
+
+    # The logger only puts records on a queue; a QueueListener thread passes them to the GCP handler
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, gcp_handler, respect_handler_level=True)
+    listener.start()
+
+    for i in range(RECORD_COUNT):
+        logger.info("Processed request %d", i)
+
+    # 停止時は必ずflushする（バッチに残っているエントリを送信し切る）
+    print(f"Sending {RECORD_COUNT} records (batch_size={BATCH_SIZE}, max_latency={MAX_LATENCY})...")
+    listener.stop()
+    gcp_handler.flush()
+    gcp_handler.close()
+    print("Done")
+
+
+if __name__ == "__main__":
+    main()
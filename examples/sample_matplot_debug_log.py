@@ -15,7 +15,10 @@ import matplotlib.pyplot as plt
 import logkiss as logging
 
 # Configure logger
+# KissLogger provides batching() to write several records at once
+logging.setLoggerClass(logging.KissLogger)
 logger = logging.getLogger(__name__)
+logging.setLoggerClass(logging.Logger)
 
 # Suppress matplotlib logs
 plt.set_loglevel("warning")
@@ -28,38 +31,40 @@ def generate_sample_data():
     logger.info("Generating sample data...")
     x = np.linspace(0, 10, 100)
     y = np.sin(x)
-    logger.debug(f"Number of data points: {len(x)}")
+    logger.debug("Number of data points: %d", len(x))
     return x, y
 
 
 def create_plot():
     """Create plot"""
-    logger.info("Creating plot...")
+    # Records logged in this block are written together when it ends
+    with logger.batching():
+        logger.info("Creating plot...")
 
-    try:
-        # Generate data
-        x, y = generate_sample_data()
-
-        # Create plot
-        plt.figure(figsize=(10, 6))
-        plt.plot(x, y, label="sin(x)")
-        plt.title("Sample Plot")
-        plt.xlabel("x")
-        plt.ylabel("y")
-        plt.grid(True)
-        plt.legend()
-
-        # Save plot
-        output_file = "sample_plot.png"
-        plt.savefig(output_file)
-        logger.debug(f"Plot saved to: {output_file}")
-
-        # Clean up
-        plt.close()
+        try:
+            # Generate data
+            x, y = generate_sample_data()
 
-    except Exception as e:
-        logger.error(f"Error occurred while creating plot: {e}")
-        raise
+            # Create plot
+            plt.figure(figsize=(10, 6))
+            plt.plot(x, y, label="sin(x)")
+            plt.title("Sample Plot")
+            plt.xlabel("x")
+            plt.ylabel("y")
+            plt.grid(True)
+            plt.legend()
+
+            # Save plot
+            output_file = "sample_plot.png"
+            plt.savefig(output_file)
+            logger.debug("Plot saved to: %s", output_file)
+
+            # Clean up
+            plt.close()
+
+        except Exception as e:
+            logger.error("Error occurred while creating plot: %s", e)
+            raise
 
 
 def main():
@@ -70,7 +75,7 @@ def main():
         create_plot()
         logger.debug("Example completed successfully")
     except Exception as e:
-        logger.critical(f"Unexpected error occurred: {e}")
+        logger.critical("Unexpected error occurred: %s", e)
         sys.exit(1)
 
 
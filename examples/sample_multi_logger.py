@@ -14,33 +14,50 @@ import logkiss as logging
 # Log file path
 log_file = os.path.join(os.path.dirname(__file__), "both.log")
 
-# Create a console-only logger
-console_logger = logging.getLogger("console")
-for handler in console_logger.handlers[:]:
-    console_logger.removeHandler(handler)
-console_logger.setLevel(logging.DEBUG)
-console_handler = logging.KissConsoleHandler()
-console_logger.addHandler(console_handler)
-console_logger.propagate = False
-
-# Create a logger that outputs to both console and file
-both_logger = logging.getLogger("both")
-for handler in both_logger.handlers[:]:
-    both_logger.removeHandler(handler)
-both_logger.setLevel(logging.DEBUG)
-both_logger.addHandler(logging.KissConsoleHandler())
-
-# 標準のFileHandlerを使用し、ColoredFormatterを設定
-file_handler = logging.FileHandler(log_file)
-formatter = logging.ColoredFormatter(use_color=False)
-file_handler.setFormatter(formatter)
-both_logger.addHandler(file_handler)
-
-both_logger.propagate = False
+# Handlers are attached on first use, not at import time
+_configured = None
+
+
+def _configure_once():
+    """Configure the console-only and console+file loggers once
+
+    Returns:
+        (console_logger, both_logger, file_handler)
+    """
+    global _configured
+    if _configured is not None:
+        return _configured
+
+    # Create a console-only logger
+    console_logger = logging.getLogger("console")
+    logging.clear_handlers(console_logger, close=False)
+    console_logger.setLevel(logging.DEBUG)
+    console_logger.addHandler(logging.KissConsoleHandler())
+    console_logger.propagate = False
+
+    # Create a logger that outputs to both console and file
+    both_logger = logging.getLogger("both")
+    logging.clear_handlers(both_logger, close=False)
+    both_logger.setLevel(logging.DEBUG)
+    both_logger.addHandler(logging.KissConsoleHandler())
+
+    # BufferedKissFileHandlerを使用し、ColoredFormatterを設定
+    # （レコードはメモリにためてまとめて書き込む。ERROR以上はすぐに書き込む。
+    #  delay=Trueでファイルは最初の書き込みまで開かない）
+    file_handler = logging.BufferedKissFileHandler(log_file, delay=True)
+    file_handler.setFormatter(logging.ColoredFormatter(use_color=False))
+    both_logger.addHandler(file_handler)
+
+    both_logger.propagate = False
+
+    _configured = (console_logger, both_logger, file_handler)
+    return _configured
 
 
 def main():
     """Main function"""
+    console_logger, both_logger, file_handler = _configure_once()
+
     print("\n1. Console-only logger:")
     console_logger.debug("Debug message (console only)")
     console_logger.info("Info message (console only)")
@@ -55,6 +72,9 @@ def main():
     both_logger.error("Error message (both)")
     both_logger.critical("Critical error message (both)")
 
+    # Write the buffered records before reading the file
+    file_handler.flush()
+
     print(f"\nLog file created: {log_file}")
     print("File contents:")
     print("-" * 80)
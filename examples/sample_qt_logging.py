@@ -5,7 +5,10 @@ This example shows how to use the QtTextEditHandler to display colored logs in a
 """
 
 import sys
+import functools
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import logkiss
 
 # Check if Qt is available
@@ -15,14 +18,14 @@ if not logkiss.QT_AVAILABLE:
 
 # Import Qt modules - we've already checked that one of them is available via QT_AVAILABLE
 try:
-    from PyQt5.QtWidgets import QApplication, QMainWindow, QTextEdit, QVBoxLayout, QWidget, QPushButton
+    from PyQt5.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QVBoxLayout, QWidget, QPushButton
     from PyQt5.QtGui import QFont
 except ImportError:
     try:
-        from PySide2.QtWidgets import QApplication, QMainWindow, QTextEdit, QVBoxLayout, QWidget, QPushButton
+        from PySide2.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QVBoxLayout, QWidget, QPushButton
         from PySide2.QtGui import QFont
     except ImportError:
-        from PySide6.QtWidgets import QApplication, QMainWindow, QTextEdit, QVBoxLayout, QWidget, QPushButton
+        from PySide6.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QVBoxLayout, QWidget, QPushButton
         from PySide6.QtGui import QFont
 
 
@@ -31,6 +34,9 @@ class LoggingDemo(QMainWindow):
     Demo application showing colored logs in a Qt text widget.
     """
 
+    # Structured data for the "Log Structured Data" button (constant, so built once)
+    _STRUCTURED_EXTRA = {"json_fields": {"user_id": "1234", "action": "button_click", "timestamp": "2025-04-07T09:25:38+09:00"}}
+
     def __init__(self):
         super().__init__()
         self.current_theme = "light"  # Default to light theme
@@ -50,31 +56,24 @@ class LoggingDemo(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         # Create text edit for logs
-        self.log_text_edit = QTextEdit()
+        # (QPlainTextEdit is made for append-only text; keep only the latest 1000 lines)
+        self.log_text_edit = QPlainTextEdit()
+        self.log_text_edit.setMaximumBlockCount(1000)
         self.log_text_edit.setReadOnly(True)
         self.log_text_edit.setFont(QFont("Courier New", 10))
         layout.addWidget(self.log_text_edit)
 
-        # Create buttons for different log levels
-        self.debug_button = QPushButton("Log DEBUG")
-        self.debug_button.clicked.connect(lambda: self.logger.debug("This is a DEBUG message"))
-        layout.addWidget(self.debug_button)
-
-        self.info_button = QPushButton("Log INFO")
-        self.info_button.clicked.connect(lambda: self.logger.info("This is an INFO message"))
-        layout.addWidget(self.info_button)
-
-        self.warning_button = QPushButton("Log WARNING")
-        self.warning_button.clicked.connect(lambda: self.logger.warning("This is a WARNING message"))
-        layout.addWidget(self.warning_button)
-
-        self.error_button = QPushButton("Log ERROR")
-        self.error_button.clicked.connect(lambda: self.logger.error("This is an ERROR message"))
-        layout.addWidget(self.error_button)
-
-        self.critical_button = QPushButton("Log CRITICAL")
-        self.critical_button.clicked.connect(lambda: self.logger.critical("This is a CRITICAL message"))
-        layout.addWidget(self.critical_button)
+        # Create buttons for different log levels (one row per level)
+        for level, text in (
+            (logging.DEBUG, "This is a DEBUG message"),
+            (logging.INFO, "This is an INFO message"),
+            (logging.WARNING, "This is a WARNING message"),
+            (logging.ERROR, "This is an ERROR message"),
+            (logging.CRITICAL, "This is a CRITICAL message"),
+        ):
+            button = QPushButton("Log " + logging.getLevelName(level))
+            button.clicked.connect(functools.partial(self.log_message, level, text))
+            layout.addWidget(button)
 
         # Create button for structured logging
         self.structured_button = QPushButton("Log Structured Data")
@@ -92,20 +91,29 @@ class LoggingDemo(QMainWindow):
         self.logger = logkiss.getLogger("qtdemo")
         self.logger.setLevel(logging.DEBUG)
 
-        # Create custom handler for QTextEdit with theme
-        self.qt_handler = logkiss.QtTextEditHandler(self.log_text_edit, theme=self.current_theme)
+        # Create custom handler for QPlainTextEdit with theme
+        self.qt_handler = logkiss.QtTextEditHandler(self.log_text_edit, theme=self.current_theme, flush_interval=50)
         self.qt_handler.setLevel(logging.DEBUG)
 
         # Remove any existing handlers (to avoid duplicates)
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        logkiss.clear_handlers(self.logger, close=False)
 
-        # Add our custom handler
-        self.logger.addHandler(self.qt_handler)
+        # The logger only puts records on a queue; a QueueListener thread formats them and the
+        # handler's timer writes the collected lines to the widget about 20 times per second
+        self._queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(self._queue))
+        self._listener = QueueListener(self._queue, self.qt_handler, respect_handler_level=True)
+        self._listener.start()
 
         # Log initial message
         self.logger.info("Logging initialized. Click buttons to generate logs.")
 
+    def closeEvent(self, event):
+        """Stop the listener and write the remaining records before the window closes."""
+        self._listener.stop()
+        self.qt_handler.close()
+        super().closeEvent(event)
+
     def toggle_theme(self):
         """Toggle between light and dark themes"""
         if self.current_theme == "light":
@@ -115,21 +123,24 @@ class LoggingDemo(QMainWindow):
             self.current_theme = "light"
             self.theme_button.setText("Switch to Dark Theme")
 
+        # Clear text edit first so the new style sheet is applied to an empty document
+        # (the old lines are not laid out and repainted once more just to be discarded)
+        self.log_text_edit.clear()
+
         # Update handler theme
         self.qt_handler.set_theme(self.current_theme)
 
-        # Clear text edit to show color changes properly
-        self.log_text_edit.clear()
-
         # Log theme change message
-        self.logger.info(f"Theme changed to {self.current_theme}")
+        self.logger.info("Theme changed to %s", self.current_theme)
+
+    def log_message(self, level, text, checked=False):
+        """Log a message at the given level (connected to the level buttons; checked is the clicked() argument)."""
+        self.logger.log(level, text)
 
     def log_structured_data(self):
         """Log a message with structured data."""
-        self.logger.info(
-            "Log message with structured data",
-            extra={"json_fields": {"user_id": "1234", "action": "button_click", "timestamp": "2025-04-07T09:25:38+09:00"}},
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Log message with structured data", extra=self._STRUCTURED_EXTRA)
 
 
 def main():
@@ -8,6 +8,24 @@ import traceback
 import sys
 
 
+def _log_exception_variants(logger):
+    """処理中の例外を3通りの方法でログ出力する（exceptブロック内で呼ぶ）"""
+    # ERRORが無効ならsys.exc_info()やトレースバックの整形も行わない
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    exc_info = sys.exc_info()
+
+    # exc_info=True を使用（ここでは取得済みのタプルを渡す。loggingが再度sys.exc_info()を呼ばない）
+    logger.error("エラーが発生しました (exc_info=True)", exc_info=exc_info)
+
+    # 例外オブジェクトを直接渡す
+    logger.error("エラーが発生しました (exc_info=e)", exc_info=exc_info[1])
+
+    # スタックトレースを文字列として渡す
+    stack_trace = "".join(traceback.format_exception(*exc_info))
+    logger.error("エラーが発生しました (traceback文字列)\n%s", stack_trace)
+
+
 # 標準のロギング
 def test_standard_logging():
     print("\n=== 標準のロギング ===")
@@ -16,16 +34,8 @@ def test_standard_logging():
 
     try:
         1 / 0
-    except Exception as e:
-        # exc_info=True を使用
-        logger.error("エラーが発生しました (exc_info=True)", exc_info=True)
-
-        # 例外オブジェクトを直接渡す
-        logger.error("エラーが発生しました (exc_info=e)", exc_info=e)
-
-        # スタックトレースを文字列として渡す
-        stack_trace = traceback.format_exc()
-        logger.error(f"エラーが発生しました (traceback文字列)\n{stack_trace}")
+    except Exception:
+        _log_exception_variants(logger)
 
 
 # logkissを使用
@@ -38,23 +48,15 @@ def test_logkiss():
 
     try:
         1 / 0
-    except Exception as e:
-        # exc_info=True を使用
-        logger.error("エラーが発生しました (exc_info=True)", exc_info=True)
-
-        # 例外オブジェクトを直接渡す
-        logger.error("エラーが発生しました (exc_info=e)", exc_info=e)
-
-        # スタックトレースを文字列として渡す
-        stack_trace = traceback.format_exc()
-        logger.error(f"エラーが発生しました (traceback文字列)\n{stack_trace}")
+    except Exception:
+        _log_exception_variants(logger)
 
 
 # GCP Cloud Loggingを使用
 def test_gcp_logging():
     print("\n=== GCP Cloud Loggingのテスト ===")
     import logging
-    from logkiss import getLogger
+    from logkiss import clear_handlers, getLogger
     from logkiss.handlers import GCPCloudLoggingHandler
 
     # ロガーの設定
@@ -62,13 +64,14 @@ def test_gcp_logging():
     logger.setLevel(logging.DEBUG)
 
     # 既存のハンドラーをクリア
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    clear_handlers(logger, close=False)
 
     # GCP Cloud Loggingハンドラーを追加
     try:
         gcp_handler = GCPCloudLoggingHandler()
         logger.addHandler(gcp_handler)
+        # ルートロガーのハンドラーには渡さない（このロガーのログはクラウドにだけ送られ、コンソールには出ない）
+        logger.propagate = False
         print("GCP Cloud Logging ハンドラーを追加しました")
     except ImportError as e:
         print(f"エラー: {e}")
@@ -77,16 +80,8 @@ def test_gcp_logging():
 
     try:
         1 / 0
-    except Exception as e:
-        # exc_info=True を使用
-        logger.error("エラーが発生しました (exc_info=True)", exc_info=True)
-
-        # 例外オブジェクトを直接渡す
-        logger.error("エラーが発生しました (exc_info=e)", exc_info=e)
-
-        # スタックトレースを文字列として渡す
-        stack_trace = traceback.format_exc()
-        logger.error(f"エラーが発生しました (traceback文字列)\n{stack_trace}")
+    except Exception:
+        _log_exception_variants(logger)
 
     # ハンドラーをクローズ
     gcp_handler.close()
@@ -96,7 +91,7 @@ def test_gcp_logging():
 def test_aws_logging():
     print("\n=== AWS CloudWatchのテスト ===")
     import logging
-    from logkiss import getLogger
+    from logkiss import clear_handlers, getLogger
     from logkiss.handlers import AWSCloudWatchHandler
 
     # ロガーの設定
@@ -104,13 +99,14 @@ def test_aws_logging():
     logger.setLevel(logging.DEBUG)
 
     # 既存のハンドラーをクリア
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    clear_handlers(logger, close=False)
 
     # AWS CloudWatchハンドラーを追加
     try:
         aws_handler = AWSCloudWatchHandler("logkiss-test-excinfo", "test-stream")
         logger.addHandler(aws_handler)
+        # ルートロガーのハンドラーには渡さない（このロガーのログはクラウドにだけ送られ、コンソールには出ない）
+        logger.propagate = False
         print("AWS CloudWatch ハンドラーを追加しました")
     except ImportError as e:
         print(f"エラー: {e}")
@@ -119,16 +115,8 @@ def test_aws_logging():
 
     try:
         1 / 0
-    except Exception as e:
-        # exc_info=True を使用
-        logger.error("エラーが発生しました (exc_info=True)", exc_info=True)
-
-        # 例外オブジェクトを直接渡す
-        logger.error("エラーが発生しました (exc_info=e)", exc_info=e)
-
-        # スタックトレースを文字列として渡す
-        stack_trace = traceback.format_exc()
-        logger.error(f"エラーが発生しました (traceback文字列)\n{stack_trace}")
+    except Exception:
+        _log_exception_variants(logger)
 
     # ハンドラーをクローズ
     aws_handler.close()
@@ -9,21 +9,18 @@ import logkiss as logging
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
-for handler in logger.handlers[:]:
-    logger.removeHandler(handler)
+logging.clear_handlers(logger, close=False)
 
 print("1. デフォルトでKissConsoleHandlerを使用:")
 logger1 = logging.getLogger("example1")
-for handler in logger1.handlers[:]:
-    logger1.removeHandler(handler)
+logging.clear_handlers(logger1, close=False)
 logger1.addHandler(logging.KissConsoleHandler())
 logger1.propagate = False
 logger1.info("カラフルな出力")
 
 print("\n2. loggingモジュールの代替として使用:")
 logger2 = logging.getLogger("example2")
-for handler in logger2.handlers[:]:
-    logger2.removeHandler(handler)
+logging.clear_handlers(logger2, close=False)
 logger2.addHandler(logging.KissConsoleHandler())
 logger2.propagate = False
 logger2.warning("これもカラフルな出力")
@@ -32,8 +29,7 @@ print("\n3. 通常のConsoleHandlerに切り替え:")
 import logging as std_logging
 
 logger3 = std_logging.getLogger("example3")
-for handler in logger3.handlers[:]:
-    logger3.removeHandler(handler)
+logging.clear_handlers(logger3, close=False)
 handler = std_logging.StreamHandler()
 handler.setFormatter(
     std_logging.Formatter(fmt="%(asctime)s,%(msecs)03d %(levelname)-5s | %(filename)s:%(lineno)3d | %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
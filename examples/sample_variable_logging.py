@@ -6,12 +6,17 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # %-style formatting (traditional way)
+# The arguments are merged into the message only when the record is actually output,
+# so a disabled level costs almost nothing. Prefer this style in log calls.
 logger.warning("%s before you %s", "Look", "leap")
 
 # str.format() style
-logger.info("User {user} performed {action}".format(user="John", action="login"))
+# (the string is built before the call, so check the level first)
+if logger.isEnabledFor(logging.INFO):
+    logger.info("User {user} performed {action}".format(user="John", action="login"))
 
-# f-string style (Python 3.6+)
+# f-string style (Python 3.6+) is also evaluated before the call;
+# pass the values as arguments instead (DEBUG is disabled here, so nothing is formatted)
 user_id = 123
 action = "data update"
-logger.debug(f"User ID {user_id} is attempting {action}")
+logger.debug("User ID %s is attempting %s", user_id, action)
@@ -7,94 +7,18 @@ This example shows how to output colored logs to a Qt text widget.
 """
 
 import sys
+import functools
 import logging
 import logkiss
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTextEdit, QVBoxLayout, QWidget, QPushButton
-from PyQt5.QtGui import QColor, QTextCharFormat, QBrush, QFont
-from PyQt5.QtCore import Qt
 
+# QtTextEditHandlerはlogkissのものを使う（sample_qt_logging.pyと同じ）
+if not logkiss.QT_AVAILABLE:
+    print("Qt modules not available. Please install PyQt5, PySide2, or PySide6 to run this example.")
+    sys.exit(1)
 
-class QtTextEditHandler(logging.Handler):
-    """
-    Custom logging handler that outputs log messages to a QTextEdit widget with colors.
-    Supports light and dark themes.
-    """
-
-    def __init__(self, text_edit, theme="light"):
-        super().__init__()
-        self.text_edit = text_edit
-        self.formatter = logkiss.ColoredFormatter()
-        self.theme = theme
-        self.set_theme(theme)
-
-    def set_theme(self, theme):
-        """
-        Set color theme (light or dark)
-        """
-        self.theme = theme
-        if theme == "light":
-            self.text_edit.setStyleSheet("background-color: white; color: black;")
-            # Colors for light theme (darker colors for better visibility)
-            self.level_colors = {
-                logging.DEBUG: QColor(0, 130, 130),  # dark cyan
-                logging.INFO: QColor(0, 0, 0),  # black
-                logging.WARNING: QColor(180, 90, 0),  # dark orange
-                logging.ERROR: QColor(200, 0, 0),  # dark red
-                logging.CRITICAL: QColor(200, 0, 0),  # dark red (with background)
-            }
-            self.level_backgrounds = {
-                logging.CRITICAL: QColor(255, 210, 210),  # light red background
-            }
-        else:  # dark theme
-            self.text_edit.setStyleSheet("background-color: #2d2d2d; color: #f0f0f0;")
-            # Colors for dark theme (brighter colors)
-            self.level_colors = {
-                logging.DEBUG: QColor(0, 255, 255),  # cyan
-                logging.INFO: QColor(255, 255, 255),  # white
-                logging.WARNING: QColor(255, 255, 0),  # yellow
-                logging.ERROR: QColor(255, 100, 100),  # light red
-                logging.CRITICAL: QColor(255, 100, 100),  # light red (with background)
-            }
-            self.level_backgrounds = {
-                logging.CRITICAL: QColor(100, 0, 0),  # dark red background
-            }
-
-        # Font styles are the same for both themes
-        self.level_styles = {
-            logging.WARNING: QFont.Bold,
-            logging.ERROR: QFont.Bold,
-            logging.CRITICAL: QFont.Bold,
-        }
-
-    def emit(self, record):
-        """
-        Emit a log record to the QTextEdit widget with color formatting.
-        """
-        # Get formatted message
-        msg = self.format(record)
-
-        # Create text format
-        text_format = QTextCharFormat()
-        text_format.setForeground(QBrush(self.level_colors.get(record.levelno, QColor(255, 255, 255))))
-
-        # Apply background color if specified for the level
-        if record.levelno in self.level_backgrounds:
-            text_format.setBackground(QBrush(self.level_backgrounds[record.levelno]))
-
-        # Apply font style if specified for the level
-        if record.levelno in self.level_styles:
-            font = text_format.font()
-            font.setWeight(self.level_styles[record.levelno])
-            text_format.setFont(font)
-
-        # Insert text with formatting
-        cursor = self.text_edit.textCursor()
-        cursor.movePosition(cursor.End)
-        cursor.insertText(msg + "\n", text_format)
-
-        # Auto-scroll to bottom
-        self.text_edit.setTextCursor(cursor)
-        self.text_edit.ensureCursorVisible()
+from logkiss import QtTextEditHandler
+from PyQt5.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QVBoxLayout, QWidget, QPushButton
+from PyQt5.QtGui import QFont
 
 
 class LoggingDemo(QMainWindow):
@@ -102,6 +26,9 @@ class LoggingDemo(QMainWindow):
     Demo application showing colored logs in a Qt text widget.
     """
 
+    # Structured data for the "Log Structured Data" button (constant, so built once)
+    _STRUCTURED_EXTRA = {"json_fields": {"user_id": "1234", "action": "button_click", "timestamp": "2025-04-07T09:25:38+09:00"}}
+
     def __init__(self):
         super().__init__()
         self.current_theme = "light"  # Default to light theme
@@ -121,31 +48,24 @@ class LoggingDemo(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         # Create text edit for logs
-        self.log_text_edit = QTextEdit()
+        # (QPlainTextEdit is made for append-only text; keep only the latest 1000 lines)
+        self.log_text_edit = QPlainTextEdit()
+        self.log_text_edit.setMaximumBlockCount(1000)
         self.log_text_edit.setReadOnly(True)
         self.log_text_edit.setFont(QFont("Courier New", 10))
         layout.addWidget(self.log_text_edit)
 
-        # Create buttons for different log levels
-        self.debug_button = QPushButton("Log DEBUG")
-        self.debug_button.clicked.connect(lambda: self.logger.debug("これはDEBUGメッセージです"))
-        layout.addWidget(self.debug_button)
-
-        self.info_button = QPushButton("Log INFO")
-        self.info_button.clicked.connect(lambda: self.logger.info("これはINFOメッセージです"))
-        layout.addWidget(self.info_button)
-
-        self.warning_button = QPushButton("Log WARNING")
-        self.warning_button.clicked.connect(lambda: self.logger.warning("これはWARNINGメッセージです"))
-        layout.addWidget(self.warning_button)
-
-        self.error_button = QPushButton("Log ERROR")
-        self.error_button.clicked.connect(lambda: self.logger.error("これはERRORメッセージです"))
-        layout.addWidget(self.error_button)
-
-        self.critical_button = QPushButton("Log CRITICAL")
-        self.critical_button.clicked.connect(lambda: self.logger.critical("これはCRITICALメッセージです"))
-        layout.addWidget(self.critical_button)
+        # Create buttons for different log levels (one row per level)
+        for level, text in (
+            (logging.DEBUG, "これはDEBUGメッセージです"),
+            (logging.INFO, "これはINFOメッセージです"),
+            (logging.WARNING, "これはWARNINGメッセージです"),
+            (logging.ERROR, "これはERRORメッセージです"),
+            (logging.CRITICAL, "これはCRITICALメッセージです"),
+        ):
+            button = QPushButton("Log " + logging.getLevelName(level))
+            button.clicked.connect(functools.partial(self.log_message, level, text))
+            layout.addWidget(button)
 
         # Create button for structured logging
         self.structured_button = QPushButton("Log Structured Data")
@@ -163,13 +83,12 @@ class LoggingDemo(QMainWindow):
         self.logger = logkiss.getLogger("qtdemo")
         self.logger.setLevel(logging.DEBUG)
 
-        # Create custom handler for QTextEdit with theme
+        # Create custom handler for QPlainTextEdit with theme
         self.qt_handler = QtTextEditHandler(self.log_text_edit, theme=self.current_theme)
         self.qt_handler.setLevel(logging.DEBUG)
 
         # Remove any existing handlers (to avoid duplicates)
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        logkiss.clear_handlers(self.logger, close=False)
 
         # Add our custom handler
         self.logger.addHandler(self.qt_handler)
@@ -186,21 +105,24 @@ class LoggingDemo(QMainWindow):
             self.current_theme = "light"
             self.theme_button.setText("Switch to Dark Theme")
 
+        # Clear text edit first so the new style sheet is applied to an empty document
+        # (the old lines are not laid out and repainted once more just to be discarded)
+        self.log_text_edit.clear()
+
         # Update handler theme
         self.qt_handler.set_theme(self.current_theme)
 
-        # Clear text edit to show color changes properly
-        self.log_text_edit.clear()
-
         # Log theme change message
-        self.logger.info(f"テーマを {self.current_theme} に変更しました")
+        self.logger.info("テーマを %s に変更しました", self.current_theme)
+
+    def log_message(self, level, text, checked=False):
+        """Log a message at the given level (connected to the level buttons; checked is the clicked() argument)."""
+        self.logger.log(level, text)
 
     def log_structured_data(self):
         """Log a message with structured data."""
-        self.logger.info(
-            "構造化データを含むログメッセージ",
-            extra={"json_fields": {"user_id": "1234", "action": "button_click", "timestamp": "2025-04-07T09:25:38+09:00"}},
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("構造化データを含むログメッセージ", extra=self._STRUCTURED_EXTRA)
 
 
 def main():
@@ -12,6 +12,7 @@ A simple and colorful Python logging library.
 
 import os
 import sys
+import warnings
 import logging
 import logging.handlers
 from pathlib import Path
@@ -24,15 +25,17 @@ DEBUG_MODE = os.environ.get("LOGKISS_DEBUG", "0").lower() in ("1", "true", "yes"
 from .logkiss import (
     KissLogger,
     KissConsoleHandler,
+    BufferedKissFileHandler,
     ColoredFormatter,
+    FastFormatter,
+    clear_handlers,
+    enable_async_logging,
+    reconfigure_path_shortening,
 )
 
 # Import config module
 from .config import dictConfig, fileConfig, yaml_config
 
-# Import base handler only
-from .handlers import BaseHandler
-
 # プロキシクラスと遅延インポート機能
 # クラウドサービス依存関係を実際に使用するまで読み込まない
 
@@ -95,11 +98,37 @@ def setup_gcp_logging(*args, **kwargs):
         ) from exc
 
 
-# Try to import Qt handler if available
-try:
-    from .handler_qt import QtTextEditHandler, QT_AVAILABLE
-except ImportError:
-    QT_AVAILABLE = False
+# 重いサブモジュール（handlers, handler_qt, lint）は最初にアクセスされたときに読み込む (PEP 562)
+# LOGKISS_INIT=eager の場合はインポート時に読み込む
+_LAZY_ATTRS = {
+    "BaseHandler": (".handlers", "BaseHandler"),
+    "QtTextEditHandler": (".handler_qt", "QtTextEditHandler"),
+    "QT_AVAILABLE": (".handler_qt", "QT_AVAILABLE"),
+    "lint_fstring_calls": (".lint", "lint_fstring_calls"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded attributes on first access"""
+    try:
+        module_name, attr_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    except ImportError:
+        if name != "QT_AVAILABLE":
+            raise
+        value = False
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # Import standard logging module functions
 from logging import (
@@ -137,16 +166,22 @@ from logging import (
 getLogger = logging.getLogger
 
 
+# 非推奨の警告はプロセスごとに1回だけ出す（ループ内で呼ばれても警告フィルタを毎回通さない）
+_warned_init_logging = False
+_warned_use_console_handler = False
+
+
 def init_logging(*args, **kwargs):
     """
     [DEPRECATED] For backward compatibility only. Does nothing.
     Use standard logging.basicConfig or logging.getLogger instead.
     """
-    import warnings
-
-    warnings.warn(
-        "logkiss.init_logging() is deprecated. Use standard logging.basicConfig or logging.getLogger instead.", DeprecationWarning, stacklevel=2
-    )
+    global _warned_init_logging
+    if not _warned_init_logging:
+        _warned_init_logging = True
+        warnings.warn(
+            "logkiss.init_logging() is deprecated. Use standard logging.basicConfig or logging.getLogger instead.", DeprecationWarning, stacklevel=2
+        )
     return logging.getLogger()
 
 
@@ -190,6 +225,12 @@ __all__ = [
     "warning",
     # ハンドラー
     "BaseHandler",
+    "BufferedKissFileHandler",
+    "FastFormatter",
+    "clear_handlers",
+    "enable_async_logging",
+    "reconfigure_path_shortening",
+    "lint_fstring_calls",
     "AWSCloudWatchHandler",
     "GCloudLoggingHandler",
     "setup_gcp_logging",
@@ -264,14 +305,15 @@ def use_console_handler(logger: Optional[logging.Logger] = None) -> None:
           logger.handlers.clear()
           logger.addHandler(logging.StreamHandler())
     """
-    import warnings
-
-    warnings.warn(
-        "use_console_handler is deprecated. Use standard logging methods instead: "
-        "logger.handlers.clear() and logger.addHandler(logging.StreamHandler())",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+    global _warned_use_console_handler
+    if not _warned_use_console_handler:
+        _warned_use_console_handler = True
+        warnings.warn(
+            "use_console_handler is deprecated. Use standard logging methods instead: "
+            "logger.handlers.clear() and logger.addHandler(logging.StreamHandler())",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     if logger is None:
         logger = logging.getLogger()
@@ -295,19 +337,50 @@ __version__ = "2.3.1"
 # --- logkiss default handler initialization ---
 # --- logkiss default handler initialization ---
 root_logger = logging.getLogger()
-root_logger.handlers.clear()  # 既存のハンドラを全て除去
-handler = KissConsoleHandler()
+
 
 # --- サブロガーにハンドラがある場合はルートで出力しないフィルタ ---
 class _SkipIfLoggerHasHandlers(logging.Filter):
     def filter(self, record):
-        logger = logging.getLogger(record.name)
+        # getLogger()はモジュールロックを取得し、存在しない名前ならロガーを作るので、
+        # レコードごとにManagerの辞書を直接参照する（ルートやPlaceHolderはNone/ハンドラーなし扱い）
+        logger = root_logger.manager.loggerDict.get(record.name)
         # サブロガーで、ルート以外でハンドラが1つ以上あればルートで出力しない
-        if logger is not root_logger and logger.handlers:
+        if logger is not None and logger is not root_logger and getattr(logger, "handlers", None):
             return False
         return True
-handler.addFilter(_SkipIfLoggerHasHandlers())
 # -------------------------------------------------------------
 
-root_logger.addHandler(handler)
+
+def _root_fingerprint():
+    """Settings that the default root handler depends on"""
+    return (KissConsoleHandler, os.environ.get("LOGKISS_DISABLE_COLOR"), os.environ.get("NO_COLOR"))
+
+
+# 再インポート（importlib.reloadなど）で同じ設定のハンドラーが既に入っていれば作り直さない
+# （ハンドラーとColorManagerを毎回作り直すのを避ける。ルートのハンドラーが変更されていれば従来どおり置き換える）
+_state = getattr(root_logger, "_logkiss_state", None)
+if _state is not None and _state[0] == _root_fingerprint() and tuple(root_logger.handlers) == _state[1]:
+    handler = _state[1][0]
+else:
+    root_logger.handlers.clear()  # 既存のハンドラを全て除去
+    handler = KissConsoleHandler()
+    handler.addFilter(_SkipIfLoggerHasHandlers())
+    root_logger.addHandler(handler)
+    root_logger._logkiss_state = (_root_fingerprint(), (handler,))
 root_logger.propagate = False
+
+# LOGKISS_FAST_RECORDS=1 の場合、LogRecordの生成時にプロセス・スレッド情報を取得しない
+# （プロセス全体の設定なので、他のライブラリの %(process)d / %(threadName)s なども None になる。既定では変更しない）
+if os.environ.get("LOGKISS_FAST_RECORDS", "").lower() in ("1", "true", "yes"):
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logThreads = False
+
+if os.environ.get("LOGKISS_INIT", "lazy").lower() == "eager":
+    for _name in _LAZY_ATTRS:
+        __getattr__(_name)
+
+# LOGKISS_ASYNC=1 の場合はコンソール出力をバックグラウンドスレッドで行う
+if os.environ.get("LOGKISS_ASYNC", "").lower() in ("1", "true", "yes"):
+    enable_async_logging(root_logger)
@@ -12,11 +12,12 @@ SPDX-License-Identifier: MIT
 
 import logging
 import os
-import json
 import time
 from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
+from .handlers import _json_dumps
+
 try:
     import boto3
 
@@ -115,7 +116,7 @@ class AWSCloudWatchHandler(logging.Handler):
         if hasattr(record, "extra") and isinstance(record.extra, dict):
             try:
                 # Convert the message to JSON format
-                log_event["message"] = json.dumps({"message": log_event["message"], "extra": record.extra})
+                log_event["message"] = _json_dumps({"message": log_event["message"], "extra": record.extra})
             except (TypeError, ValueError):
                 # Fallback to string representation if JSON conversion fails
                 log_event["message"] = f"{log_event['message']} {str(record.extra)}"
@@ -46,6 +46,10 @@ class GCloudLoggingHandler(std_logging.Handler):
         resource (google.cloud.logging_v2.resource.Resource, optional): Monitored resource
             to use for logging. If not provided, it will be determined from the environment.
         excluded_loggers (list, optional): List of logger names to exclude from logging.
+        batch_size (int, optional): Maximum number of entries sent in one write request by the
+            background transport. Defaults to the library default (10).
+        max_latency (float, optional): Seconds the background transport waits for more entries
+            before sending a partial batch. Defaults to the library default (0, send immediately).
     """
 
     def __init__(
@@ -56,6 +60,8 @@ class GCloudLoggingHandler(std_logging.Handler):
         labels: Optional[Dict[str, str]] = None,
         resource: Any = None,
         excluded_loggers: Optional[list] = None,
+        batch_size: Optional[int] = None,
+        max_latency: Optional[float] = None,
     ) -> None:
         """Initialize the handler.
 
@@ -66,6 +72,8 @@ class GCloudLoggingHandler(std_logging.Handler):
             labels: Labels to add to all log entries.
             resource: Monitored resource to use for logging.
             excluded_loggers: List of logger names to exclude from logging.
+            batch_size: Maximum number of entries per write request.
+            max_latency: Seconds to wait for more entries before sending a partial batch.
 
         Raises:
             ImportError: If Google Cloud Logging is not available.
@@ -85,11 +93,27 @@ class GCloudLoggingHandler(std_logging.Handler):
         client = logging.Client(project=project_id, credentials=credentials)
 
         # Create the handler with the specified configuration
+        handler_kwargs = {}
+        if batch_size is not None or max_latency is not None:
+            # バックグラウンドスレッドのトランスポートが、batch_size件またはmax_latency秒ごとに
+            # まとめて1回のwrite_entriesで送信する
+            import functools
+
+            from google.cloud.logging_v2.handlers.transports import BackgroundThreadTransport
+
+            transport_kwargs = {}
+            if batch_size is not None:
+                transport_kwargs["batch_size"] = batch_size
+            if max_latency is not None:
+                transport_kwargs["max_latency"] = max_latency
+            handler_kwargs["transport"] = functools.partial(BackgroundThreadTransport, **transport_kwargs)
+
         self.handler = CloudLoggingHandler(
             client,
             name=log_name,
             labels=labels,
             resource=resource,
+            **handler_kwargs,
         )
 
         # Store excluded loggers
@@ -158,6 +182,19 @@ class GCloudLoggingHandler(std_logging.Handler):
 
             print(f"Error in GCloudLoggingHandler.emit: {err}", file=sys.stderr)
 
+    def flush(self) -> None:
+        """Send the queued log entries and wait until they are sent.
+
+        The Google Cloud Logging handler sends entries from a background thread;
+        its flush() blocks until that thread has drained the queue.
+        """
+        try:
+            self.handler.flush()
+        except Exception as err:  # pylint: disable=broad-excep
+            import sys
+
+            print(f"Error flushing GCloudLoggingHandler: {err}", file=sys.stderr)
+
     def close(self) -> None:
         """Close the handler."""
         try:
@@ -6,33 +6,35 @@ This module provides a handler for logging to Qt text widgets.
 The Qt module is optional and only required if you want to use the QtTextEditHandler.
 """
 
+import html
 import logging
 import sys
+import threading
 from typing import Optional, Dict, Any, Union
 
 # Try to import Qt modules
 QT_AVAILABLE = False
 try:
     # Try PyQt5 first
-    from PyQt5.QtWidgets import QTextEdit
+    from PyQt5.QtWidgets import QPlainTextEdit, QTextEdit
     from PyQt5.QtGui import QColor, QTextCharFormat, QBrush, QFont
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import Qt, QTimer
 
     QT_AVAILABLE = True
 except ImportError:
     try:
         # Try PySide2 as fallback
-        from PySide2.QtWidgets import QTextEdit
+        from PySide2.QtWidgets import QPlainTextEdit, QTextEdit
         from PySide2.QtGui import QColor, QTextCharFormat, QBrush, QFont
-        from PySide2.QtCore import Qt
+        from PySide2.QtCore import Qt, QTimer
 
         QT_AVAILABLE = True
     except ImportError:
         try:
             # Try PySide6 as another fallback
-            from PySide6.QtWidgets import QTextEdit
+            from PySide6.QtWidgets import QPlainTextEdit, QTextEdit
             from PySide6.QtGui import QColor, QTextCharFormat, QBrush, QFont
-            from PySide6.QtCore import Qt
+            from PySide6.QtCore import Qt, QTimer
 
             QT_AVAILABLE = True
         except ImportError:
@@ -40,6 +42,9 @@ except ImportError:
             class QTextEdit:
                 pass
 
+            class QPlainTextEdit:
+                pass
+
             class QColor:
                 def __init__(self, *args):
                     pass
@@ -50,47 +55,120 @@ except ImportError:
             QBrush = object
             QTextCharFormat = object
             Qt = object
+            QTimer = object
 
 
 # Import from logkiss
 from . import logkiss
 
+# Colors for each theme, created once at import and shared by all handlers (do not modify)
+# Font styles are the same for both themes
+_LEVEL_STYLES = {
+    logging.WARNING: QFont.Bold,
+    logging.ERROR: QFont.Bold,
+    logging.CRITICAL: QFont.Bold,
+}
+_THEMES = {
+    # Colors for light theme (darker colors for better visibility)
+    "light": {
+        "colors": {
+            logging.DEBUG: QColor(0, 130, 130),  # dark cyan
+            logging.INFO: QColor(0, 0, 0),  # black
+            logging.WARNING: QColor(180, 90, 0),  # dark orange
+            logging.ERROR: QColor(200, 0, 0),  # dark red
+            logging.CRITICAL: QColor(200, 0, 0),  # dark red (with background)
+        },
+        "backgrounds": {
+            logging.CRITICAL: QColor(255, 210, 210),  # light red background
+        },
+        "styles": _LEVEL_STYLES,
+    },
+    # Colors for dark theme (brighter colors)
+    "dark": {
+        "colors": {
+            logging.DEBUG: QColor(0, 255, 255),  # cyan
+            logging.INFO: QColor(255, 255, 255),  # white
+            logging.WARNING: QColor(255, 255, 0),  # yellow
+            logging.ERROR: QColor(255, 100, 100),  # light red
+            logging.CRITICAL: QColor(255, 100, 100),  # light red (with background)
+        },
+        "backgrounds": {
+            logging.CRITICAL: QColor(100, 0, 0),  # dark red background
+        },
+        "styles": _LEVEL_STYLES,
+    },
+}
+# Color for levels without settings
+_DEFAULT_COLOR = QColor(255, 255, 255)
+
 
 class QtTextEditHandler(logging.Handler):
     """
-    Custom logging handler that outputs log messages to a QTextEdit widget with colors.
+    Custom logging handler that outputs log messages to a Qt text widget with colors.
     Supports light and dark themes.
 
+    A QPlainTextEdit is recommended for log viewers: appending to it stays cheap as the
+    log grows, and setMaximumBlockCount() drops the oldest lines once the limit is reached.
+
     This handler requires PyQt5, PySide2, or PySide6 to be installed.
     If none of these modules are available, an ImportError will be raised when
     trying to use the handler.
 
     Args:
-        text_edit: A QTextEdit widget to output logs to
+        text_edit: A QPlainTextEdit (recommended) or QTextEdit widget to output logs to
         theme: The theme to use, "light" or "dark", defaults to "light"
         formatter: Optional custom formatter, if None, logkiss.ColoredFormatter is used
+        flush_interval: Milliseconds between writes to the widget, defaults to 0.
+            0 writes each record immediately (emit() must then be called on the GUI thread).
+            A positive value collects records and writes them together from a QTimer
+            owned by text_edit, so emit() may be called from any thread (e.g. a
+            QueueListener); the handler must then be created on the GUI thread.
 
     Example:
         >>> import logkiss
-        >>> from PyQt5.QtWidgets import QApplication, QTextEdit
+        >>> from PyQt5.QtWidgets import QApplication, QPlainTextEdit
         >>> app = QApplication([])
-        >>> text_edit = QTextEdit()
+        >>> text_edit = QPlainTextEdit()
+        >>> text_edit.setMaximumBlockCount(1000)
         >>> handler = logkiss.QtTextEditHandler(text_edit)
         >>> logger = logkiss.getLogger()
         >>> logger.addHandler(handler)
         >>> logger.info("Hello from Qt!")
     """
 
-    def __init__(self, text_edit: QTextEdit, theme: str = "light", formatter: Optional[logging.Formatter] = None):
+    # Style sheets for the text widget (set only when the theme changes)
+    _LIGHT_QSS = "background-color: white; color: black;"
+    _DARK_QSS = "background-color: #2d2d2d; color: #f0f0f0;"
+
+    def __init__(
+        self,
+        text_edit: Union[QPlainTextEdit, QTextEdit],
+        theme: str = "light",
+        formatter: Optional[logging.Formatter] = None,
+        flush_interval: int = 0,
+    ):
         if not QT_AVAILABLE:
             raise ImportError("Qt modules not available. Install PyQt5, PySide2, or PySide6 to use QtTextEditHandler.")
 
         super().__init__()
         self.text_edit = text_edit
+        # QPlainTextEdit.appendHtml / QTextEdit.append (both add a new paragraph at the end)
+        self._append = getattr(text_edit, "appendHtml", None) or text_edit.append
         self.formatter = formatter or logkiss.ColoredFormatter()
-        self.theme = theme
+        self.theme = None  # set_theme()で設定する
         self.set_theme(theme)
 
+        # (levelno, message) pairs waiting to be written by the timer
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._timer = None
+        if flush_interval > 0:
+            # ウィジェットを親にする（ウィジェットのスレッドで動き、ウィジェットと一緒に破棄される）
+            self._timer = QTimer(text_edit)
+            self._timer.setInterval(flush_interval)
+            self._timer.timeout.connect(self._write_pending)
+            self._timer.start()
+
     def set_theme(self, theme: str) -> None:
         """
         Set color theme (light or dark)
@@ -98,76 +176,90 @@ class QtTextEditHandler(logging.Handler):
         Args:
             theme: The theme to use, "light" or "dark"
         """
+        # 同じテーマなら何もしない（スタイルシートの再設定は再描画を伴う）
+        if theme == self.theme:
+            return
         self.theme = theme
-        if theme == "light":
-            self.text_edit.setStyleSheet("background-color: white; color: black;")
-            # Colors for light theme (darker colors for better visibility)
-            self.level_colors = {
-                logging.DEBUG: QColor(0, 130, 130),  # dark cyan
-                logging.INFO: QColor(0, 0, 0),  # black
-                logging.WARNING: QColor(180, 90, 0),  # dark orange
-                logging.ERROR: QColor(200, 0, 0),  # dark red
-                logging.CRITICAL: QColor(200, 0, 0),  # dark red (with background)
-            }
-            self.level_backgrounds = {
-                logging.CRITICAL: QColor(255, 210, 210),  # light red background
-            }
-        else:  # dark theme
-            self.text_edit.setStyleSheet("background-color: #2d2d2d; color: #f0f0f0;")
-            # Colors for dark theme (brighter colors)
-            self.level_colors = {
-                logging.DEBUG: QColor(0, 255, 255),  # cyan
-                logging.INFO: QColor(255, 255, 255),  # white
-                logging.WARNING: QColor(255, 255, 0),  # yellow
-                logging.ERROR: QColor(255, 100, 100),  # light red
-                logging.CRITICAL: QColor(255, 100, 100),  # light red (with background)
-            }
-            self.level_backgrounds = {
-                logging.CRITICAL: QColor(100, 0, 0),  # dark red background
-            }
-
-        # Font styles are the same for both themes
-        self.level_styles = {
-            logging.WARNING: QFont.Bold,
-            logging.ERROR: QFont.Bold,
-            logging.CRITICAL: QFont.Bold,
-        }
+        self.text_edit.setStyleSheet(self._LIGHT_QSS if theme == "light" else self._DARK_QSS)
+        settings = _THEMES["light" if theme == "light" else "dark"]
+        self.level_colors = settings["colors"]
+        self.level_backgrounds = settings["backgrounds"]
+        self.level_styles = settings["styles"]
+
+        # Build the CSS style for each level once; records only look it up
+        self.level_css = {level: self._make_css(level) for level in self.level_colors}
+        self._default_css = self._make_css(None)
+
+    def _make_css(self, level: Optional[int]) -> str:
+        """Create the span style for a level (None for levels without settings)"""
+        css = "color:" + self.level_colors.get(level, _DEFAULT_COLOR).name()
+        if level in self.level_backgrounds:
+            css += ";background-color:" + self.level_backgrounds[level].name()
+        if level in self.level_styles:
+            css += ";font-weight:bold"
+        return css
 
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a log record to the QTextEdit widget with color formatting.
+        Emit a log record to the text widget with color formatting.
+
+        The formatted record is collected and written by the timer, or written
+        immediately when flush_interval is 0.
 
         Args:
             record: The log record to emit
         """
-        if not QT_AVAILABLE:
+        # Records below the handler level are not formatted (handle() itself does not check the level,
+        # e.g. when called directly or from a QueueListener without respect_handler_level)
+        if not QT_AVAILABLE or record.levelno < self.level:
             return
 
         try:
-            # Get formatted message
             msg = self.format(record)
+            if self._timer is None:
+                self._write([(record.levelno, msg)])
+                return
+            with self._pending_lock:
+                self._pending.append((record.levelno, msg))
+        except Exception:
+            self.handleError(record)
 
-            # Create text format
-            text_format = QTextCharFormat()
-            text_format.setForeground(QBrush(self.level_colors.get(record.levelno, QColor(255, 255, 255))))
-
-            # Apply background color if specified for the level
-            if record.levelno in self.level_backgrounds:
-                text_format.setBackground(QBrush(self.level_backgrounds[record.levelno]))
+    def _write_pending(self) -> None:
+        """Write the collected records to the widget (called by the timer on the GUI thread)"""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+        self._write(pending)
 
-            # Apply font style if specified for the level
-            if record.levelno in self.level_styles:
-                font = text_format.font()
-                font.setWeight(self.level_styles[record.levelno])
-                text_format.setFont(font)
+    def _write(self, pending: list) -> None:
+        """Append (levelno, message) pairs to the widget as one HTML block (one paragraph per record)"""
+        level_css = self.level_css
+        default_css = self._default_css
+        self._append(
+            "".join(
+                '<p style="margin:0;white-space:pre-wrap"><span style="%s">%s</span></p>'
+                % (level_css.get(levelno, default_css), html.escape(msg, quote=False))
+                for levelno, msg in pending
+            )
+        )
 
-            # Insert text with formatting
-            cursor = self.text_edit.textCursor()
-            cursor.movePosition(cursor.End)
-            cursor.insertText(msg + "\n", text_format)
+    def flush(self) -> None:
+        """Write the collected records now (call on the GUI thread)"""
+        if self._timer is not None:
+            try:
+                self._write_pending()
+            except RuntimeError:
+                # ウィジェットが既に破棄されている（終了時のlogging.shutdownなど）
+                pass
 
-            # Auto-scroll to bottom
-            self.text_edit.setTextCursor(cursor)
-            self.text_edit.ensureCursorVisible()
-        except Exception:
-            self.handleError(record)
+    def close(self) -> None:
+        """Stop the timer and write the remaining records."""
+        if self._timer is not None:
+            try:
+                self._timer.stop()
+                self._write_pending()
+            except RuntimeError:
+                # ウィジェットが既に破棄されている（終了時のlogging.shutdownなど）
+                pass
+        super().close()
@@ -15,8 +15,26 @@ import json
 import threading
 import time
 import logging
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
+
+# orjsonがインストールされていれば、クラウドハンドラーのJSONシリアライズに使う（任意の依存関係）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, using orjson when it is installed
+
+    Both paths write compact, non-ASCII-escaped JSON and fall back to str() for
+    other objects, so the message (and its size in batches) does not depend on orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 class BaseHandler(logging.Handler):
@@ -37,6 +55,18 @@ class AWSCloudWatchHandler(logging.Handler):
 
     CloudWatchにログを送信するためのハンドラー。boto3モジュールが必要です。
     実際のインポートと初期化は実際に使用されるまで遅延されます。
+
+    emit()はレコードをメモリ上のキューに追加するだけで、送信はバックグラウンドスレッドが
+    flush_interval秒ごと、またはbatch_size件たまった時点で、1回のPutLogEventsでまとめて行います。
+    close()（logging.shutdown()からも呼ばれる）で残りのレコードを送信します。
+    flush()はキューのレコードが送信されるまで待つため、送信を待つためにsleepする必要はありません。
+    batch_size件を超えるレコードがたまっている場合は、最大max_concurrent_requests件の
+    PutLogEventsを並行して送信します（CloudWatch Logsはシーケンストークンを必要としないため）。
+
+    client引数に既存のboto3 CloudWatch Logsクライアントを渡すと、新しいクライアントを作成しません。
+
+    各ログイベントのtimestampにはrecord.created（LogRecordの作成時刻）を使うため、
+    extraにtime.time()を入れる必要はありません。
     """
 
     def __init__(
@@ -46,22 +76,30 @@ class AWSCloudWatchHandler(logging.Handler):
         region_name: Optional[str] = None,
         batch_size: int = 100,
         flush_interval: float = 5.0,
+        max_concurrent_requests: int = 4,
+        client: Optional[Any] = None,
     ) -> None:
         """初期化処理は実際の実装クラスに委譲します"""
         # 先に基底クラスの初期化
         super().__init__()
 
-        # boto3が利用可能か確認
-        try:
-            import boto3
-        except ImportError:
-            raise ImportError("boto3 package is required. " "Install it with: pip install 'logkiss[cloud]'")
+        # boto3が利用可能か確認（clientが渡された場合はそれを使う）
+        if client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise ImportError("boto3 package is required. " "Install it with: pip install 'logkiss[cloud]'")
 
         # 属性を初期化して、初期化失敗時のエラーを防ぐ
-        self._batch = []
+        self._batch: Deque[Dict[str, Any]] = deque()
         self._batch_lock = threading.Lock()
+        # バッチサイズに達したことをフラッシュスレッドに通知する
+        self._batch_ready = threading.Condition(self._batch_lock)
+        # 送信中のバッチを含めて送信を直列化する（flush()は送信中のバッチの完了も待つ）
+        self._send_lock = threading.Lock()
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
         self._sequence_token = None
         self._executor = None
         self._running = False
@@ -69,7 +107,8 @@ class AWSCloudWatchHandler(logging.Handler):
 
         try:
             # AWS CloudWatch Logsクライアントを初期化
-            self.client = boto3.client("logs", region_name=region_name)
+            # （サービスモデルの読み込みに時間がかかるため、既存のクライアントを共有できるようにする）
+            self.client = client if client is not None else boto3.client("logs", region_name=region_name)
             self.log_group_name = log_group_name
 
             if log_stream_name is None:
@@ -137,14 +176,19 @@ class AWSCloudWatchHandler(logging.Handler):
 
     def _periodic_flush_worker(self) -> None:
         """Worker function for the periodic flush thread."""
+        failed = False
         while self._running:
             try:
-                # Sleep for the specified interval
-                time.sleep(self._flush_interval)
+                with self._batch_ready:
+                    if failed:
+                        # 送信に失敗した直後は、未送信のエントリでバッチサイズに達していてもflush_intervalだけ待つ
+                        self._batch_ready.wait_for(lambda: not self._running, timeout=self._flush_interval)
+                    else:
+                        # flush_intervalが経過するか、バッチサイズに達するまで待つ
+                        self._batch_ready.wait_for(lambda: not self._running or len(self._batch) >= self._batch_size, timeout=self._flush_interval)
 
                 # バッチが空でなければフラッシュ
-                if self._batch:
-                    self._flush()
+                failed = bool(self._batch) and not self._flush()
             except Exception as e:
                 import sys
 
@@ -165,78 +209,139 @@ class AWSCloudWatchHandler(logging.Handler):
             # exc_info=Trueが指定された場合のスタックトレース情報を追加
             if record.exc_info:
                 import traceback
-                import json
 
                 # JSONとして追加情報を埋め込む
-                entry["message"] += "\nStack Trace: " + json.dumps({"stack_trace": traceback.format_exception(*record.exc_info)})
+                entry["message"] += "\nStack Trace: " + _json_dumps({"stack_trace": traceback.format_exception(*record.exc_info)})
 
-            # バッチに追加
-            with self._batch_lock:
+            # バッチに追加（送信はフラッシュスレッドが行う）
+            with self._batch_ready:
                 self._batch.append(entry)
 
-                # バッチサイズに達したらフラッシュ
+                # バッチサイズに達したらフラッシュスレッドを起こす
                 if len(self._batch) >= self._batch_size:
-                    self._flush()
+                    self._batch_ready.notify()
         except Exception as e:
             import sys
 
             print(f"Error in AWSCloudWatchHandler.emit: {e}", file=sys.stderr)
 
-    def _flush(self) -> None:
-        """Flush batch"""
-        if not self._running:
-            return
+    def _flush(self) -> bool:
+        """Flush batch (returns False if some entries could not be sent)"""
+        if getattr(self, "client", None) is None:
+            return True
+
+        with self._send_lock:
+            return self._send_batch()
 
-        entries = []
+    def _send_batch(self) -> bool:
+        """Send the queued entries (called with _send_lock held)
+
+        Returns:
+            False if some entries could not be sent (they are put back in the batch).
+        """""
         with self._batch_lock:
             if not self._batch:
-                return
-
-            entries = self._batch
-            self._batch = []
+                return True
 
-        if not entries:
-            return
+            entries = list(self._batch)
+            self._batch.clear()
 
         # Sort entries by timestamp
         entries.sort(key=lambda x: x["timestamp"])
 
-        # Convert to CloudWatch Logs format
-        log_events = [{"timestamp": entry["timestamp"], "message": entry["message"]} for entry in entries]
+        # batch_size件ずつ、1回のPutLogEventsで送信する
+        chunks = [entries[start : start + self._batch_size] for start in range(0, len(entries), self._batch_size)]
+        if len(chunks) > 1 and self._max_concurrent_requests > 1:
+            return self._put_chunks_concurrently(chunks)
 
-        # ここでLazy Importを行う - 実際にAWS操作が必要なときだけ
-        try:
-            import boto3
+        for i, log_events in enumerate(chunks):
+            try:
+                self._put_log_events(log_events)
+            except Exception as e:
+                import sys
+
+                print(f"Error writing to CloudWatch Logs: {e}", file=sys.stderr)
+                # Put the unsent entries back in the batch
+                self._requeue([entry for chunk in chunks[i:] for entry in chunk])
+                return False
+        return True
+
+    def _put_chunks_concurrently(self, chunks: List[List[Dict[str, Any]]]) -> bool:
+        """Send several PutLogEvents requests in parallel (boto3 clients are thread-safe)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrent_requests, thread_name_prefix="logkiss-cloudwatch")
+
+        # 並行して送る場合はシーケンストークンを使わない
+        futures = [self._executor.submit(self._put_log_events, chunk, False) for chunk in chunks]
+        failed = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                future.result()
+            except Exception as e:
+                import sys
+
+                print(f"Error writing to CloudWatch Logs: {e}", file=sys.stderr)
+                failed.extend(chunk)
+        if failed:
+            self._requeue(failed)
+            return False
+        return True
+
+    def _requeue(self, entries: List[Dict[str, Any]]) -> None:
+        """Put unsent entries back at the front of the batch"""
+        with self._batch_lock:
+            self._batch.extendleft(reversed(entries))
+
+    def _put_log_events(self, log_events: List[Dict[str, Any]], use_sequence_token: bool = True) -> None:
+        """Send log events to CloudWatch Logs in a single request"""
+        kwargs = {"logGroupName": self.log_group_name, "logStreamName": self.log_stream_name, "logEvents": log_events}
 
-            # Send to CloudWatch Logs
-            kwargs = {"logGroupName": self.log_group_name, "logStreamName": self.log_stream_name, "logEvents": log_events}
+        if not use_sequence_token:
+            self.client.put_log_events(**kwargs)
+            return
 
-            if self._sequence_token:
-                kwargs["sequenceToken"] = self._sequence_token
+        if self._sequence_token:
+            kwargs["sequenceToken"] = self._sequence_token
 
+        try:
             response = self.client.put_log_events(**kwargs)
-            self._sequence_token = response.get("nextSequenceToken")
         except Exception as e:
-            if hasattr(e, "__class__") and e.__class__.__name__ == "InvalidSequenceTokenException":
-                # Get the correct sequence token from the error message
-                import re
-
-                match = re.search(r"sequenceToken is: (\S+)", str(e))
-                if match:
-                    self._sequence_token = match.group(1)
-                    # Retry with the correct sequence token
-                    self._flush()
-            else:
-                import sys
+            if e.__class__.__name__ != "InvalidSequenceTokenException":
+                raise
+            # Get the correct sequence token from the error message
+            import re
+
+            match = re.search(r"sequenceToken is: (\S+)", str(e))
+            if not match:
+                raise
+            # Retry with the correct sequence token
+            self._sequence_token = match.group(1)
+            kwargs["sequenceToken"] = self._sequence_token
+            response = self.client.put_log_events(**kwargs)
+        self._sequence_token = response.get("nextSequenceToken")
 
-                print(f"Error writing to CloudWatch Logs: {e}", file=sys.stderr)
-                # Put the entries back in the batch
-                with self._batch_lock:
-                    self._batch = entries + self._batch
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send all queued messages to CloudWatch Logs and wait until they are sent
+
+        Also waits for a batch that the flush thread is sending at the moment, so the
+        records logged before this call have been sent when it returns.
 
-    def flush(self) -> None:
-        """Flush all queued messages to CloudWatch Logs"""
-        self._flush()
+        Args:
+            timeout: Maximum seconds to wait for an in-flight send. Default is None (no limit).
+
+        Returns:
+            False if the timeout expired before the queue could be flushed or some
+            entries could not be sent (they stay queued and are retried later),
+            True otherwise.
+        """
+        if getattr(self, "client", None) is None:
+            return True
+        if not self._send_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        try:
+            return self._send_batch()
+        finally:
+            self._send_lock.release()
 
     def close(self):
         """
@@ -249,7 +354,14 @@ class AWSCloudWatchHandler(logging.Handler):
 
         try:
             # スレッドを停止
-            self._running = False
+            with self._batch_ready:
+                self._running = False
+                self._batch_ready.notify_all()
+
+            # スレッドが存在し、実行中であれば、終了を待つ（最大1秒）
+            if hasattr(self, "_flush_thread") and self._flush_thread is not None:
+                if self._flush_thread.is_alive() and self._flush_thread is not threading.current_thread():
+                    self._flush_thread.join(timeout=1.0)
 
             # 最後の一回フラッシュを試みる
             try:
@@ -259,10 +371,9 @@ class AWSCloudWatchHandler(logging.Handler):
 
                 print(f"Error in final flush: {e}", file=sys.stderr)
 
-            # スレッドが存在し、実行中であれば、終了を待つ（最大1秒）
-            if hasattr(self, "_flush_thread") and self._flush_thread is not None:
-                if self._flush_thread.is_alive():
-                    self._flush_thread.join(timeout=1.0)
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
         except Exception as e:
             import sys
 
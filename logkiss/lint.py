@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Lint helpers for logkiss.
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+See LICENSE for details.
+
+This module finds logging calls that format their message eagerly, e.g.
+``logger.debug(f"value: {value}")``. The f-string is built even when the level
+is disabled; ``logger.debug("value: %s", value)`` defers formatting until a
+handler actually outputs the record.
+"""
+
+import ast
+import warnings
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+
+# Logger methods whose first argument is the message
+LOG_METHODS = frozenset(["debug", "info", "warning", "warn", "error", "exception", "critical", "fatal"])
+
+
+def _find_in_source(source: str, filename: str) -> List[Tuple[str, int, str]]:
+    """Find logging calls with an f-string message in Python source code"""
+    results = []
+    tree = ast.parse(source, filename=filename)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        if node.func.attr not in LOG_METHODS or not node.args:
+            continue
+        if isinstance(node.args[0], ast.JoinedStr):
+            results.append((filename, node.lineno, node.func.attr))
+    return results
+
+
+def lint_fstring_calls(paths: Union[str, Path, Iterable[Union[str, Path]]], warn: bool = True) -> List[Tuple[str, int, str]]:
+    """Find logging calls whose message is an f-string.
+
+    Args:
+        paths: Python file or directory (searched recursively), or a list of them
+        warn: Issue a UserWarning for each call found. Default is True.
+
+    Returns:
+        List of (filename, line number, method name) tuples
+
+    Example:
+        >>> from logkiss import lint_fstring_calls
+        >>> lint_fstring_calls("examples")
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    files: List[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.py")))
+        else:
+            files.append(path)
+
+    results = []
+    for file in files:
+        try:
+            source = file.read_text(encoding="utf-8")
+            results.extend(_find_in_source(source, str(file)))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+
+    if warn:
+        for filename, lineno, method in results:
+            warnings.warn(f"{filename}:{lineno}: {method}() is called with an f-string; pass %-style arguments instead", UserWarning, stacklevel=2)
+    return results
@@ -13,12 +13,19 @@ including logging setup and configuration management.
 
 import os
 import sys
+import time
+import queue
+import atexit
+import functools
+import threading
 import logging
+import logging.handlers
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Union, TextIO, Dict, Any
+from typing import Optional, Union, TextIO, Dict, Any, List, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from yaml import safe_load, YAMLError
-from logging import FileHandler, LogRecord, StreamHandler, Formatter, Filter
+from logging import FileHandler, Handler, LogRecord, StreamHandler, Formatter, Filter
 from logging.handlers import TimedRotatingFileHandler, RotatingFileHandler
 
 # --- colorama for Windows compatibility ---
@@ -32,10 +39,15 @@ except ImportError:
 # Exported functions and classes
 __all__ = [
     "KissConsoleHandler",
+    "BufferedKissFileHandler",
     "ColoredFormatter",
+    "FastFormatter",
     "KissLogger",
     "use_console_handler",
+    "clear_handlers",
+    "enable_async_logging",
     "PathShortenerFilter",
+    "reconfigure_path_shortening",
     "setup_from_yaml",
     "setup_from_env",
     "setup",
@@ -122,12 +134,39 @@ except ValueError:
     LEVEL_FORMAT = 5
 
 # Path shortening settings
-_path_shorten = os.environ.get("LOGKISS_PATH_SHORTEN", "0")
-try:
-    PATH_SHORTEN = int(_path_shorten)
-except ValueError:
-    # Disable if not a number
-    PATH_SHORTEN = 0
+def _read_path_shorten() -> int:
+    """Read the number of path components to keep from LOGKISS_PATH_SHORTEN"""
+    try:
+        return int(os.environ.get("LOGKISS_PATH_SHORTEN", "0"))
+    except ValueError:
+        # Disable if not a number
+        return 0
+
+
+PATH_SHORTEN = _read_path_shorten()
+# KissLogger.makeRecord uses only the base name of the file unless disabled
+_PATH_BASENAME_ONLY = os.environ.get("LOGKISS_PATH_SHORTEN", "1").lower() in ("1", "true", "yes")
+
+
+@functools.lru_cache(maxsize=4096)
+def _shorten_path(pathname: str, components_to_keep: int) -> Optional[str]:
+    """Shorten a path to ".../<last_n_components>", or None if it is already short"""
+    components = pathname.split("/")
+    if len(components) > components_to_keep:
+        return "/".join(["..."] + components[-components_to_keep:])
+    return None
+
+
+def reconfigure_path_shortening() -> None:
+    """Re-read LOGKISS_PATH_SHORTEN.
+
+    The environment variable is read once at import time. Call this function
+    after changing it at runtime.
+    """
+    global PATH_SHORTEN, _PATH_BASENAME_ONLY  # pylint: disable=global-statement
+    PATH_SHORTEN = _read_path_shorten()
+    _PATH_BASENAME_ONLY = os.environ.get("LOGKISS_PATH_SHORTEN", "1").lower() in ("1", "true", "yes")
+    _shorten_path.cache_clear()
 
 
 @dataclass
@@ -207,6 +246,80 @@ class Colors:
         return getattr(cls, name, "")
 
 
+# 標準レベルの番号 -> ColorManager.level_prefix / message_prefix のインデックス
+LEVEL_INDEX = {logging.NOTSET: 0, logging.DEBUG: 1, logging.INFO: 2, logging.WARNING: 3, logging.ERROR: 4, logging.CRITICAL: 5}
+
+
+class _ConfigDict(dict):
+    """dict that calls ``on_change`` when it or a nested dict is modified in place
+
+    Used for ColorManager.config so that edits such as
+    ``manager.config["levels"]["WARNING"] = {...}`` discard the cached escape sequences.
+    """
+
+    def __init__(self, data: Optional[Dict[Any, Any]] = None, on_change: Optional[Any] = None):
+        super().__init__()
+        self._on_change = on_change
+        if data:
+            for key, value in data.items():
+                dict.__setitem__(self, key, self._wrap(value))
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, dict) and not (isinstance(value, _ConfigDict) and value._on_change is self._on_change):
+            return _ConfigDict(value, self._on_change)
+        return value
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dict.__setitem__(self, key, self._wrap(value))
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "_ConfigDict":
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, self._wrap(value))
+        self._changed()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        value = dict.pop(self, *args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = dict.popitem(self)
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._changed()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        # コピーは通常のdictにする（コピー先の変更でこのColorManagerのキャッシュを捨てない）
+        import copy
+
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self),)
+
+
 class ColorManager:
     """Class to manage color settings"""
 
@@ -218,14 +331,21 @@ class ColorManager:
         self.config_path = config_path
         self._config = None  # 内部設定を保持するプライベート変数
         self._external_config = False  # 外部から設定が適用されたかどうか
+        # 要素・レベルごとのANSIエスケープシーケンスのキャッシュ
+        self._ansi_cache: Dict[Any, Optional[str]] = {}
+        # 標準レベルのエスケープシーケンスを LEVEL_INDEX の順に並べたもの
+        # （ネストしたdictを引かずに整数インデックスで取り出すため）
+        self.level_prefix: List[Optional[str]] = []
+        self.message_prefix: List[Optional[str]] = []
         # 初期化時にファイルから設定を読み込む
-        self._config = self._load_config()
+        self._config = _ConfigDict(self._load_config(), self.clear_cache)
+        self.clear_cache()
 
     @property
     def config(self) -> Dict[str, Any]:
         """色設定を取得する"""
         if self._config is None:
-            self._config = self._load_default_config()
+            self._config = _ConfigDict(self._load_default_config(), self.clear_cache)
         return self._config
 
     @config.setter
@@ -234,9 +354,43 @@ class ColorManager:
         import copy
         
         # 完全に置き換えるためにディープコピーを使用
-        self._config = copy.deepcopy(value)
+        # （その場での変更でもキャッシュを捨てるように_ConfigDictで包む）
+        self._config = _ConfigDict(copy.deepcopy(value), self.clear_cache)
         self._external_config = True
-        
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Discard cached escape sequences
+
+        Called automatically when ``config`` is replaced or modified in place.
+        """
+        self._ansi_cache.clear()
+        levels = sorted(LEVEL_INDEX, key=LEVEL_INDEX.get)
+        self.level_prefix = [self.get_sequence("level", level) for level in levels]
+        self.message_prefix = [self.get_sequence("message", level) for level in levels]
+
+    def set_level_color(self, level: Union[int, str], fg: Optional[str] = None, bg: Optional[str] = None, style: Optional[str] = None) -> None:
+        """Set color settings for a log level name"""
+        self._set_color(self.config.setdefault("levels", {}), level, fg, bg, style)
+
+    def set_message_color(self, level: Union[int, str], fg: Optional[str] = None, bg: Optional[str] = None, style: Optional[str] = None) -> None:
+        """Set color settings for log messages of a level"""
+        elements = self.config.setdefault("elements", {})
+        self._set_color(elements.setdefault("message", {}), level, fg, bg, style)
+
+    def _set_color(self, table: Dict[str, Any], level: Union[int, str], fg: Optional[str], bg: Optional[str], style: Optional[str]) -> None:
+        if isinstance(level, int):
+            level = logging.getLevelName(level)
+        color = {}
+        if fg:
+            color["fg"] = fg
+        if bg:
+            color["bg"] = bg
+        if style:
+            color["style"] = style
+        # configの変更としてキャッシュが破棄される（_ConfigDict）
+        table[level] = color
+
     def _load_default_config(self) -> Dict[str, Any]:
         """デフォルトの色設定を読み込む"""
         # Default color settings
@@ -289,7 +443,7 @@ class ColorManager:
             level_name = logging.getLevelName(level)
         else:
             level_name = level
-        return self.config["levels"].get(level_name, {})
+        return self.config.get("levels", {}).get(level_name, {})
 
     def get_message_color(self, level: Union[int, str]) -> Dict[str, Any]:
         """Get color settings for a log message"""
@@ -297,18 +451,59 @@ class ColorManager:
             level_name = logging.getLevelName(level)
         else:
             level_name = level
-        return self.config["elements"]["message"].get(level_name, {})
+        return self.config.get("elements", {}).get("message", {}).get(level_name, {})
 
     def get_element_color(self, element: str) -> Dict[str, Any]:
         """Get color settings for a log element"""
-        return self.config["elements"].get(element, {})
+        return self.config.get("elements", {}).get(element, {})
+
+    def get_sequence(self, element: str, level: Optional[int] = None) -> Optional[str]:
+        """Get the cached ANSI escape sequence for an element
+
+        Args:
+            element: "level", "message", or an element name such as "timestamp"
+            level: Log level number (for "level" and "message")
+
+        Returns:
+            Escape sequence, or None if the element has no color settings
+        """
+        key = (element, level)
+        try:
+            return self._ansi_cache[key]
+        except KeyError:
+            pass
+
+        if element == "level":
+            config = self.get_level_color(level)
+        elif element == "message":
+            config = self.get_message_color(level)
+        else:
+            config = self.get_element_color(element)
+        sequence = self._build_sequence(config) if config else None
+        self._ansi_cache[key] = sequence
+        return sequence
+
+    def _colorize(self, text: str, element: str, level: Optional[int] = None) -> str:
+        """Wrap text in the cached escape sequence of an element"""
+        sequence = self.get_sequence(element, level)
+        if sequence is None:
+            return text
+        return sequence + text + Colors.RESET
 
     def apply_color(self, text: str, config: Dict[str, Any]) -> str:
         """Apply color settings to text"""
         if not config:
             return text
 
-        # Generate ANSI escape sequence
+        # Apply ANSI escape sequence
+        return self._build_sequence(config) + text + Colors.RESET
+
+    def _build_sequence(self, config: Dict[str, Any]) -> str:
+        """Generate ANSI escape sequence from color settings
+
+        Foreground, background and style are merged into a single SGR sequence
+        (e.g. "\\033[30;43m" instead of "\\033[30m\\033[43m").
+        """
         codes = []
 
         # Foreground color
@@ -323,32 +518,55 @@ class ColorManager:
         if "style" in config:
             codes.append(getattr(Colors, config["style"].upper(), ""))
 
-        # Apply ANSI escape sequence
-        return "".join(codes) + text + Colors.RESET
+        # "\033[30m" -> "30"
+        params = [code[2:-1] for code in codes if code]
+        if not params:
+            return ""
+        return "\033[" + ";".join(params) + "m"
 
     def colorize_level(self, levelname: str, levelno: Optional[int] = None) -> str:
         """Colorize log level name"""
-        if levelno is not None:
-            level_config = self.get_level_color(levelno)
-        else:
-            level = logging.getLevelName(levelname)
-            level_config = self.get_level_color(level)
-        return self.apply_color(levelname, level_config)
+        if levelno is None:
+            levelno = logging.getLevelName(levelname)
+        index = LEVEL_INDEX.get(levelno)
+        if index is None:
+            return self._colorize(levelname, "level", levelno)
+        sequence = self.level_prefix[index]
+        if sequence is None:
+            return levelname
+        return sequence + levelname + Colors.RESET
+
+    def colorize_level_and_message(self, levelname: str, message: str, levelno: int) -> Tuple[str, str]:
+        """Colorize the level name and message of a record with one level lookup"""
+        index = LEVEL_INDEX.get(levelno)
+        if index is None:
+            return self._colorize(levelname, "level", levelno), self._colorize(message, "message", levelno)
+        reset = Colors.RESET
+        sequence = self.level_prefix[index]
+        if sequence is not None:
+            levelname = sequence + levelname + reset
+        sequence = self.message_prefix[index]
+        if sequence is not None:
+            message = sequence + message + reset
+        return levelname, message
 
     def colorize_filename(self, filename: str) -> str:
         """Colorize filename"""
-        filename_config = self.get_element_color("filename")
-        return self.apply_color(filename, filename_config)
+        return self._colorize(filename, "filename")
 
     def colorize_timestamp(self, timestamp: str) -> str:
         """Colorize timestamp"""
-        timestamp_config = self.get_element_color("timestamp")
-        return self.apply_color(timestamp, timestamp_config)
+        return self._colorize(timestamp, "timestamp")
 
     def colorize_message(self, message: str, level: int) -> str:
         """Colorize log message"""
-        message_config = self.get_message_color(level)
-        return self.apply_color(message, message_config)
+        index = LEVEL_INDEX.get(level)
+        if index is None:
+            return self._colorize(message, "message", level)
+        sequence = self.message_prefix[index]
+        if sequence is None:
+            return message
+        return sequence + message + Colors.RESET
 
 
 class PathShortenerFilter(Filter):
@@ -367,18 +585,57 @@ class PathShortenerFilter(Filter):
 
     def filter(self, record):
         if PATH_SHORTEN > 0:
-            # Split path into components
-            components = record.pathname.split("/")
-
-            # Get last n components
-            if len(components) > PATH_SHORTEN:
-                shortened = "/".join(["..."] + components[-PATH_SHORTEN:])
+            # Get last n components (cached per path)
+            shortened = _shorten_path(record.pathname, PATH_SHORTEN)
+            if shortened is not None:
                 record.filename = shortened
 
         return True
 
 
-class ColoredFormatter(Formatter):
+@functools.lru_cache(maxsize=64)
+def _display_levelname(levelname: str, width: int) -> str:
+    """Level name adjusted to LEVEL_FORMAT characters
+
+    The result is interned and cached, so records of the same level share one
+    string instead of slicing/padding a new one per record.
+    """
+    # Special case for WARNING -> WARN
+    if levelname == "WARNING":
+        levelname = "WARN"
+
+    # Truncate or pad level name
+    if len(levelname) > width:
+        levelname = levelname[:width]
+    elif len(levelname) < width:
+        levelname = levelname.ljust(width)
+    return sys.intern(levelname)
+
+
+class _CachedTimeMixin:
+    """Formatter mixin that reuses the strftime() result for records in the same second
+
+    The cache is shared by all formatters, so a record sent to several handlers
+    (e.g. console and file) has its timestamp formatted once.
+    """
+
+    # ((秒, 日付フォーマット, converter), strftime結果) - すべてのフォーマッターで共有する
+    _time_cache: Tuple[Any, str] = (None, "")
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the creation time, reusing the strftime() result within a second"""
+        time_format = datefmt or self.default_time_format
+        key = (int(record.created), time_format, self.converter)
+        cached_key, text = _CachedTimeMixin._time_cache
+        if cached_key != key:
+            text = time.strftime(time_format, self.converter(record.created))
+            _CachedTimeMixin._time_cache = (key, text)
+        if datefmt is None and self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
+
+
+class ColoredFormatter(_CachedTimeMixin, Formatter):
     """Formatter that applies colors to log messages based on their level.
 
     This formatter extends the standard logging.Formatter to add color
@@ -469,44 +726,115 @@ class ColoredFormatter(Formatter):
         else:
             self.use_color = use_color
 
+    @property
+    def use_color(self) -> bool:
+        """Whether colors are applied"""
+        return self._use_color
+
+    @use_color.setter
+    def use_color(self, value: bool) -> None:
+        self._use_color = bool(value)
+        # format() をインスタンス側で差し替え、レコードごとの分岐をなくす
+        # （サブクラスが format() をオーバーライドしている場合はそちらを使う）
+        if type(self).format is ColoredFormatter.format:
+            self.format = self._format_colored if self._use_color else self._format_plain
+
     def format(self, record: LogRecord) -> str:
         """Format log record with colors"""
-        # Save original levelname and level number
-        orig_levelname = record.levelname
-        levelno = record.levelno
+        if self._use_color:
+            return self._format_colored(record)
+        return self._format_plain(record)
+
+    def _prepare(self, record: LogRecord) -> str:
+        """Adjust the level name and return the merged message
 
+        The merged message is kept on the record as ``_logkiss_message`` (with the msg and
+        args it was merged from), so other ColoredFormatters formatting the same record
+        reuse it instead of applying % formatting again. While Formatter.format() runs,
+        it also replaces record.msg / record.args; the caller restores them afterwards.
+        """
         # Format level name based on LEVEL_FORMAT
         if LEVEL_FORMAT > 0:
-            # Special case for WARNING -> WARN
-            if orig_levelname == "WARNING":
-                display_levelname = "WARN"
-            else:
-                display_levelname = orig_levelname
-
-            # Truncate or pad level name
-            if len(display_levelname) > LEVEL_FORMAT:
-                # Truncate
-                display_levelname = display_levelname[:LEVEL_FORMAT]
-            elif len(display_levelname) < LEVEL_FORMAT:
-                # Pad
-                display_levelname = display_levelname.ljust(LEVEL_FORMAT)
-
             # Replace levelname with formatted version
-            record.levelname = display_levelname
-
-        # Apply colors
-        if self.use_color:
-            # Use original level for color lookup, but apply to formatted level name
-            record.levelname = self.color_manager.colorize_level(record.levelname, levelno)
+            record.levelname = _display_levelname(record.levelname, LEVEL_FORMAT)
 
-            record.filename = self.color_manager.colorize_filename(record.filename)
-            record.asctime = self.color_manager.colorize_timestamp(self.formatTime(record, self.datefmt))
-            record.message = self.color_manager.colorize_message(record.getMessage(), levelno)
+        msg, args = record.msg, record.args
+        cached = record.__dict__.get("_logkiss_message")
+        # msg/argsが差し替えられていれば（QueueHandler.prepareなど）マージし直す
+        if cached is not None and cached[0] is msg and cached[1] is args:
+            message = cached[2]
         else:
-            record.message = record.getMessage()
+            message = record.getMessage()
+            record._logkiss_message = (msg, args, message)
+        if args:
+            record.msg, record.args = message, None
+        return message
+
+    def _format_plain(self, record: LogRecord) -> str:
+        """Format log record without touching the color manager"""
+        levelname, msg, args = record.levelname, record.msg, record.args
+        self._prepare(record)
+        try:
+            return Formatter.format(self, record)
+        finally:
+            # 変更した値を次のハンドラー（QueueHandlerやJSON出力など）に渡さず、元の値に戻す
+            record.levelname, record.msg, record.args = levelname, msg, args
+
+    def _format_colored(self, record: LogRecord) -> str:
+        """Format log record with colors"""
+        levelno = record.levelno
+        levelname, filename = record.levelname, record.filename
+        msg, args = record.msg, record.args
+        message = self._prepare(record)
+
+        color_manager = self.color_manager
+        # Use original level for color lookup, but apply to formatted level name
+        record.levelname, record.message = color_manager.colorize_level_and_message(record.levelname, message, levelno)
+
+        record.filename = color_manager.colorize_filename(record.filename)
+        record.asctime = color_manager.colorize_timestamp(self.formatTime(record, self.datefmt))
 
         # Format record
-        return Formatter.format(self, record)
+        try:
+            return Formatter.format(self, record)
+        finally:
+            # 色付けした値を次のハンドラー（ファイル出力など）に渡さず、元のmsg/argsも戻す
+            record.levelname, record.filename = levelname, filename
+            record.msg, record.args = msg, args
+
+
+class FastFormatter(_CachedTimeMixin, Formatter):
+    """Formatter for fixed %-style formats that does the per-record work once.
+
+    The output is the same as logging.Formatter, but:
+    - whether the format uses ``%(asctime)s`` is checked once in __init__
+      instead of for every record
+    - the strftime() result is reused for records in the same second (as in ColoredFormatter)
+    - the message is merged with ``fmt % record.__dict__`` directly
+
+    Formats in '{' or '$' style are handled by logging.Formatter as usual.
+
+    Example:
+        >>> handler.setFormatter(FastFormatter("%(asctime)s %(levelname)-5s | %(name)s | %(message)s"))
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, style: str = "%", validate: bool = True):
+        # Python 3.7 compatibility: validate parameter was added in Python 3.8
+        if sys.version_info >= (3, 8):
+            super().__init__(fmt, datefmt, style, validate)
+        else:
+            super().__init__(fmt, datefmt, style)
+        self._percent = isinstance(self._style, logging.PercentStyle) and not getattr(self._style, "_defaults", None)
+        self._uses_time = self._style.usesTime()
+
+    def usesTime(self) -> bool:
+        """Check if the format uses the creation time of the record"""
+        return self._uses_time
+
+    def formatMessage(self, record: LogRecord) -> str:
+        if self._percent:
+            return self._fmt % record.__dict__
+        return super().formatMessage(record)
 
 
 class KissConsoleHandler(StreamHandler):
@@ -529,6 +857,12 @@ class KissConsoleHandler(StreamHandler):
         - NO_COLOR: Industry standard to disable colors (any value)
         These environment variables override the use_color parameter of the formatter.
 
+        Set LOGKISS_CONSOLE_BUFFERED=1 to skip the flush after every record below ERROR
+        when sys.stderr or sys.stdout is redirected to a pipe or file. Records are still
+        written through the stream itself (so they stay in order with print() and other
+        writers) and are flushed with the stream: on ERROR and above, by logging.shutdown()
+        at exit, and when a multiprocessing child exits.
+
     Args:
         stream: Output stream. Default is sys.stderr.
         color_config: Path to color configuration file. Default is None.
@@ -556,12 +890,45 @@ class KissConsoleHandler(StreamHandler):
         # Apply colors if not disabled by env vars and outputting to sys.stderr or sys.stdout
         use_color = not (disable_color or no_color) and (stream is None or stream is sys.stderr or stream is sys.stdout)
 
-        self.formatter = ColoredFormatter(color_config=color_config, use_color=use_color)
-        self.setFormatter(self.formatter)
+        # ColoredFormatter（ColorManager）は最初に参照されたときに作る
+        # （import logkiss でルートに作られるハンドラーがログを出すまで色設定を構築しない）
+        self._color_config = color_config
+        self._use_color = use_color
+        self._lazy_formatter = True
 
         # Add path shortening filter
         self.addFilter(PathShortenerFilter())
 
+        # LOGKISS_CONSOLE_BUFFERED=1 の場合、端末ではない標準出力・標準エラー出力への書き込みはレコードごとにflushしない
+        # （ストリーム自身に書くので、print()などとの順序は変わらない）
+        self._defer_flush = False
+        buffered = os.environ.get("LOGKISS_CONSOLE_BUFFERED", "").lower() in ("1", "true", "yes")
+        if buffered and (stream is sys.stderr or stream is sys.stdout):
+            try:
+                self._defer_flush = not stream.isatty()
+            except (AttributeError, ValueError):
+                self._defer_flush = False
+
+    @property
+    def formatter(self) -> Optional[Formatter]:
+        """Formatter of this handler (the default ColoredFormatter is created on first access)"""
+        if self._lazy_formatter:
+            self._formatter = ColoredFormatter(color_config=self._color_config, use_color=self._use_color)
+            self._lazy_formatter = False
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, value: Optional[Formatter]) -> None:
+        # setFormatter()やHandler.__init__から設定された値はそのまま使う
+        self._formatter = value
+        self._lazy_formatter = False
+
+    def _write(self, text: str, levelno: int) -> None:
+        """Write text to the stream and flush unless flushing is deferred"""
+        self.stream.write(text)
+        if not self._defer_flush or levelno >= logging.ERROR:
+            self.flush()
+
     def format(self, record: LogRecord) -> str:
         """Format log record"""
         # Set default formatter if not set
@@ -573,22 +940,300 @@ class KissConsoleHandler(StreamHandler):
         """Output log record"""
         try:
             msg = self.format(record)
-            stream = self.stream
             # if exception information is present, it's formatted as text and appended to msg
-            stream.write(msg + self.terminator)
-            self.flush()
+            # メッセージと改行は1回のwrite()で書く（StreamHandler.emitのように2回に分けない）
+            self._write(msg + self.terminator, record.levelno)
         except (ValueError, TypeError, IOError):
             # 書き込みエラーや型変換エラーの場合
             self.handleError(record)
 
+    def handle_batch(self, records: List[LogRecord]) -> None:
+        """Output several log records with a single write
+
+        Records below the handler level or rejected by its filters are skipped.
+        """
+        records = [record for record in records if record.levelno >= self.level and self.filter(record)]
+        if not records:
+            return
+        self.acquire()
+        try:
+            self.emit_batch(records)
+        finally:
+            self.release()
+
+    def emit_batch(self, records: List[LogRecord]) -> None:
+        """Format log records and write them to the stream at once"""
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except (ValueError, TypeError):
+                self.handleError(record)
+        if not msgs:
+            return
+        try:
+            self._write("".join(msgs), max(record.levelno for record in records))
+        except (ValueError, TypeError, IOError):
+            self.handleError(records[-1])
+
+
+class BufferedKissFileHandler(FileHandler):
+    """File handler that buffers log lines and writes them in batches.
+
+    Formatted records are collected in memory and written to the file when the
+    buffer reaches ``capacity`` characters, every ``flush_interval`` seconds
+    (from a background thread), and immediately for records at ``flush_level``
+    or higher. The buffer is also written when the handler is flushed or closed
+    (logging.shutdown() does both at interpreter exit).
+
+    Note:
+        If the process is killed, records still in the buffer are lost.
+
+    Environment Variables:
+        - LOGKISS_FILE_UNBUFFERED: Write every record immediately (values: 1, true, yes)
+
+    Args:
+        filename: Path to the log file
+        mode: File open mode. Default is 'a'.
+        encoding: File encoding. Default is 'utf-8'.
+        delay: Delay opening the file until the first write. Default is False.
+        capacity: Buffer size in characters. Default is 8192.
+        flush_interval: Seconds between periodic flushes (0 disables the thread). Default is 1.0.
+        flush_level: Records at this level or higher are written immediately. Default is ERROR.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        mode: str = "a",
+        encoding: Optional[str] = "utf-8",
+        delay: bool = False,
+        capacity: int = 8192,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+    ):
+        super().__init__(filename, mode, encoding, delay)
+        if os.environ.get("LOGKISS_FILE_UNBUFFERED", "").lower() in ("1", "true", "yes"):
+            capacity = 0
+            flush_interval = 0
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+
+        # 定期的なフラッシュ用のスレッド
+        self._stop_event = threading.Event()
+        self._flush_thread = None
+        if self.capacity > 0 and self.flush_interval > 0:
+            self._flush_thread = threading.Thread(target=self._periodic_flush_worker, daemon=True)
+            self._flush_thread.start()
+
+    def _periodic_flush_worker(self) -> None:
+        """Worker function for the periodic flush thread."""
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record: LogRecord) -> None:
+        """Add the formatted record to the buffer"""
+        try:
+            msg = self.format(record) + self.terminator
+            self._buffer.append(msg)
+            self._buffer_size += len(msg)
+            if self._buffer_size >= self.capacity or record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def handle_batch(self, records: List[LogRecord]) -> None:
+        """Buffer several log records and write them with at most one write
+
+        Used by KissLogger.batching(); flush_level is checked once for the whole batch.
+        """
+        records = [record for record in records if record.levelno >= self.level and self.filter(record)]
+        if not records:
+            return
+        self.acquire()
+        try:
+            for record in records:
+                try:
+                    msg = self.format(record) + self.terminator
+                except Exception:  # pylint: disable=broad-except
+                    self.handleError(record)
+                    continue
+                self._buffer.append(msg)
+                self._buffer_size += len(msg)
+            if self._buffer_size >= self.capacity or max(record.levelno for record in records) >= self.flush_level:
+                self.flush()
+        finally:
+            self.release()
+
+    def flush(self) -> None:
+        """Write buffered records to the file"""
+        self.acquire()
+        try:
+            if self._buffer:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write("".join(self._buffer))
+                self._buffer.clear()
+                self._buffer_size = 0
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Stop the flush thread, write remaining records and close the file"""
+        self._stop_event.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=1.0)
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+
+def _wrap_clear_cache(clear_cache):
+    @functools.wraps(clear_cache)
+    def _clear_cache(self):
+        self._logkiss_level_generation += 1
+        clear_cache(self)
+
+    _clear_cache._logkiss_wrapped = True
+    return _clear_cache
+
+
+def _track_level_changes(manager_class: type) -> None:
+    """Give the Manager class a generation number that grows whenever levels change
+
+    setLevel() and logging.disable() call Manager._clear_cache(), which is wrapped
+    to update the number. This is done when the first KissLogger is created, so
+    importing logkiss alone does not patch the standard library.
+    """
+    if getattr(manager_class._clear_cache, "_logkiss_wrapped", False):
+        return
+    with logging._lock:  # pylint: disable=protected-access
+        # モジュールが再読み込みされても、複数のスレッドから呼ばれても二重にラップしない
+        if not getattr(manager_class._clear_cache, "_logkiss_wrapped", False):
+            manager_class._logkiss_level_generation = 0
+            manager_class._clear_cache = _wrap_clear_cache(manager_class._clear_cache)
+
 
 class KissLogger(logging.Logger):
     """Logger that uses colored output by default"""
 
     def __init__(self, name: str):
         """Initialize the logger with the specified name"""
+        _track_level_changes(type(self.manager))
         super().__init__(name)
         self.setLevel(logging.WARNING)  # Set default level to WARNING
+        # batching()中にレコードを溜めておくスレッドローカル領域
+        self._batch_local = threading.local()
+        # isEnabledFor()用: (Managerの世代番号, このレベル以上なら有効)
+        # 世代番号としきい値を1つのタプルで置き換え、他のスレッドから組み合わせが崩れて見えないようにする
+        self._threshold: Tuple[int, int] = (-1, 0)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Is this logger enabled for level 'level'?
+
+        The effective level is cached until the logger hierarchy's levels change,
+        so the common case is a single integer comparison.
+        """
+        generation = self.manager._logkiss_level_generation
+        cached_generation, threshold = self._threshold
+        if cached_generation != generation:
+            threshold = max(self.getEffectiveLevel(), self.manager.disable + 1)
+            self._threshold = (generation, threshold)
+        return level >= threshold and not self.disabled
+
+    # handlersはlogger.handlers[:] = [...] などで直接変更されることがあるので、キャッシュせずに毎回走査する
+    @property
+    def console_handlers(self) -> Tuple["KissConsoleHandler", ...]:
+        """KissConsoleHandlers currently attached to this logger"""
+        return tuple(h for h in self.handlers if isinstance(h, KissConsoleHandler))
+
+    @property
+    def file_handlers(self) -> Tuple[FileHandler, ...]:
+        """FileHandlers (including BufferedKissFileHandler) currently attached to this logger"""
+        return tuple(h for h in self.handlers if isinstance(h, FileHandler))
+
+    def handle(self, record: LogRecord) -> None:
+        """Handle a record, or keep it for later while batching() is active"""
+        records = getattr(self._batch_local, "records", None)
+        if records is None:
+            super().handle(record)
+        elif not self.disabled and self.filter(record):
+            records.append(record)
+
+    @contextmanager
+    def batching(self) -> Iterator[None]:
+        """Collect records logged inside the block and output them together on exit.
+
+        Handlers that support it (such as KissConsoleHandler) write all collected
+        records with a single write; other handlers receive them one by one.
+        Only records logged by the current thread are collected.
+
+        Example:
+            >>> with logger.batching():
+            ...     logger.info("step 1")
+            ...     logger.info("step 2")
+        """
+        if getattr(self._batch_local, "records", None) is not None:
+            # 既にbatching()中の場合は外側のブロックでまとめて出力する
+            yield
+            return
+
+        records: List[LogRecord] = []
+        self._batch_local.records = records
+        try:
+            yield
+        finally:
+            self._batch_local.records = None
+            self._call_handlers_batch(records)
+
+    def log_batch(self, level: int, msgs: Iterable[str], extra: Optional[Dict[str, Any]] = None, stacklevel: int = 1) -> None:
+        """Log several messages at the same level, written together.
+
+        Args:
+            level: Log level
+            msgs: Messages to log (not %-formatted)
+            extra: Extra attributes added to every record
+            stacklevel: Which caller to report as the source (1 = the caller of log_batch,
+                2 = its caller, and so on; the same meaning as in Logger.log)
+        """
+        if not self.isEnabledFor(level):
+            return
+
+        # 呼び出し元の情報は一度だけ、必要な深さのフレームを直接取得する（f_backをたどらない）
+        frame = sys._getframe(stacklevel)  # pylint: disable=protected-access
+        fn, lno, func = frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+        with self.batching():
+            for msg in msgs:
+                self.handle(self.makeRecord(self.name, level, fn, lno, msg, (), None, func, extra))
+
+    def _call_handlers_batch(self, records: List[LogRecord]) -> None:
+        """Pass collected records to the handlers of this logger and its ancestors"""
+        if not records:
+            return
+        found = 0
+        logger: Optional[logging.Logger] = self
+        while logger:
+            for handler in logger.handlers:
+                found += 1
+                if hasattr(handler, "handle_batch"):
+                    handler.handle_batch(records)
+                else:
+                    for record in records:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        if found == 0:
+            # ハンドラーが無い場合は標準のcallHandlersに任せる（lastResortなど）
+            for record in records:
+                self.callHandlers(record)
 
     def setLevel(self, level: int) -> None:
         """Set the logging level for both logger and handlers"""
@@ -612,14 +1257,13 @@ class KissLogger(logging.Logger):
     ) -> LogRecord:
         """Create a LogRecord with the given arguments"""
         # Get caller information from extra
-        if extra is not None:
-            if "_filename" in extra:
-                fn = extra["_filename"]
-            if "_lineno" in extra:
-                lno = extra["_lineno"]
+        # (extra is only read, so a shared read-only mapping such as MappingProxyType can be reused across calls)
+        if extra:
+            fn = extra.get("_filename", fn)
+            lno = extra.get("_lineno", lno)
 
         # Shorten path if enabled
-        if os.environ.get("LOGKISS_PATH_SHORTEN", "1").lower() in ("1", "true", "yes"):
+        if _PATH_BASENAME_ONLY:
             # Use only filename
             fn = os.path.basename(fn)
 
@@ -639,9 +1283,8 @@ class KissLogger(logging.Logger):
         """
         # Check if config path is available
         if hasattr(self, "config_path"):
-            # Remove existing handlers
-            for handler in self.handlers[:]:
-                self.removeHandler(handler)
+            # Remove existing handlers (taking the logging lock once)
+            clear_handlers(self, close=False)
 
             # Reload from YAML
             from logkiss import yaml_config
@@ -653,6 +1296,44 @@ class KissLogger(logging.Logger):
 
 
 # Helper function to use a standard ConsoleHandler
+def _get_console_handlers(logger: logging.Logger) -> List[KissConsoleHandler]:
+    """Return the KissConsoleHandlers of a logger"""
+    return [h for h in logger.handlers if isinstance(h, KissConsoleHandler)]
+
+
+def clear_handlers(logger: Optional[logging.Logger] = None, close: bool = True) -> None:
+    """Remove all handlers from a logger at once.
+
+    Unlike ``for h in logger.handlers[:]: logger.removeHandler(h)``, the logging
+    lock is acquired once and the list is cleared in place.
+
+    Args:
+        logger: Logger to clear. Default is None (root logger).
+        close: Close the removed handlers. Default is True.
+
+    Example:
+        >>> import logkiss as logging
+        >>> logger = logging.getLogger(__name__)
+        >>> logging.clear_handlers(logger)
+        >>> logger.addHandler(logging.KissConsoleHandler())
+    """
+    if logger is None:
+        logger = logging.getLogger()
+
+    # addHandler/removeHandlerと同じモジュールロックを1回だけ取得する
+    with logging._lock:  # pylint: disable=protected-access
+        handlers = logger.handlers[:]
+        logger.handlers.clear()
+
+    if close:
+        for handler in handlers:
+            try:
+                handler.close()
+            except (OSError, ValueError):
+                # logging.shutdown()と同様に、既に閉じられたストリームなどは無視する
+                pass
+
+
 def use_console_handler(logger: Optional[logging.Logger] = None) -> None:
     """Configure the logger to use a standard StreamHandler instead of KissConsoleHandler.
 
@@ -677,9 +1358,8 @@ def use_console_handler(logger: Optional[logging.Logger] = None) -> None:
         logger = logging.getLogger()
 
     # Remove KissConsoleHandler
-    for handler in logger.handlers[:]:
-        if isinstance(handler, KissConsoleHandler):
-            logger.removeHandler(handler)
+    for handler in _get_console_handlers(logger):
+        logger.removeHandler(handler)
 
     # Add standard ConsoleHandler
     handler = StreamHandler()
@@ -689,6 +1369,82 @@ def use_console_handler(logger: Optional[logging.Logger] = None) -> None:
     logger.addHandler(handler)
 
 
+class _KissQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that waits briefly for the queue to drain on ERROR and above
+
+    Records at ``flush_level`` or higher are written out (almost) immediately,
+    so errors are not lost if the process dies right after logging them.
+    """
+
+    def __init__(self, log_queue: "queue.Queue", flush_level: int = logging.ERROR, flush_timeout: float = 0.1):
+        super().__init__(log_queue)
+        self.flush_level = flush_level
+        self.flush_timeout = flush_timeout
+
+    def emit(self, record: LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= self.flush_level:
+            deadline = time.monotonic() + self.flush_timeout
+            while self.queue.unfinished_tasks and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a QueueListener unless it has already been stopped"""
+    if listener._thread is not None:  # pylint: disable=protected-access
+        listener.stop()
+
+
+def enable_async_logging(logger: Optional[logging.Logger] = None) -> List[logging.handlers.QueueListener]:
+    """Move console output of loggers to a background thread.
+
+    Every KissConsoleHandler attached to the logger is replaced by a QueueHandler,
+    and a QueueListener thread formats and writes the queued records. The caller
+    only pays for putting the record on the queue. Records of level ERROR or
+    higher wait up to 0.1 seconds for the queue to drain.
+
+    The listeners are stopped (and the queues flushed) at interpreter exit.
+    Setting the environment variable LOGKISS_ASYNC=1 enables this for the root
+    logger when logkiss is imported.
+
+    Args:
+        logger: Logger to configure. Default is None (root logger and all
+            existing named loggers).
+
+    Returns:
+        List of started QueueListener instances (one per configured logger)
+
+    Example:
+        >>> import logkiss as logging
+        >>> logging.enable_async_logging()
+        >>> logging.getLogger(__name__).warning("Written by a background thread")
+    """
+    if logger is None:
+        loggers = [logging.getLogger()]
+        loggers.extend(lg for lg in logging.Logger.manager.loggerDict.values() if isinstance(lg, logging.Logger))
+    else:
+        loggers = [logger]
+
+    listeners = []
+    for target in loggers:
+        handlers = _get_console_handlers(target)
+        if not handlers:
+            continue
+
+        # 各ロガーに専用のキューとリスナーを用意する（他のロガーのハンドラーに配送しないため）
+        log_queue = queue.Queue(-1)
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(_KissQueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(_stop_listener, listener)
+        listeners.append(listener)
+
+    return listeners
+
+
 def setup_from_yaml(config_path: Union[str, Path]) -> logging.Logger:
     """Set up logging configuration from a YAML file.
 
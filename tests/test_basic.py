@@ -238,3 +238,16 @@ def test_default_handlers_difference():
     
     # クリーンアップ
     cleanup_logkiss_modules()
+
+
+@with_fresh_logkiss
+def test_fast_formatter_matches_formatter():
+    """FastFormatter produces the same output as logging.Formatter"""
+    fmt = "%(asctime)s,%(msecs)03d %(levelname)-5s | %(name)s | %(filename)s:%(lineno)3d | %(message)s"
+    record = logging.LogRecord("fast", logging.INFO, "/tmp/sample.py", 7, "value: %d", (3,), None)
+    for datefmt in (None, "%Y-%m-%d %H:%M:%S"):
+        expected = logging.Formatter(fmt, datefmt).format(record)
+        formatter = logkiss.FastFormatter(fmt, datefmt)
+        assert formatter.format(record) == expected
+        # 同じ秒のレコードはキャッシュした時刻文字列を使う
+        assert formatter.format(record) == expected
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Test cases for color handling in logkiss.
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+See LICENSE for details.
+"""
+
+import logging
+import time
+from unittest import mock
+
+from logkiss.logkiss import LEVEL_INDEX, ColorManager, ColoredFormatter, Colors, FastFormatter, _CachedTimeMixin, _display_levelname
+
+
+def test_colorize_level_uses_level_config():
+    """Level names are wrapped in the configured escape sequence"""
+    manager = ColorManager()
+    result = manager.colorize_level("ERROR", logging.ERROR)
+    assert result.startswith("\033[")
+    assert result.endswith("ERROR" + Colors.RESET)
+
+
+def test_colorize_without_config_returns_text():
+    """Text is returned unchanged when an element has no color settings"""
+    manager = ColorManager()
+    manager.config = {"levels": {}, "elements": {"message": {}}}
+    assert manager.colorize_level("INFO", logging.INFO) == "INFO"
+    assert manager.colorize_message("hello", logging.INFO) == "hello"
+    assert manager.colorize_filename("a.py") == "a.py"
+
+
+def test_sequence_is_cached():
+    """Escape sequences are computed once per element and level"""
+    manager = ColorManager()
+    manager.colorize_level("INFO", logging.INFO)
+    assert ("level", logging.INFO) in manager._ansi_cache
+
+
+def test_set_level_color_invalidates_cache():
+    """Changing a level color is reflected in the next colorized output"""
+    manager = ColorManager()
+    before = manager.colorize_level("INFO", logging.INFO)
+    manager.set_level_color(logging.INFO, fg="green")
+    after = manager.colorize_level("INFO", logging.INFO)
+    assert before != after
+    assert manager.config["levels"]["INFO"] == {"fg": "green"}
+
+
+def test_config_assignment_invalidates_cache():
+    """Replacing the whole config discards cached sequences"""
+    manager = ColorManager()
+    manager.colorize_message("hello", logging.WARNING)
+    manager.config = {"levels": {}, "elements": {"message": {}}}
+    assert manager.colorize_message("hello", logging.WARNING) == "hello"
+
+
+def test_in_place_config_edit_invalidates_cache():
+    """Editing config in place (including nested tables) is reflected in the next colorized output"""
+    manager = ColorManager()
+    manager.colorize_level("WARN ", logging.WARNING)
+    manager.config["levels"]["WARNING"] = {"fg": "green"}
+    assert manager.colorize_level("WARN ", logging.WARNING) == "\033[32mWARN " + Colors.RESET
+    manager.config["elements"]["message"]["WARNING"]["bg"] = "blue"
+    assert manager.colorize_message("text", logging.WARNING) == "\033[30;44mtext" + Colors.RESET
+    del manager.config["elements"]["message"]["WARNING"]
+    assert manager.colorize_message("text", logging.WARNING) == "text"
+
+
+def test_config_copy_is_plain_dict():
+    """A deep copy of config does not share the cache invalidation of the manager"""
+    import copy
+
+    manager = ColorManager()
+    copied = copy.deepcopy(manager.config)
+    assert type(copied) is dict and type(copied["levels"]) is dict
+    assert copied == manager.config
+
+
+def test_sequence_merges_sgr_codes():
+    """Foreground, background and style are emitted as one SGR sequence"""
+    manager = ColorManager()
+    manager.set_level_color(logging.CRITICAL, fg="black", bg="bright_red", style="bold")
+    assert manager.colorize_level("CRITI", logging.CRITICAL) == "\033[30;101;1mCRITI" + Colors.RESET
+
+
+def test_formatter_merges_args_once():
+    """msg and args are merged once per record, shared by formatters, and left unchanged for other handlers"""
+
+    class Counted:
+        calls = 0
+
+        def __str__(self):
+            Counted.calls += 1
+            return "42"
+
+    arg = Counted()
+    record = logging.LogRecord("test", logging.WARNING, __file__, 1, "value: %s", (arg,), None)
+    outputs = [ColoredFormatter(fmt="%(levelname)s %(message)s", use_color=use_color).format(record) for use_color in (False, True, False)]
+    assert outputs[0] == outputs[2] == "WARN  value: 42"
+    assert outputs[1].endswith("value: 42")
+    assert Counted.calls == 1
+    assert (record.levelname, record.msg, record.args) == ("WARNING", "value: %s", (arg,))
+
+
+def test_formatter_merges_again_after_msg_changes():
+    """A record whose msg/args were replaced after formatting is merged again"""
+    formatter = ColoredFormatter(fmt="%(message)s", use_color=False)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "value: %d", (1,), None)
+    assert formatter.format(record) == "value: 1"
+    record.args = (2,)
+    assert formatter.format(record) == "value: 2"
+
+
+def test_level_prefix_arrays_follow_config():
+    """Per-level sequence arrays are rebuilt when a level color changes"""
+    manager = ColorManager()
+    index = LEVEL_INDEX[logging.WARNING]
+    assert manager.level_prefix[index] == manager.get_sequence("level", logging.WARNING)
+    manager.set_level_color(logging.WARNING, fg="green")
+    assert manager.level_prefix[index] == "\033[32m"
+    assert manager.colorize_level("WARN ", logging.WARNING) == "\033[32mWARN " + Colors.RESET
+    # Custom levels fall back to the cache keyed by level number
+    assert manager.colorize_level("TRACE", 5) == "TRACE"
+
+
+def test_formatter_without_color_skips_color_manager():
+    """use_color=False formats records without consulting the color manager"""
+    formatter = ColoredFormatter(fmt="%(levelname)s %(message)s", use_color=True)
+    formatter.use_color = False
+    formatter.color_manager = None
+    record = logging.LogRecord("test", logging.WARNING, __file__, 1, "plain", None, None)
+    assert formatter.format(record) == "WARN  plain"
+
+
+def test_colorize_level_and_message_matches_separate_calls():
+    """The combined helper gives the same result as colorize_level/colorize_message"""
+    manager = ColorManager()
+    for level in (logging.DEBUG, logging.WARNING, 25):
+        expected = (manager.colorize_level("LEVEL", level), manager.colorize_message("text", level))
+        assert manager.colorize_level_and_message("LEVEL", "text", level) == expected
+
+
+def test_formatter_reuses_time_within_second():
+    """strftime() is called once for records created in the same second"""
+    formatter = ColoredFormatter(fmt="%(asctime)s %(message)s", use_color=False)
+    first = logging.LogRecord("test", logging.INFO, __file__, 1, "a", None, None)
+    second = logging.LogRecord("test", logging.INFO, __file__, 1, "b", None, None)
+    second.created, second.msecs = int(first.created) + 0.5, 500.0
+    first.created, first.msecs = int(first.created) + 0.25, 250.0
+    _CachedTimeMixin._time_cache = (None, "")
+    with mock.patch("time.strftime", wraps=time.strftime) as strftime:
+        assert formatter.format(first).endswith(",250 a")
+        assert formatter.format(second).endswith(",500 b")
+    assert strftime.call_count == 1
+
+
+def test_formatters_share_time_and_do_not_leak_colors():
+    """A record sent to a colored and a plain formatter gets its time formatted once and no colors in the plain output"""
+    colored = ColoredFormatter(fmt="%(asctime)s %(levelname)s | %(filename)s | %(message)s", use_color=True)
+    plain = FastFormatter("%(asctime)s %(levelname)s | %(filename)s | %(message)s")
+    record = logging.LogRecord("test", logging.WARNING, "/path/to/module.py", 1, "hello %s", ("world",), None)
+    _CachedTimeMixin._time_cache = (None, "")
+    with mock.patch("time.strftime", wraps=time.strftime) as strftime:
+        assert "\033[" in colored.format(record)
+        output = plain.format(record)
+    assert strftime.call_count == 1
+    assert "\033[" not in output
+    assert output.endswith(" WARNING | module.py | hello world")
+
+
+def test_display_levelname_is_shared():
+    """Adjusted level names are cached and shared between records"""
+    assert _display_levelname("WARNING", 5) == "WARN "
+    assert _display_levelname("CRITICAL", 5) == "CRITI"
+    assert _display_levelname("INFO", 5) is _display_levelname("INFO", 5)
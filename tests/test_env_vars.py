@@ -85,6 +85,41 @@ def test_logkiss_path_shorten():
         assert path_shorten == 0  # Default value
 
 
+@pytest.mark.env_vars
+def test_reconfigure_path_shortening():
+    """Test that reconfigure_path_shortening picks up LOGKISS_PATH_SHORTEN changes"""
+    from logkiss import logkiss as core
+
+    record = logging.makeLogRecord({"pathname": "/very/long/path/to/module.py", "filename": "module.py"})
+    try:
+        with mock.patch.dict(os.environ, {"LOGKISS_PATH_SHORTEN": "2"}):
+            core.reconfigure_path_shortening()
+            assert core.PATH_SHORTEN == 2
+            core.PathShortenerFilter().filter(record)
+            assert record.filename == ".../to/module.py"
+    finally:
+        core.reconfigure_path_shortening()
+
+
+@pytest.mark.env_vars
+def test_logkiss_fast_records():
+    """Test for LOGKISS_FAST_RECORDS environment variable"""
+    import subprocess
+    import sys
+
+    code = "import logging, logkiss; print(logging.logProcesses, logging.logMultiprocessing, logging.logThreads)"
+    env = {k: v for k, v in os.environ.items() if k != "LOGKISS_FAST_RECORDS"}
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parent.parent)
+
+    # Importing logkiss does not change the process-wide logging settings by default
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["True", "True", "True"]
+
+    env["LOGKISS_FAST_RECORDS"] = "1"
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["False", "False", "False"]
+
+
 @pytest.mark.env_vars
 def test_logkiss_skip_config():
     """Test for LOGKISS_SKIP_CONFIG environment variable"""
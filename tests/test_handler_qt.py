@@ -0,0 +1,83 @@
+"""Tests for logkiss.handler_qt.QtTextEditHandler (skipped when no Qt binding is installed).
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+See LICENSE for details.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from logkiss import handler_qt
+
+if not handler_qt.QT_AVAILABLE:
+    pytest.skip("PyQt5, PySide2, or PySide6 is required", allow_module_level=True)
+
+# ディスプレイのない環境でも動くようにする
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QApplication = None
+for _binding in ("PyQt5", "PySide2", "PySide6"):
+    try:
+        QApplication = __import__(_binding + ".QtWidgets", fromlist=["QApplication"]).QApplication
+        break
+    except ImportError:
+        continue
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def text_edit(app):
+    widget = handler_qt.QPlainTextEdit()
+    yield widget
+    widget.deleteLater()
+
+
+def _record(msg, level=logging.INFO):
+    return logging.LogRecord("qt", level, __file__, 1, msg, None, None)
+
+
+def test_writes_immediately_by_default(text_edit):
+    """既定（flush_interval=0）ではタイマーを作らず、レコードをすぐに書き込む"""
+    handler = handler_qt.QtTextEditHandler(text_edit, formatter=logging.Formatter("%(message)s"))
+    assert handler._timer is None
+    handler.handle(_record("hello"))
+    assert text_edit.toPlainText() == "hello"
+    handler.close()
+
+
+def test_timer_writes_records_from_other_threads(app, text_edit):
+    """flush_interval > 0 では他のスレッドのレコードをウィジェットのタイマーがまとめて書き込む"""
+    handler = handler_qt.QtTextEditHandler(text_edit, formatter=logging.Formatter("%(message)s"), flush_interval=10)
+    try:
+        assert handler._timer.parent() is text_edit
+        thread = threading.Thread(target=lambda: [handler.handle(_record("line %d" % i)) for i in range(3)])
+        thread.start()
+        thread.join()
+        assert text_edit.toPlainText() == ""
+
+        deadline = time.monotonic() + 2.0
+        while text_edit.toPlainText() == "" and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        assert text_edit.toPlainText().splitlines() == ["line 0", "line 1", "line 2"]
+    finally:
+        handler.close()
+
+
+def test_close_writes_pending_records(text_edit):
+    """close()でタイマーを止め、残りのレコードを書き込む"""
+    handler = handler_qt.QtTextEditHandler(text_edit, formatter=logging.Formatter("%(message)s"), flush_interval=1000)
+    handler.handle(_record("pending", logging.WARNING))
+    assert text_edit.toPlainText() == ""
+    handler.close()
+    assert not handler._timer.isActive()
+    assert text_edit.toPlainText() == "pending"
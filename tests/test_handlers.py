@@ -11,6 +11,7 @@ The following handlers are tested:
 - AWSCloudWatchHandler: AWS CloudWatch handler
 """
 
+import os
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -138,6 +139,21 @@ class TestGCloudLoggingHandler:
         except Exception as e:
             assert False, f"Emit関数の呼び出しに失敗しました: {e}"
 
+    def test_batching_transport_options(self, mock_google_client):
+        """batch_size/max_latencyがバックグラウンドトランスポートに渡されることを確認"""
+        transports = MagicMock()
+        with patch.dict("sys.modules", {"google.cloud.logging_v2.handlers.transports": transports}):
+            GCloudLoggingHandler(project_id="test-project", batch_size=100, max_latency=0.2)
+
+        cloud_handler_class = sys.modules["google.cloud.logging_v2.handlers"].CloudLoggingHandler
+        transport = cloud_handler_class.call_args[1]["transport"]
+        assert transport.func is transports.BackgroundThreadTransport
+        assert transport.keywords == {"batch_size": 100, "max_latency": 0.2}
+
+        # 指定しない場合はライブラリの既定のトランスポートを使う
+        GCloudLoggingHandler(project_id="test-project")
+        assert "transport" not in cloud_handler_class.call_args[1]
+
 
 @pytest.mark.aws
 class TestAWSCloudWatchHandler:
@@ -227,3 +243,328 @@ class TestAWSCloudWatchHandler:
 
     #         # 明示的にExecutorをシャットダウン
     #         handler._executor.shutdown(wait=True)
+
+
+def test_enable_async_logging():
+    """enable_async_loggingでKissConsoleHandlerがバックグラウンドスレッドに移ることを確認"""
+    import io
+    from logging.handlers import QueueHandler
+
+    from logkiss import KissConsoleHandler, enable_async_logging
+
+    logger = std_logging.getLogger("test_enable_async_logging")
+    logger.propagate = False
+    logger.setLevel(std_logging.INFO)
+    stream = io.StringIO()
+    logger.addHandler(KissConsoleHandler(stream=stream))
+
+    listeners = enable_async_logging(logger)
+    try:
+        assert len(listeners) == 1
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], QueueHandler)
+
+        logger.info("queued message")
+        logger.error("error message")
+    finally:
+        for listener in listeners:
+            listener.stop()
+        logger.handlers.clear()
+
+    output = stream.getvalue()
+    assert "queued message" in output
+    assert "error message" in output
+
+
+def test_buffered_kiss_file_handler(tmp_path):
+    """BufferedKissFileHandlerがバッファリングし、ERROR以上で即座に書き込むことを確認"""
+    from logkiss import BufferedKissFileHandler
+
+    log_file = tmp_path / "buffered.log"
+    handler = BufferedKissFileHandler(log_file, flush_interval=0)
+    handler.setFormatter(std_logging.Formatter("%(levelname)s %(message)s"))
+    logger = std_logging.getLogger("test_buffered_kiss_file_handler")
+    logger.propagate = False
+    logger.setLevel(std_logging.INFO)
+    logger.addHandler(handler)
+    try:
+        logger.info("buffered message")
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        logger.error("error message")
+        assert log_file.read_text(encoding="utf-8") == "INFO buffered message\nERROR error message\n"
+
+        logger.info("written on close")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert log_file.read_text(encoding="utf-8").endswith("INFO written on close\n")
+
+
+def test_kiss_console_handler_single_write():
+    """KissConsoleHandlerがメッセージと改行を1回のwrite()で出力することを確認"""
+    import io
+
+    from logkiss import KissConsoleHandler
+
+    stream = io.StringIO()
+    handler = KissConsoleHandler(stream=stream)
+    record = std_logging.LogRecord("single_write", std_logging.INFO, __file__, 1, "one write", None, None)
+    with patch.object(stream, "write", wraps=stream.write) as write:
+        handler.handle(record)
+    assert write.call_count == 1
+    assert stream.getvalue().endswith("one write\n")
+
+
+def test_kiss_console_handler_defers_flush_when_buffered(monkeypatch, tmp_path):
+    """LOGKISS_CONSOLE_BUFFERED=1 の場合、リダイレクトされた出力をレコードごとにflushしないことを確認"""
+    import io
+
+    from logkiss import KissConsoleHandler
+
+    # バッファ付きのテキスト層（リダイレクトされたsys.stdoutと同じ構成）
+    log_file = tmp_path / "stdout.log"
+    stream = io.TextIOWrapper(open(log_file, "wb"), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setenv("LOGKISS_CONSOLE_BUFFERED", "1")
+
+    handler = KissConsoleHandler(stream=sys.stdout)
+    info = std_logging.LogRecord("deferred", std_logging.INFO, __file__, 1, "info message", None, None)
+    error = std_logging.LogRecord("deferred", std_logging.ERROR, __file__, 2, "error message", None, None)
+    try:
+        handler.handle(info)
+        assert log_file.read_bytes() == b""
+
+        handler.handle(error)
+        output = log_file.read_text(encoding="utf-8")
+        assert output.index("info message") < output.index("error message")
+    finally:
+        handler.close()
+        stream.close()
+
+
+def _run_piped(code, **env):
+    """標準エラー出力をパイプにリダイレクトしてコードを実行し、その出力を返す"""
+    import subprocess
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), LOGKISS_DISABLE_COLOR="1", **env)
+    result = subprocess.run([sys.executable, "-c", code], stderr=subprocess.PIPE, env=env)
+    return result.stderr.decode("utf-8")
+
+
+@pytest.mark.parametrize("buffered", ["", "1"])
+def test_kiss_console_handler_keeps_order_with_stderr_writes(buffered):
+    """リダイレクトされた標準エラー出力で、ログとprint()・トレースバックの順序が保たれることを確認"""
+    code = (
+        "import sys, logkiss\n"
+        "logger = logkiss.getLogger('ordered')\n"
+        "logger.warning('first warning')\n"
+        "print('printed line', file=sys.stderr)\n"
+        "logger.warning('second warning')\n"
+        "raise SystemError('boom')\n"
+    )
+    output = _run_piped(code, LOGKISS_CONSOLE_BUFFERED=buffered)
+    positions = [output.index(text) for text in ("first warning", "printed line", "second warning", "Traceback")]
+    assert positions == sorted(positions)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+@pytest.mark.parametrize("buffered", ["", "1"])
+def test_kiss_console_handler_output_of_forked_children(buffered):
+    """multiprocessingのforkで起動した子プロセスのログが失われないことを確認"""
+    code = (
+        "import multiprocessing, logkiss\n"
+        "def work(i):\n"
+        "    logkiss.getLogger('child').warning('child %d done', i)\n"
+        "if __name__ == '__main__':\n"
+        "    ctx = multiprocessing.get_context('fork')\n"
+        "    processes = [ctx.Process(target=work, args=(i,)) for i in range(3)]\n"
+        "    for p in processes: p.start()\n"
+        "    for p in processes: p.join()\n"
+    )
+    output = _run_piped(code, LOGKISS_CONSOLE_BUFFERED=buffered)
+    for i in range(3):
+        assert "child %d done" % i in output
+
+
+def test_clear_handlers():
+    """clear_handlersがすべてのハンドラーを削除して閉じることを確認"""
+    from logkiss import clear_handlers
+
+    logger = std_logging.getLogger("test_clear_handlers")
+    handlers = [MagicMock(spec=std_logging.Handler) for _ in range(3)]
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    clear_handlers(logger)
+
+    assert logger.handlers == []
+    for handler in handlers:
+        handler.close.assert_called_once()
+
+
+def test_aws_cloudwatch_handler_batches_put_log_events():
+    """logkiss.handlers.AWSCloudWatchHandlerがレコードをまとめて送信することを確認"""
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    fake_boto3 = MagicMock()
+    client = fake_boto3.client.return_value
+    client.put_log_events.return_value = {"nextSequenceToken": "token"}
+    with patch.dict(sys.modules, {"boto3": fake_boto3}):
+        handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", batch_size=3, flush_interval=60.0)
+    try:
+        for i in range(2):
+            handler.handle(std_logging.LogRecord("aws", std_logging.INFO, __file__, i, f"message {i}", None, None))
+        # emit()はキューに追加するだけ
+        client.put_log_events.assert_not_called()
+    finally:
+        handler.close()
+
+    client.put_log_events.assert_called_once()
+    events = client.put_log_events.call_args[1]["logEvents"]
+    assert [event["message"] for event in events] == ["message 0", "message 1"]
+
+
+def test_aws_cloudwatch_handler_sends_chunks_concurrently():
+    """batch_sizeを超えるレコードが複数のPutLogEventsに分割されることを確認"""
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    fake_boto3 = MagicMock()
+    client = fake_boto3.client.return_value
+    with patch.dict(sys.modules, {"boto3": fake_boto3}):
+        handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", batch_size=2, flush_interval=60.0, max_concurrent_requests=3)
+    # フラッシュスレッドを止めて、close()でまとめて送信させる
+    handler._running = False
+    for i in range(5):
+        handler._batch.append({"timestamp": i, "message": f"message {i}"})
+    handler.close()
+
+    assert client.put_log_events.call_count == 3
+    sent = sorted(event["message"] for call in client.put_log_events.call_args_list for event in call[1]["logEvents"])
+    assert sent == [f"message {i}" for i in range(5)]
+    for call in client.put_log_events.call_args_list:
+        assert "sequenceToken" not in call[1]
+
+
+def test_aws_cloudwatch_handler_flush_waits_for_send():
+    """flush()がキューのレコードを送信してから戻り、送信中のバッチがあれば待つことを確認"""
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    client = MagicMock()
+    handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", flush_interval=60.0, client=client)
+    try:
+        handler.handle(std_logging.LogRecord("aws", std_logging.INFO, __file__, 1, "message", None, None))
+
+        # フラッシュスレッドが送信中の間はタイムアウトする
+        with handler._send_lock:
+            assert handler.flush(timeout=0.01) is False
+        client.put_log_events.assert_not_called()
+
+        assert handler.flush() is True
+        client.put_log_events.assert_called_once()
+        assert not handler._batch
+    finally:
+        handler.close()
+
+
+def test_aws_cloudwatch_handler_flush_reports_failed_send():
+    """送信に失敗したエントリはキューに戻り、flush()がFalseを返すことを確認"""
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    client = MagicMock()
+    client.put_log_events.side_effect = RuntimeError("unavailable")
+    handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", flush_interval=60.0, client=client)
+    try:
+        handler.handle(std_logging.LogRecord("aws", std_logging.INFO, __file__, 1, "message", None, None))
+        with patch("builtins.print"):
+            assert handler.flush() is False
+        assert [entry["message"] for entry in handler._batch] == ["message"]
+
+        client.put_log_events.side_effect = None
+        assert handler.flush() is True
+        assert not handler._batch
+    finally:
+        handler.close()
+
+
+def test_aws_cloudwatch_handler_waits_after_failed_send():
+    """送信に失敗した後、バッチサイズに達していてもflush_intervalだけ待ってから再送することを確認"""
+    import time
+
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    client = MagicMock()
+    client.put_log_events.side_effect = RuntimeError("unavailable")
+    with patch("builtins.print"):
+        handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", batch_size=2, flush_interval=0.2, max_concurrent_requests=1, client=client)
+        try:
+            for i in range(2):
+                handler.handle(std_logging.LogRecord("aws", std_logging.INFO, __file__, i, f"message {i}", None, None))
+            time.sleep(0.5)
+            # 失敗のたびに待つので、0.5秒間の送信は数回に収まる
+            assert 1 <= client.put_log_events.call_count <= 4
+        finally:
+            handler._running = False
+            handler.close()
+
+
+def test_aws_cloudwatch_handler_uses_given_client():
+    """client引数で渡したクライアントをそのまま使うことを確認（boto3は不要）"""
+    from logkiss.handlers import AWSCloudWatchHandler as BatchingAWSCloudWatchHandler
+
+    client = MagicMock()
+    with patch.dict(sys.modules, {"boto3": None}):
+        handler = BatchingAWSCloudWatchHandler("test-group", "test-stream", client=client)
+    try:
+        assert handler.client is client
+        client.create_log_stream.assert_called_once_with(logGroupName="test-group", logStreamName="test-stream")
+    finally:
+        handler.close()
+
+
+def test_buffered_kiss_file_handler_handle_batch(tmp_path):
+    """BufferedKissFileHandler.handle_batchがまとめて1回で書き込むことを確認"""
+    from logkiss import BufferedKissFileHandler
+
+    handler = BufferedKissFileHandler(tmp_path / "batch.log", flush_interval=0)
+    handler.setFormatter(std_logging.Formatter("%(levelname)s %(message)s"))
+    records = [std_logging.LogRecord("batch", std_logging.ERROR, __file__, i, f"error {i}", None, None) for i in range(3)]
+    try:
+        with patch.object(handler.stream, "write", wraps=handler.stream.write) as write:
+            handler.handle_batch(records)
+        assert write.call_count == 1
+    finally:
+        handler.close()
+    assert (tmp_path / "batch.log").read_text(encoding="utf-8") == "ERROR error 0\nERROR error 1\nERROR error 2\n"
+
+
+def test_json_dumps_with_and_without_orjson():
+    """_json_dumpsがorjsonの有無にかかわらず同じJSONを返すことを確認"""
+    import json
+
+    from logkiss import handlers
+
+    payload = {"message": "メッセージ", "extra": {"user_id": 12345, "attempts": [1, 2, 3], "ratio": 0.5, "ok": True, "none": None}}
+    with patch.object(handlers, "orjson", None):
+        fallback = handlers._json_dumps(payload)
+    assert json.loads(fallback) == payload
+    # 区切り文字に空白を入れず、非ASCII文字もエスケープしない（orjsonと同じ出力）
+    assert fallback.startswith('{"message":"メッセージ","extra":{"user_id":12345,')
+    if handlers.orjson is not None:
+        assert handlers._json_dumps(payload) == fallback
+
+
+def test_json_dumps_falls_back_to_str():
+    """JSONにできない値はorjsonの有無にかかわらずstr()で出力されることを確認"""
+    import datetime
+    from pathlib import PurePosixPath
+
+    from logkiss import handlers
+
+    payload = {"when": datetime.date(2025, 1, 2), "path": PurePosixPath("/tmp/x")}
+    with patch.object(handlers, "orjson", None):
+        fallback = handlers._json_dumps(payload)
+    assert fallback == '{"when":"2025-01-02","path":"/tmp/x"}'
+    if handlers.orjson is not None:
+        assert handlers._json_dumps(payload) == fallback
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Test cases for logkiss.lint.
+
+Copyright (c) 2025 Taka Suzuki
+SPDX-License-Identifier: MIT
+See LICENSE for details.
+"""
+
+import pytest
+
+from logkiss.lint import lint_fstring_calls
+
+
+def test_lint_fstring_calls(tmp_path):
+    """Only logging calls with an f-string message are reported"""
+    source = tmp_path / "module.py"
+    source.write_text(
+        "import logging\n"
+        "logger = logging.getLogger(__name__)\n"
+        "value = 1\n"
+        'logger.debug(f"value: {value}")\n'
+        'logger.info("value: %s", value)\n'
+        'print(f"value: {value}")\n',
+        encoding="utf-8",
+    )
+    with pytest.warns(UserWarning, match="module.py:4"):
+        results = lint_fstring_calls(tmp_path)
+    assert results == [(str(source), 4, "debug")]
@@ -5,8 +5,15 @@ SPDX-License-Identifier: MIT
 See LICENSE for details.
 """
 
+import io
+import logging
+import sys
+import types
 import unittest
+from unittest import mock
+
 from logkiss import getLogger
+from logkiss.logkiss import KissConsoleHandler, KissLogger
 
 
 class TestKissLog(unittest.TestCase):
@@ -18,6 +25,157 @@ class TestKissLog(unittest.TestCase):
         self.assertIsNotNone(log)
         self.assertEqual(log.name, self.logger_name)
 
+    def test_get_logger_returns_cached_instance(self):
+        """getLogger() reuses the logger held by the manager instead of creating one per call"""
+        self.assertIs(getLogger(self.logger_name), getLogger(self.logger_name))
+
+
+class TestKissConsoleHandlerFormatter(unittest.TestCase):
+    def test_formatter_is_created_on_first_use(self):
+        """The default ColoredFormatter is not built until the handler needs it"""
+        # 他のテストでモジュールが再読み込みされていてもよいように、実行時にクラスを取得する
+        core = sys.modules["logkiss.logkiss"]
+        with mock.patch.object(core, "ColoredFormatter", wraps=core.ColoredFormatter) as factory:
+            handler = core.KissConsoleHandler(stream=io.StringIO())
+            factory.assert_not_called()
+            self.assertIsNotNone(handler.formatter)
+            self.assertIs(handler.formatter, handler.formatter)
+            factory.assert_called_once_with(color_config=None, use_color=False)
+
+    def test_set_formatter_replaces_default(self):
+        stream = io.StringIO()
+        handler = KissConsoleHandler(stream=stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.handle(logging.LogRecord("x", logging.INFO, __file__, 1, "hello", None, None))
+        self.assertEqual(stream.getvalue(), "hello\n")
+
+
+class TestKissLoggerBatching(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = KissConsoleHandler(stream=self.stream)
+        self.logger = KissLogger("test_batching")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.handler)
+
+    def test_batching_writes_once(self):
+        with mock.patch.object(self.stream, "write", wraps=self.stream.write) as write:
+            with self.logger.batching():
+                self.logger.info("first")
+                self.logger.info("second")
+                self.assertEqual(write.call_count, 0)
+            self.assertEqual(write.call_count, 1)
+        output = self.stream.getvalue()
+        self.assertLess(output.index("first"), output.index("second"))
+
+    def test_log_batch_skips_disabled_level(self):
+        self.logger.setLevel(logging.WARNING)
+        self.logger.log_batch(logging.INFO, ["ignored"])
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_log_batch(self):
+        self.logger.log_batch(logging.WARNING, ["one", "two", "three"])
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[2].endswith("three"))
+
+    def test_log_batch_stacklevel(self):
+        def wrapper():
+            self.logger.log_batch(logging.WARNING, ["wrapped"], stacklevel=2)
+
+        with mock.patch.object(self.logger, "handle") as handle:
+            wrapper()
+            expected_lineno = sys._getframe().f_lineno - 1
+        record = handle.call_args[0][0]
+        self.assertEqual(record.lineno, expected_lineno)
+        self.assertEqual(record.funcName, "test_log_batch_stacklevel")
+
+
+class TestKissLoggerHandlerRegistry(unittest.TestCase):
+    def test_console_handlers_follow_add_and_remove(self):
+        logger = KissLogger("test_registry")
+        console = KissConsoleHandler(stream=io.StringIO())
+        other = logging.StreamHandler(io.StringIO())
+        logger.addHandler(console)
+        logger.addHandler(other)
+        self.assertEqual(logger.console_handlers, (console,))
+        self.assertEqual(logger.file_handlers, ())
+        logger.removeHandler(console)
+        self.assertEqual(logger.console_handlers, ())
+
+    def test_console_handlers_follow_direct_list_changes(self):
+        """handlers を直接変更しても use_console_handler が KissConsoleHandler を取り除く"""
+        # 他のテストでモジュールが再読み込みされていてもよいように、実行時にクラスを取得する
+        core = sys.modules["logkiss.logkiss"]
+        logger = core.KissLogger("test_registry_direct")
+        console = core.KissConsoleHandler(stream=io.StringIO())
+        logger.handlers[:] = [console]
+        self.assertEqual(logger.console_handlers, (console,))
+        core.use_console_handler(logger)
+        self.assertEqual([type(h).__name__ for h in logger.handlers], ["StreamHandler"])
+
+
+class TestKissLoggerIsEnabledFor(unittest.TestCase):
+    def setUp(self):
+        self.parent = KissLogger("test_enabled")
+        self.logger = KissLogger("test_enabled.child")
+        self.logger.parent = self.parent
+        self.logger.setLevel(logging.NOTSET)
+        self.manager = self.logger.manager
+
+    def tearDown(self):
+        # logging.disable(logging.NOTSET) と同じ処理
+        self.manager.disable = logging.NOTSET
+        self.manager._clear_cache()
+
+    def test_follows_parent_level(self):
+        self.parent.setLevel(logging.WARNING)
+        self.assertFalse(self.logger.isEnabledFor(logging.INFO))
+        self.parent.setLevel(logging.DEBUG)
+        self.assertTrue(self.logger.isEnabledFor(logging.INFO))
+
+    def test_follows_logging_disable(self):
+        self.parent.setLevel(logging.DEBUG)
+        self.assertTrue(self.logger.isEnabledFor(logging.ERROR))
+        # logging.disable(logging.ERROR) と同じ処理
+        self.manager.disable = logging.ERROR
+        self.manager._clear_cache()
+        self.assertFalse(self.logger.isEnabledFor(logging.ERROR))
+        self.assertTrue(self.logger.isEnabledFor(logging.CRITICAL))
+
+    def test_disabled_logger(self):
+        self.parent.setLevel(logging.DEBUG)
+        self.logger.disabled = True
+        self.assertFalse(self.logger.isEnabledFor(logging.CRITICAL))
+
+    def test_manager_is_patched_only_when_kiss_logger_is_created(self):
+        """import logkiss alone does not wrap logging.Manager._clear_cache"""
+        import os
+        import subprocess
+
+        code = (
+            "import logging, logkiss\n"
+            "assert not hasattr(logging.Manager, '_logkiss_level_generation')\n"
+            "logger = logkiss.KissLogger('created')\n"
+            "logger.setLevel(logging.ERROR)\n"
+            "assert logging.Manager._clear_cache._logkiss_wrapped\n"
+            "assert not logger.isEnabledFor(logging.WARNING)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+class TestKissLoggerMakeRecord(unittest.TestCase):
+    def test_shared_read_only_extra(self):
+        """A frozen extra can be passed on every call to set the caller location"""
+        logger = KissLogger("test_make_record")
+        extra = types.MappingProxyType({"_filename": "pinned.py", "_lineno": 7})
+        first = logger.makeRecord(logger.name, logging.INFO, "real.py", 1, "a", (), None, extra=extra)
+        second = logger.makeRecord(logger.name, logging.INFO, "real.py", 2, "b", (), None, extra=extra)
+        self.assertEqual((first.filename, first.lineno), ("pinned.py", 7))
+        self.assertEqual((second.filename, second.lineno), ("pinned.py", 7))
+        self.assertEqual(dict(extra), {"_filename": "pinned.py", "_lineno": 7})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -108,5 +108,81 @@ def test_method_signatures_compatibility():
                 assert param in logkiss_params, f"{method_name}の必須パラメータ{param}が一致しません"
 
 
+def test_reload_keeps_default_root_handler():
+    """再読み込みしてもルートの既定ハンドラーを作り直さないことをテストします"""
+    import importlib
+
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    try:
+        # 他のテストがsys.modulesから削除している場合があるため改めてインポートする
+        module = importlib.reload(importlib.import_module("logkiss"))
+        handlers = root.handlers[:]
+        importlib.reload(module)
+        assert root.handlers == handlers
+
+        # ルートのハンドラーが変更されていれば置き換える
+        root.addHandler(logging.NullHandler())
+        importlib.reload(module)
+        assert len(root.handlers) == 1
+        assert root.handlers[0] is not handlers[0]
+    finally:
+        root.handlers[:] = saved
+
+
+def test_module_level_functions_skip_disabled_levels():
+    """無効なレベルではモジュールレベルの関数がLogRecordを作らずに戻ることをテストします"""
+    from unittest import mock
+
+    root = logging.getLogger()
+    saved = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        with mock.patch.object(root, "makeRecord", wraps=root.makeRecord) as make_record:
+            logkiss.debug("debug %s", "skipped")
+            logkiss.info("info %s", "skipped")
+            assert make_record.call_count == 0
+    finally:
+        root.setLevel(saved)
+
+
+def test_root_filter_skips_records_of_loggers_with_handlers():
+    """ハンドラーを持つサブロガーのレコードだけをルートで出力しないことをテストします"""
+    from logkiss import _SkipIfLoggerHasHandlers
+
+    root_filter = _SkipIfLoggerHasHandlers()
+    owner = logging.getLogger("test_root_filter.owner")
+    handler = logging.NullHandler()
+    owner.addHandler(handler)
+    try:
+        def make(name):
+            return logging.LogRecord(name, logging.INFO, __file__, 1, "msg", None, None)
+
+        assert root_filter.filter(make("test_root_filter.owner")) is False
+        assert root_filter.filter(make("root")) is True
+        # 未登録の名前でロガーを作らない
+        assert root_filter.filter(make("test_root_filter.unknown")) is True
+        assert "test_root_filter.unknown" not in logging.Logger.manager.loggerDict
+        owner.removeHandler(handler)
+        assert root_filter.filter(make("test_root_filter.owner")) is True
+    finally:
+        owner.removeHandler(handler)
+
+
+def test_deprecation_warnings_are_emitted_once(monkeypatch):
+    """init_logging / use_console_handler の非推奨警告はプロセスごとに1回だけ出ることをテストします"""
+    monkeypatch.setattr(logkiss, "_warned_init_logging", False)
+    monkeypatch.setattr(logkiss, "_warned_use_console_handler", False)
+    logger = logging.getLogger("test_deprecation_once")
+    try:
+        with pytest.warns(DeprecationWarning) as record:
+            for _ in range(3):
+                logkiss.init_logging()
+                logkiss.use_console_handler(logger)
+        assert len(record) == 2
+    finally:
+        logkiss.clear_handlers(logger)
+
+
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])